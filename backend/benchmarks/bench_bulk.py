@@ -0,0 +1,77 @@
+"""
+Compare write throughput of the single-item handlers against /bulk.
+
+Request bodies are benchmarks.datagen documents (`make_payload`).
+
+Usage (from backend/, with a local mongod running):
+    python -m benchmarks.bench_bulk --count 5000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from datetime import datetime
+
+from benchmarks import datagen  # imports benchmarks.common, which points DB_NAME at the benchmark database
+
+import server
+from bulk import MAX_BULK_ITEMS, BulkRequest
+from routers import core
+
+
+def payloads(name: str):
+    """Request bodies for `name`; the same seed for both runs, so they write the same rows"""
+    rng, now = random.Random(f"bulk:{name}"), datetime.utcnow()
+    return lambda i: datagen.make_payload(name, rng, i, now)
+
+
+async def time_single(count: int, make_payload, model, handler) -> float:
+    start = time.perf_counter()
+    for i in range(count):
+        await handler(model(**make_payload(i)))
+    return time.perf_counter() - start
+
+
+async def time_bulk(count: int, make_payload, handler) -> float:
+    start = time.perf_counter()
+    for offset in range(0, count, MAX_BULK_ITEMS):
+        batch = [make_payload(i) for i in range(offset, min(offset + MAX_BULK_ITEMS, count))]
+        await handler(BulkRequest(create=batch))
+    return time.perf_counter() - start
+
+
+async def main(count: int):
+    db = server.get_db()
+    business = server.features.include("business")
+    endpoints = {(route.path, method): route.endpoint for route in server.app.routes for method in route.methods}
+    cases = [
+        ("tasks", core.Task, endpoints["/api/tasks", "POST"],
+         endpoints["/api/tasks/bulk", "POST"]),
+        ("performance", business.ContentPerformance, endpoints["/api/performance", "POST"],
+         endpoints["/api/performance/bulk", "POST"]),
+    ]
+
+    results = []
+    for name, model, single_handler, bulk_handler in cases:
+        await db.client.drop_database(db.name)
+        single = await time_single(count, payloads(name), model, single_handler)
+        await db.client.drop_database(db.name)
+        bulk = await time_bulk(count, payloads(name), bulk_handler)
+        results.append({
+            "collection": name,
+            "documents": count,
+            "single_rows_per_sec": round(count / single, 1),
+            "bulk_rows_per_sec": round(count / bulk, 1),
+            "speedup": round(single / bulk, 2),
+        })
+    await db.client.drop_database(db.name)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.count))
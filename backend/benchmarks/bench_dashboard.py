@@ -0,0 +1,40 @@
+"""
+Benchmark /api/dashboard/stats at increasing data set sizes.
+
+Each scale seeds the benchmark database with benchmarks.datagen, `scale`
+documents in every collection, and builds the app's indexes before timing.
+
+Usage (from backend/, with a local mongod running):
+    python -m benchmarks.bench_dashboard --scales 10000 100000 --runs 200
+"""
+
+import argparse
+import asyncio
+import json
+
+from benchmarks import datagen
+from benchmarks.common import time_async
+
+import server
+from indexes import ensure_indexes
+from routers.core import get_dashboard_stats
+
+
+async def main(scales, runs):
+    db = server.get_db()
+    results = []
+    for scale in scales:
+        documents = await datagen.seed(db, scale, weights=datagen.UNIFORM_WEIGHTS)
+        await ensure_indexes(db)
+        stats = await time_async(get_dashboard_stats, runs)
+        results.append({"endpoint": "/api/dashboard/stats", "scale": scale, "documents": documents, **stats})
+    await db.client.drop_database(db.name)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.scales, args.runs))
@@ -0,0 +1,110 @@
+"""
+Drain a burst of due posts through the scheduler and the rate-limited publisher pool.
+
+Platforms get different limits (`--limits`, the PUBLISH_RATE_LIMITS format)
+and a share of publishes fail and are retried with the pool's production
+backoff, so a slow or throttled platform has every chance to hold the
+others up. For each platform the report compares the time its last post
+went out with the floor its token bucket allows, (posts - burst) / rate,
+and its achieved rate with the limit.
+
+Usage (from backend/, with a local mongod running):
+    python -m benchmarks.bench_publish --posts 300 --failure-rate 0.1
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+
+import benchmarks.common  # noqa: F401  (points DB_NAME at the benchmark database)
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from dispatch import with_dispatch_fields
+from indexes import ensure_indexes
+from publishers import FakePublisher, PublisherPool, load_rate_limits
+from scheduler import PostScheduler
+
+PLATFORMS = ("instagram", "facebook", "youtube")
+DEFAULT_LIMITS = {
+    "instagram": {"rate": 2, "burst": 5, "workers": 2},
+    "facebook": {"rate": 10, "burst": 10, "workers": 4},
+    "youtube": {"rate": 5, "burst": 5, "workers": 2},
+}
+
+
+async def main(args):
+    client = AsyncIOMotorClient(os.environ["MONGO_URL"])
+    db = client[os.environ["DB_NAME"]]
+    await client.drop_database(db.name)
+    await ensure_indexes(db)
+
+    due = datetime.utcnow() - timedelta(minutes=1)
+    await db.scheduled_posts.insert_many([
+        with_dispatch_fields({
+            "topic": f"Burst post {i}",
+            "caption": "Benchmark",
+            "platform": PLATFORMS[i % len(PLATFORMS)],
+            "scheduled_date": due,
+            "scheduled_time": due.strftime("%H:%M"),
+            "priority": ("high", "medium", "low")[i % 3],
+            "status": "scheduled",
+        })
+        for i in range(args.posts)
+    ])
+
+    limits = load_rate_limits(args.limits)
+    publisher = FakePublisher(latency=args.latency, failure_rate=args.failure_rate, seed=1)
+    # Production retry settings (PublisherPool defaults) unless overridden
+    pool = PublisherPool({"*": publisher}, limits=limits, backoff_base=args.backoff)
+    start = time.perf_counter()
+    finished = {}
+
+    async def publish(post: dict):
+        result = await pool.publish(post)
+        finished[post["platform"]] = time.perf_counter() - start
+        return result
+
+    scheduler = PostScheduler(db, publish=publish, batch_size=args.batch_size, concurrency=args.concurrency)
+    counts = await scheduler.drain()
+    elapsed = time.perf_counter() - start
+
+    posted = Counter(post["platform"] for post in publisher.published)
+    platforms = {}
+    for platform in PLATFORMS:
+        limit = limits.get(platform) or limits["*"]
+        last = finished.get(platform, 0.0)
+        platforms[platform] = {
+            "posted": posted[platform],
+            "rate_limit": limit.rate,
+            "last_post_s": round(last, 2),
+            "expected_min_s": round(max(0.0, posted[platform] - limit.burst) / limit.rate, 2),
+            "achieved_rate": round(posted[platform] / last, 2) if last else None,
+        }
+    print(json.dumps({
+        "posts": args.posts,
+        "counts": counts,
+        "publish_attempts": publisher.attempts,
+        "elapsed_s": round(elapsed, 2),
+        "platforms": platforms,
+    }, indent=2))
+
+    await client.drop_database(db.name)
+    client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=300)
+    parser.add_argument("--limits", default=json.dumps(DEFAULT_LIMITS),
+                        help="per-platform limits, in the PUBLISH_RATE_LIMITS format")
+    parser.add_argument("--latency", type=float, default=0.05, help="fake publish latency in seconds")
+    parser.add_argument("--failure-rate", type=float, default=0.1)
+    parser.add_argument("--backoff", type=float, default=2.0, help="retry backoff base (production: 2 s)")
+    parser.add_argument("--batch-size", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=20, help="scheduler publishes in flight")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,112 @@
+"""
+Time recurring-task generation over a large set of due templates.
+
+Compares the batched generator (insert_many + bulk_write per batch, with
+catch-up of missed occurrences) against the previous per-template loop
+(insert_one + update_one per template, one occurrence per run).
+
+Usage (from backend/, with a local mongod running):
+    python -m benchmarks.bench_recurring --templates 10000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+import benchmarks.common  # noqa: F401  (points DB_NAME at the benchmark database)
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from indexes import ensure_indexes
+from recurrence import generate_due_tasks
+
+RULES = [
+    ("daily", ""),
+    ("weekly", ""),
+    ("weekly", "Every Monday"),
+    ("weekly", "Mon, Thu"),
+    ("monthly", "1st of month"),
+    ("monthly", "Last day of month"),
+    ("monthly", "1st Monday of month"),
+]
+
+
+def make_template(i: int, now: datetime) -> dict:
+    frequency, detail = RULES[i % len(RULES)]
+    return {
+        "title": f"Recurring task {i}",
+        "description": "",
+        "priority": ("low", "medium", "high")[i % 3],
+        "category": "Benchmark",
+        "frequency": frequency,
+        "frequency_detail": detail,
+        "next_due_date": now - timedelta(days=random.randint(0, 60), hours=random.randint(0, 23)),
+        "is_active": True,
+        "created_date": now,
+    }
+
+
+async def legacy_generate(db, now: datetime) -> int:
+    """The pre-batching loop: two round trips per template and no catch-up"""
+    steps = {"daily": timedelta(days=1), "weekly": timedelta(weeks=1), "monthly": timedelta(days=30)}
+    count = 0
+    templates = await db.recurring_tasks.find({"is_active": True, "next_due_date": {"$lte": now}}).to_list(None)
+    for template in templates:
+        await db.tasks.insert_one({
+            "title": template["title"],
+            "status": "pending",
+            "due_date": template["next_due_date"],
+            "created_date": now,
+        })
+        await db.recurring_tasks.update_one(
+            {"_id": template["_id"]},
+            {"$set": {"next_due_date": template["next_due_date"] + steps[template["frequency"]],
+                      "last_generated_date": now}},
+        )
+        count += 1
+    return count
+
+
+async def seed(db, count: int, now: datetime):
+    await db.client.drop_database(db.name)
+    await ensure_indexes(db)
+    random.seed(7)
+    await db.recurring_tasks.insert_many([make_template(i, now) for i in range(count)])
+
+
+async def main(args):
+    client = AsyncIOMotorClient(os.environ["MONGO_URL"])
+    db = client[os.environ["DB_NAME"]]
+    now = datetime.utcnow()
+
+    await seed(db, args.templates, now)
+    start = time.perf_counter()
+    legacy_tasks = await legacy_generate(db, now)
+    legacy = time.perf_counter() - start
+
+    await seed(db, args.templates, now)
+    start = time.perf_counter()
+    counts = await generate_due_tasks(db, now, batch_size=args.batch_size)
+    batched = time.perf_counter() - start
+
+    print(json.dumps({
+        "templates": args.templates,
+        "legacy": {"tasks": legacy_tasks, "elapsed_s": round(legacy, 2),
+                   "templates_per_sec": round(args.templates / legacy, 1)},
+        "batched": {**counts, "elapsed_s": round(batched, 2),
+                    "templates_per_sec": round(args.templates / batched, 1)},
+    }, indent=2))
+
+    await client.drop_database(db.name)
+    client.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--templates", type=int, default=10000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,46 @@
+"""
+Benchmark Idea Bank search latency as the vault grows.
+
+Ideas come from benchmarks.datagen. Runs the in-process index only (no
+mongod needed):
+    python -m benchmarks.bench_search --sizes 1000 10000 100000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from datetime import datetime
+
+from benchmarks import datagen
+from benchmarks.common import time_async
+
+from bson import ObjectId
+from search import IdeaSearchIndex
+
+QUERIES = ["pharm", "drug interaction", "pharmacolgy", "exam revision", "bioavail", "vaccine course"]
+
+
+async def main(sizes, runs):
+    results = []
+    for size in sizes:
+        index = IdeaSearchIndex()
+        rng, now = random.Random(f"search:{size}"), datetime.utcnow()
+        for i in range(size):
+            index.add({"_id": ObjectId(), **datagen.make_idea(rng, i, now)})
+        queries = iter(QUERIES * runs * 2)
+
+        async def search_once():
+            index.search(next(queries), limit=20)
+
+        stats = await time_async(search_once, runs)
+        results.append({"benchmark": "idea_search", "ideas": size, **stats})
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--runs", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.runs))
@@ -0,0 +1,65 @@
+"""
+Compare response serialization throughput on realistic list payloads.
+
+legacy:  per-row `_id` rewrite + jsonable_encoder + stdlib json (JSONResponse)
+orjson:  ORJSONResponse straight from the MongoDB documents
+
+Rows come from benchmarks.datagen. No database needed:
+    python -m benchmarks.bench_serialization --rows 1000 --runs 50
+"""
+
+import argparse
+import json
+import random
+import time
+from datetime import datetime
+
+from benchmarks import datagen
+
+from bson import ObjectId
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from serialization import ORJSONResponse
+
+
+def legacy_render(docs):
+    docs = [{**doc, "_id": str(doc["_id"])} for doc in docs]
+    return JSONResponse({"items": jsonable_encoder(docs), "next_cursor": None}).body
+
+
+def orjson_render(docs):
+    return ORJSONResponse({"items": docs, "next_cursor": None}).body
+
+
+def measure(render, docs, runs: int) -> dict:
+    render(docs)  # warm up
+    start = time.perf_counter()
+    for _ in range(runs):
+        body = render(docs)
+    elapsed = (time.perf_counter() - start) / runs
+    return {"ms_per_response": round(elapsed * 1000, 3), "rows_per_sec": round(len(docs) / elapsed), "bytes": len(body)}
+
+
+def main(rows: int, runs: int):
+    now = datetime.utcnow()
+    results = {}
+    for name in ("tasks", "revenue", "performance"):
+        rng, make = random.Random(f"serialization:{name}"), datagen.GENERATORS[name]
+        docs = [{"_id": ObjectId(), **make(rng, i, now)} for i in range(rows)]
+        legacy = measure(legacy_render, docs, runs)
+        fast = measure(orjson_render, docs, runs)
+        results[name] = {
+            "legacy": legacy,
+            "orjson": fast,
+            "speedup": round(legacy["ms_per_response"] / fast["ms_per_response"], 1),
+        }
+    print(json.dumps({"rows": rows, "runs": runs, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+    main(args.rows, args.runs)
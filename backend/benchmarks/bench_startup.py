@@ -0,0 +1,125 @@
+"""
+Cold start of an API worker: import time and time-to-first-request.
+
+Every run is a fresh interpreter (like a new autoscaled worker) that times
+    import_ms            `import server`
+    startup_ms           the app lifespan's startup (pool warm-up, indexes,
+                         the startup hooks of the features loaded up front)
+    first_request_ms     the first GET /api/dashboard/stats
+    ttfr_ms              time to first request: the three above together
+    first_<feature>_ms   the first request to each lazily loaded feature,
+                         which pays for importing it
+    process_ms           wall clock from spawning the interpreter to its
+                         first response, interpreter startup included
+Runs alternate between LAZY_ROUTERS=true and LAZY_ROUTERS=false so both
+modes see the same machine noise. The post scheduler and recurring
+generator stay off, as on API-only workers. Needs a local mongod:
+    python -m benchmarks.bench_startup --runs 10 --output before.json
+    python -m benchmarks.bench_startup --runs 10 --baseline before.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from benchmarks.common import BACKEND_DIR, summarize
+
+MODES = {"lazy": "true", "eager": "false"}
+
+# feature -> the request that loads it
+FEATURE_REQUESTS = {
+    "business": "/api/revenue/summary/monthly",
+    "social": "/api/social/scheduled-posts",
+}
+
+
+async def child() -> dict:
+    """One cold start, in this (fresh) process"""
+    start = time.perf_counter()
+    import server
+    imported = time.perf_counter()
+
+    import httpx
+
+    timings = {"import_ms": (imported - start) * 1000}
+    async with server.app.router.lifespan_context(server.app):
+        started = time.perf_counter()
+        timings["startup_ms"] = (started - imported) * 1000
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            response = await client.get("/api/dashboard/stats")
+            response.raise_for_status()
+            timings["first_request_ms"] = (time.perf_counter() - started) * 1000
+            timings["ttfr_ms"] = (time.perf_counter() - start) * 1000
+            timings["process_ms"] = (time.time() - float(os.environ["BENCH_SPAWNED_AT"])) * 1000
+            for feature, path in FEATURE_REQUESTS.items():
+                request_start = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                timings[f"first_{feature}_ms"] = (time.perf_counter() - request_start) * 1000
+    return timings
+
+
+def spawn(mode: str) -> dict:
+    env = {**os.environ, "LAZY_ROUTERS": MODES[mode], "SCHEDULER_ENABLED": "false",
+           "RECURRING_GENERATOR_ENABLED": "false", "CACHE_BACKEND": "off",
+           "BENCH_SPAWNED_AT": repr(time.time())}
+    output = subprocess.run([sys.executable, "-m", "benchmarks.bench_startup", "--child"],
+                            cwd=BACKEND_DIR, env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def compare(current: dict, baseline: dict) -> dict:
+    """Change of each mode's median timings, in percent"""
+    def change(now: float, before: float):
+        return round((now - before) / before * 100, 1) if before else None
+
+    result = {}
+    for mode, metrics in current["modes"].items():
+        before = baseline.get("modes", {}).get(mode, {})
+        result[mode] = {name: {"baseline": before[name]["p50_ms"], "current": stats["p50_ms"],
+                               "change_pct": change(stats["p50_ms"], before[name]["p50_ms"])}
+                        for name, stats in metrics.items() if name in before}
+    return result
+
+
+def run(runs: int) -> dict:
+    samples: Dict[str, Dict[str, List[float]]] = {mode: defaultdict(list) for mode in MODES}
+    for _ in range(runs):
+        for mode in MODES:
+            for name, value in spawn(mode).items():
+                samples[mode][name].append(value / 1000)
+    return {
+        "config": {"runs": runs, "python": sys.version.split()[0]},
+        "modes": {mode: {name: summarize(values) for name, values in metrics.items()}
+                  for mode, metrics in samples.items()},
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="cold starts per mode")
+    parser.add_argument("--output", help="also write the result to this file")
+    parser.add_argument("--baseline", help="earlier result to compare against")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(asyncio.run(child())))
+        sys.exit(0)
+
+    result = run(args.runs)
+    if args.baseline:
+        with open(args.baseline) as f:
+            result["comparison"] = compare(result, json.load(f))
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
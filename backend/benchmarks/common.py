@@ -0,0 +1,59 @@
+"""
+Shared helpers for the backend benchmarks.
+
+Benchmarks run against a local mongod (MONGO_URL, default
+mongodb://localhost:27017) in a throwaway database (BENCH_DB_NAME, default
+manpharma_bench) that is dropped before every run.
+"""
+
+import os
+import sys
+import time
+import statistics
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ["DB_NAME"] = os.environ.get("BENCH_DB_NAME", "manpharma_bench")
+
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize latency samples (seconds) as milliseconds"""
+    return {
+        "runs": len(samples),
+        "mean_ms": round(statistics.mean(samples) * 1000, 3) if samples else 0.0,
+        "p50_ms": round(percentile(samples, 50) * 1000, 3),
+        "p90_ms": round(percentile(samples, 90) * 1000, 3),
+        "p99_ms": round(percentile(samples, 99) * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3) if samples else 0.0,
+    }
+
+
+async def time_async(fn: Callable[[], Awaitable], runs: int, warmup: int = 3) -> Dict[str, float]:
+    for _ in range(warmup):
+        await fn()
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        await fn()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+async def insert_in_batches(collection, make_doc: Callable[[int], dict], count: int, batch_size: int = 5000):
+    for offset in range(0, count, batch_size):
+        batch = [make_doc(i) for i in range(offset, min(offset + batch_size, count))]
+        await collection.insert_many(batch, ordered=False)
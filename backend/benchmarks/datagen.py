@@ -0,0 +1,293 @@
+"""
+Synthetic data for every collection the app reads, at a configurable scale.
+
+Documents are shaped like the ones the API writes, derived fields included
+(engagement_rate, due_at / priority_rank), so benchmarks exercise the same
+indexes and code paths as production data. Generation is seeded, so two runs
+at the same scale produce the same data set.
+
+`--scale N` is the number of tasks; every other collection is sized from it
+by COLLECTION_WEIGHTS, or gets N documents too with `--uniform`
+(UNIFORM_WEIGHTS). Seed the benchmark database by hand with
+    python -m benchmarks.datagen --scale 10000
+
+Benchmarks that need documents without a database use the `make_*`
+factories directly (`GENERATORS`), and `make_payload` turns one into the
+create request body the API would receive.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+from datetime import datetime, timedelta
+from typing import Callable, Dict
+
+from benchmarks.common import insert_in_batches
+
+from dispatch import with_dispatch_fields
+from recurrence import with_anchor_day
+
+STAGE_NAMES = ["Idea", "Script", "PPT", "Recording", "Editing", "Upload"]
+SUBJECTS = ["Pharmacology", "Pharmaceutics", "Pharmacognosy", "Medicinal Chemistry", "Pharmacy Practice"]
+PLATFORMS = ["instagram", "facebook", "youtube"]
+WORDS = ("tablet capsule dosage bioavailability receptor agonist antagonist clearance "
+         "half-life formulation excipient stability gpat exam revision mcq lecture").split()
+# Idea text: the domain words plus a long Zipf-distributed tail, so search
+# posting lists have realistic lengths instead of every term matching every idea
+SEARCH_WORDS = ("pharmacology pharmacokinetics pharmacy drug interaction enzyme receptor dose toxicity "
+                "clinical trial exam revision reel youtube course chapter antibiotic analgesic vaccine "
+                "formulation tablet capsule injection bioavailability metabolism excretion absorption").split()
+SYLLABLES = ["ta", "ro", "mi", "ne", "ku", "la", "so", "vi", "de", "pha", "zo", "ter"]
+_vocab_rng = random.Random("vocabulary")
+IDEA_VOCAB = SEARCH_WORDS + ["".join(_vocab_rng.choices(SYLLABLES, k=4)) for _ in range(20_000)]
+IDEA_WEIGHTS = [1 / rank for rank in range(1, len(IDEA_VOCAB) + 1)]
+
+# Fields the server derives or stamps itself, left out of API payloads
+DERIVED_FIELDS = frozenset({"created_date", "updated_date", "engagement_rate", "due_at", "priority_rank",
+                            "recurring_task_id", "occurrence_date", "anchor_day", "last_generated_date"})
+
+# Documents per task
+COLLECTION_WEIGHTS = {
+    "tasks": 1.0,
+    "revenue": 1.0,
+    "performance": 1.0,
+    "ideas": 0.5,
+    "scheduled_posts": 0.5,
+    "posting_logs": 2.0,
+    "videos": 0.1,
+    "calendar": 0.3,
+    "study_notes": 0.1,
+    "recurring_tasks": 0.02,
+}
+# `scale` documents in every collection, for benchmarks quoted per collection size
+UNIFORM_WEIGHTS = dict.fromkeys(COLLECTION_WEIGHTS, 1.0)
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(count))
+
+
+def _idea_words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choices(IDEA_VOCAB, IDEA_WEIGHTS, k=count))
+
+
+def _days(rng: random.Random, now: datetime, before: int, after: int = 0) -> datetime:
+    return now + timedelta(days=rng.randint(-before, after), minutes=rng.randint(0, 1439))
+
+
+def make_task(rng: random.Random, i: int, now: datetime) -> dict:
+    created = _days(rng, now, 365)
+    return {
+        "title": f"Task {i}: {_words(rng, 3)}",
+        "description": _words(rng, 12),
+        "priority": rng.choice(["low", "medium", "high"]),
+        "status": rng.choice(["pending", "in_progress", "completed"]),
+        "due_date": _days(rng, now, 30, 30),
+        "category": rng.choice(["Content", "Study", "Business", ""]),
+        "created_date": created,
+        "updated_date": created,
+        "recurring_task_id": None,
+        "occurrence_date": None,
+    }
+
+
+def make_revenue(rng: random.Random, i: int, now: datetime) -> dict:
+    return {
+        "amount": round(rng.uniform(10, 5000), 2),
+        "source_category": rng.choice(["Course Sales", "Freelance", "Other"]),
+        "source_detail": f"Order {i}",
+        "platform": rng.choice(["Udemy", "YouTube", "Direct", ""]),
+        "payment_status": rng.choice(["Received", "Received", "Pending"]),
+        "payment_date": _days(rng, now, 3 * 365),
+        "description": "",
+        "created_date": _days(rng, now, 365),
+    }
+
+
+def make_performance(rng: random.Random, i: int, now: datetime) -> dict:
+    views = rng.randint(0, 200_000)
+    likes, comments, shares = views // rng.randint(10, 40), views // 200, views // 500
+    return {
+        "content_id": "",
+        "content_title": f"Reel {i}: {_words(rng, 3)}",
+        "content_type": rng.choice(["Video", "Post", "Story", "Course", "Reel"]),
+        "platform": rng.choice(["YouTube", "Instagram", "Facebook"]),
+        "views": views,
+        "likes": likes,
+        "comments": comments,
+        "shares": shares,
+        "reach": views + rng.randint(0, views + 1),
+        "engagement_rate": (likes + comments + shares) / views * 100 if views else 0,
+        "recorded_date": _days(rng, now, 2 * 365),
+        "created_date": _days(rng, now, 365),
+    }
+
+
+def make_idea(rng: random.Random, i: int, now: datetime) -> dict:
+    created = _days(rng, now, 365)
+    return {
+        "title": f"Idea {i}: {_idea_words(rng, 4)}",
+        "content": _idea_words(rng, 40),
+        "tags": rng.sample(WORDS, rng.randint(0, 4)),
+        "category": rng.choice(["Video", "Reel", "Course", ""]),
+        "links": [],
+        "priority": rng.choice(["low", "medium", "high"]),
+        "status": rng.choice(["idea", "researching", "ready", "used"]),
+        "created_date": created,
+        "updated_date": created,
+    }
+
+
+def make_scheduled_post(rng: random.Random, i: int, now: datetime) -> dict:
+    scheduled = _days(rng, now, 60, 60)
+    status = "scheduled" if scheduled > now else rng.choice(["posted", "posted", "failed", "cancelled"])
+    return with_dispatch_fields({
+        "topic": f"Post {i}: {_words(rng, 3)}",
+        "caption": _words(rng, 25),
+        "platform": rng.choice(PLATFORMS),
+        "media_url": "",
+        "hashtags": " ".join(f"#{word}" for word in rng.sample(WORDS, 3)),
+        "scheduled_date": scheduled.replace(hour=0, minute=0, second=0, microsecond=0),
+        "scheduled_time": f"{scheduled.hour:02d}:{scheduled.minute:02d}",
+        "priority": rng.choice(["low", "medium", "high"]),
+        "status": status,
+        "notes": "",
+        "sheet_row_id": None,
+        "created_date": _days(rng, now, 90),
+    })
+
+
+def make_posting_log(rng: random.Random, i: int, now: datetime) -> dict:
+    success = rng.random() < 0.9
+    return {
+        "post_id": f"{rng.getrandbits(96):024x}",
+        "platform": rng.choice(PLATFORMS),
+        "topic": f"Post {i}",
+        "posted_at": _days(rng, now, 365),
+        "status": "success" if success else "failed",
+        "platform_post_id": f"post_{i}" if success else None,
+        "error_message": None if success else "Rate limited",
+        "response_data": None,
+    }
+
+
+def make_video(rng: random.Random, i: int, now: datetime) -> dict:
+    done = rng.randint(0, len(STAGE_NAMES))
+    created = _days(rng, now, 365)
+    return {
+        "title": f"Video {i}: {_words(rng, 3)}",
+        "description": _words(rng, 10),
+        "stages": [{"name": name, "completed": n < done, "completed_date": now if n < done else None}
+                   for n, name in enumerate(STAGE_NAMES)],
+        "due_date": _days(rng, now, 30, 60),
+        "created_date": created,
+        "updated_date": created,
+    }
+
+
+def make_calendar_item(rng: random.Random, i: int, now: datetime) -> dict:
+    created = _days(rng, now, 365)
+    return {
+        "title": f"Post {i}",
+        "content_type": rng.choice(["Video", "Post", "Reel"]),
+        "scheduled_date": _days(rng, now, 60, 60),
+        "status": rng.choice(["draft", "scheduled", "posted"]),
+        "platform": rng.choice(PLATFORMS),
+        "description": "",
+        "created_date": created,
+        "updated_date": created,
+    }
+
+
+def make_study_note(rng: random.Random, i: int, now: datetime) -> dict:
+    created = _days(rng, now, 365)
+    return {
+        "title": f"Note {i}: {_words(rng, 3)}",
+        "subject": rng.choice(SUBJECTS),
+        "content": _words(rng, 80),
+        "progress_percentage": rng.randint(0, 100),
+        "created_date": created,
+        "updated_date": created,
+    }
+
+
+def make_recurring_task(rng: random.Random, i: int, now: datetime) -> dict:
+    frequency, detail = rng.choice([("daily", ""), ("weekly", "Every Monday"), ("monthly", "1st of month")])
+    return with_anchor_day({
+        "title": f"Recurring {i}: {_words(rng, 2)}",
+        "description": "",
+        "priority": rng.choice(["low", "medium", "high"]),
+        "category": "Content",
+        "frequency": frequency,
+        "frequency_detail": detail,
+        # Future due dates, so a benchmark run doesn't generate tasks behind its back
+        "next_due_date": _days(rng, now, 0, 30) + timedelta(days=1),
+        "last_generated_date": None,
+        "is_active": True,
+        "created_date": _days(rng, now, 365),
+    })
+
+
+GENERATORS: Dict[str, Callable[[random.Random, int, datetime], dict]] = {
+    "tasks": make_task,
+    "revenue": make_revenue,
+    "performance": make_performance,
+    "ideas": make_idea,
+    "scheduled_posts": make_scheduled_post,
+    "posting_logs": make_posting_log,
+    "videos": make_video,
+    "calendar": make_calendar_item,
+    "study_notes": make_study_note,
+    "recurring_tasks": make_recurring_task,
+}
+
+
+def make_payload(name: str, rng: random.Random, i: int, now: datetime) -> dict:
+    """A create request body for collection `name`: its generated document minus server-set fields"""
+    return {key: value for key, value in GENERATORS[name](rng, i, now).items() if key not in DERIVED_FIELDS}
+
+
+def collection_sizes(scale: int, weights: Dict[str, float] = COLLECTION_WEIGHTS) -> Dict[str, int]:
+    return {name: max(1, round(scale * weight)) for name, weight in weights.items()}
+
+
+async def seed(db, scale: int, seed: int = 42, now: datetime = None,
+               weights: Dict[str, float] = COLLECTION_WEIGHTS) -> Dict[str, int]:
+    """Drop the database and fill every collection; returns the document counts
+
+    The database is left without indexes; callers that time queries build
+    them with indexes.ensure_indexes.
+    """
+    now = now or datetime.utcnow().replace(microsecond=0)
+    sizes = collection_sizes(scale, weights)
+    await db.client.drop_database(db.name)
+
+    async def fill(name: str, count: int):
+        # One generator per collection, so its data doesn't depend on the others' sizes
+        rng = random.Random(f"{seed}:{name}")
+        await insert_in_batches(db[name], lambda i: GENERATORS[name](rng, i, now), count)
+
+    await asyncio.gather(*(fill(name, count) for name, count in sizes.items()))
+    return sizes
+
+
+if __name__ == "__main__":
+    import os
+
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--uniform", action="store_true", help="--scale documents in every collection")
+    args = parser.parse_args()
+
+    async def main():
+        client = AsyncIOMotorClient(os.environ["MONGO_URL"])
+        weights = UNIFORM_WEIGHTS if args.uniform else COLLECTION_WEIGHTS
+        sizes = await seed(client[os.environ["DB_NAME"]], args.scale, args.seed, weights=weights)
+        print(json.dumps({"database": os.environ["DB_NAME"], "documents": sizes}, indent=2))
+        client.close()
+
+    asyncio.run(main())
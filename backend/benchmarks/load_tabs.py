@@ -0,0 +1,176 @@
+"""
+Concurrent tab-load benchmark for the whole API, run in process.
+
+Seeds the benchmark database with benchmarks.datagen (`--scale` documents
+in every collection), then starts the app's startup hooks (indexes,
+rollups, search index; the post scheduler and recurring generator stay off)
+and drives it through httpx's ASGI transport.
+There is no network or uvicorn in the loop. Each of `--users` virtual
+users repeatedly:
+    opens a tab and fires all of that tab's requests at once, like the
+    Expo screens do (Promise.all); with probability --write-ratio, saves
+    an edit on that tab; then thinks for --think-ms.
+
+The run lasts --duration seconds; samples from the first --warmup seconds
+are dropped. The result is JSON: per-tab and per-endpoint latency
+percentiles, errors and throughput. Save a run and compare a later one
+against it:
+    python -m benchmarks.load_tabs --scale 10000 --users 20 --output before.json
+    python -m benchmarks.load_tabs --scale 10000 --users 20 --baseline before.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from benchmarks.common import summarize
+from benchmarks.datagen import UNIFORM_WEIGHTS, seed
+
+# tab -> (relative frequency, requests fired when it opens)
+TABS = {
+    "dashboard": (4, ["/api/dashboard/stats"]),
+    "tasks": (3, ["/api/tasks"]),
+    "videos": (1, ["/api/videos"]),
+    "calendar": (1, ["/api/calendar"]),
+    "notes": (1, ["/api/study-notes"]),
+    "ideas": (2, ["/api/ideas"]),
+    "revenue": (2, ["/api/revenue", "/api/revenue/summary/monthly", "/api/revenue/summary/category"]),
+    "analytics": (2, ["/api/performance", "/api/performance/analytics/top-content"]),
+    "social": (2, ["/api/social/scheduled-posts", "/api/social/calendar", "/api/social/posting-logs"]),
+}
+
+# tab -> (collection, resource path, edit the screen saves)
+WRITES = {
+    "tasks": ("tasks", "/api/tasks", lambda rng: {"status": rng.choice(["pending", "in_progress", "completed"])}),
+    "ideas": ("ideas", "/api/ideas", lambda rng: {"status": rng.choice(["idea", "researching", "ready"])}),
+    "revenue": ("revenue", "/api/revenue", lambda rng: {"payment_status": rng.choice(["Pending", "Received"])}),
+    "analytics": ("performance", "/api/performance", lambda rng: {"views": rng.randint(0, 200_000)}),
+}
+
+
+def compare(current: dict, baseline: dict) -> dict:
+    """Change of each tab's latency percentiles and of overall throughput, in percent"""
+    def change(now: float, before: float):
+        return round((now - before) / before * 100, 1) if before else None
+
+    tabs = {}
+    for tab, stats in current["tabs"].items():
+        before = baseline.get("tabs", {}).get(tab)
+        if before:
+            tabs[tab] = {key: {"baseline": before[key], "current": stats[key], "change_pct": change(stats[key], before[key])}
+                         for key in ("p50_ms", "p90_ms", "p99_ms") if key in before}
+    throughput = {key: {"baseline": baseline["totals"][key], "current": current["totals"][key],
+                        "change_pct": change(current["totals"][key], baseline["totals"][key])}
+                  for key in ("requests_per_sec", "tab_loads_per_sec")}
+    return {"tabs": tabs, "throughput": throughput}
+
+
+async def run(args) -> dict:
+    import httpx
+
+    import server
+
+    db = server.get_db()
+    sizes = await seed(db, args.scale, args.seed, weights=UNIFORM_WEIGHTS)
+    rng = random.Random(args.seed)
+    ids = {}
+    for collection, _, _ in WRITES.values():
+        docs = await db[collection].find({}, {"_id": 1}).limit(500).to_list(500)
+        ids[collection] = [str(doc["_id"]) for doc in docs]
+
+    tab_names = list(TABS)
+    weights = [TABS[name][0] for name in tab_names]
+    tab_samples: Dict[str, List[float]] = defaultdict(list)
+    request_samples: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+
+    async with server.app.router.lifespan_context(server.app):
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=60) as client:
+            started = time.perf_counter()
+            measure_from = started + args.warmup
+            stop_at = measure_from + args.duration
+
+            async def request(method: str, path: str, label: str, body: dict = None):
+                start = time.perf_counter()
+                try:
+                    response = await client.request(method, path, json=body)
+                    failed = response.status_code >= 400
+                except httpx.HTTPError:
+                    failed = True
+                if start >= measure_from:
+                    request_samples[label].append(time.perf_counter() - start)
+                    if failed:
+                        errors[label] += 1
+
+            async def user(user_rng: random.Random):
+                while time.perf_counter() < stop_at:
+                    tab = user_rng.choices(tab_names, weights)[0]
+                    start = time.perf_counter()
+                    await asyncio.gather(*(request("GET", path, f"GET {path}") for path in TABS[tab][1]))
+                    if start >= measure_from:
+                        tab_samples[tab].append(time.perf_counter() - start)
+                    if tab in WRITES and user_rng.random() < args.write_ratio:
+                        collection, path, edit = WRITES[tab]
+                        item_id = user_rng.choice(ids[collection])
+                        await request("PUT", f"{path}/{item_id}", f"PUT {path}/{{item_id}}", edit(user_rng))
+                    if args.think_ms:
+                        await asyncio.sleep(user_rng.uniform(0, 2 * args.think_ms) / 1000)
+
+            await asyncio.gather(*(user(random.Random(rng.random())) for _ in range(args.users)))
+            elapsed = time.perf_counter() - measure_from
+
+    await db.client.drop_database(db.name)
+    requests = sum(len(samples) for samples in request_samples.values())
+    tab_loads = sum(len(samples) for samples in tab_samples.values())
+    return {
+        "config": {key: getattr(args, key) for key in ("scale", "users", "duration", "warmup", "think_ms",
+                                                       "write_ratio", "seed", "cache")},
+        "documents": sizes,
+        "totals": {
+            "elapsed_s": round(elapsed, 2),
+            "requests": requests,
+            "errors": sum(errors.values()),
+            "tab_loads": tab_loads,
+            "requests_per_sec": round(requests / elapsed, 1),
+            "tab_loads_per_sec": round(tab_loads / elapsed, 1),
+        },
+        "tabs": {tab: summarize(samples) for tab, samples in sorted(tab_samples.items())},
+        "requests": {label: {**summarize(samples), "errors": errors[label]}
+                     for label, samples in sorted(request_samples.items())},
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=10_000, help="documents to seed per collection")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=5, help="unmeasured seconds before the run")
+    parser.add_argument("--think-ms", type=float, default=0, help="mean pause between a user's tab loads")
+    parser.add_argument("--write-ratio", type=float, default=0.05, help="chance a tab load is followed by an edit")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--cache", choices=["memory", "off"], default="memory", help="CACHE_BACKEND for the run")
+    parser.add_argument("--output", help="also write the result to this file")
+    parser.add_argument("--baseline", help="earlier result to compare against")
+    args = parser.parse_args()
+
+    # Read by server at import time
+    os.environ["CACHE_BACKEND"] = args.cache
+    os.environ["SCHEDULER_ENABLED"] = "false"
+    os.environ["RECURRING_GENERATOR_ENABLED"] = "false"
+
+    result = asyncio.run(run(args))
+    if args.baseline:
+        with open(args.baseline) as f:
+            result["comparison"] = compare(result, json.load(f))
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    print(output)
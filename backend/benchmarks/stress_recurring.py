@@ -0,0 +1,104 @@
+"""
+Fire the recurring-task generator from many coroutines at once and check
+that every occurrence became exactly one task.
+
+Each coroutine gets its own Motor client, like separate worker processes,
+and they mix full generator runs with single-template "generate" calls.
+Exits non-zero if any occurrence was duplicated or missed, or a template
+was not advanced exactly past `now`.
+
+Usage (from backend/, with a local mongod running):
+    python -m benchmarks.stress_recurring --templates 500 --workers 32 --rounds 5
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+
+import benchmarks.common  # noqa: F401  (points DB_NAME at the benchmark database)
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from benchmarks.bench_recurring import make_template
+from indexes import ensure_indexes
+from recurrence import due_occurrences, generate_due_tasks, generate_next_task
+
+
+async def worker(index: int, template_ids, now: datetime, rounds: int) -> int:
+    client = AsyncIOMotorClient(os.environ["MONGO_URL"])
+    db = client[os.environ["DB_NAME"]]
+    rng = random.Random(index)
+    generated = 0
+    for _ in range(rounds):
+        if rng.random() < 0.8:
+            generated += (await generate_due_tasks(db, now, batch_size=rng.choice([50, 200, 1000])))["tasks"]
+        else:
+            template = await db.recurring_tasks.find_one({"_id": rng.choice(template_ids)})
+            if template["next_due_date"] <= now:
+                await generate_next_task(db, template, now)
+    client.close()
+    return generated
+
+
+async def main(args):
+    client = AsyncIOMotorClient(os.environ["MONGO_URL"])
+    db = client[os.environ["DB_NAME"]]
+    await client.drop_database(db.name)
+    await ensure_indexes(db)
+
+    # MongoDB stores milliseconds; keep the expected dates comparable with the stored ones
+    now = datetime.utcnow()
+    now = now.replace(microsecond=now.microsecond // 1000 * 1000)
+    random.seed(11)
+    templates = [make_template(i, now) for i in range(args.templates)]
+    await db.recurring_tasks.insert_many(templates)
+    # Occurrences a single run would produce, per template
+    expected = {str(t["_id"]): due_occurrences(t, now) for t in templates}
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        worker(i, [t["_id"] for t in templates], now, args.rounds) for i in range(args.workers)
+    ))
+    elapsed = time.perf_counter() - start
+
+    duplicates = await db.tasks.aggregate([
+        {"$group": {"_id": {"t": "$recurring_task_id", "o": "$occurrence_date"}, "n": {"$sum": 1}}},
+        {"$match": {"n": {"$gt": 1}}},
+        {"$count": "duplicates"},
+    ]).to_list(1)
+    mismatched = 0
+    async for template in db.recurring_tasks.find({}, {"next_due_date": 1}):
+        occurrences, next_due = expected[str(template["_id"])]
+        generated = await db.tasks.count_documents({"recurring_task_id": str(template["_id"])})
+        if generated != len(occurrences) or template["next_due_date"] != next_due:
+            mismatched += 1
+
+    report = {
+        "templates": args.templates,
+        "workers": args.workers,
+        "rounds": args.rounds,
+        "elapsed_s": round(elapsed, 2),
+        "tasks": await db.tasks.count_documents({}),
+        "expected_tasks": sum(len(occurrences) for occurrences, _ in expected.values()),
+        "duplicate_occurrences": duplicates[0]["duplicates"] if duplicates else 0,
+        "templates_mismatched": mismatched,
+    }
+    print(json.dumps(report, indent=2))
+
+    await client.drop_database(db.name)
+    client.close()
+    if report["duplicate_occurrences"] or report["templates_mismatched"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--templates", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=5)
+    asyncio.run(main(parser.parse_args()))
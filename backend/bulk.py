@@ -0,0 +1,213 @@
+"""
+Bulk create/update/delete for the collection resources.
+
+POST /api/{resource}/bulk accepts
+    {"create": [{...}], "update": [{"id": "...", "data": {...}}], "delete": ["..."]}
+
+Every item is validated on its own against the resource's Pydantic models, so
+one bad row doesn't reject the batch. The valid items are executed as a single
+unordered bulk_write, and the response carries one result per input item.
+
+Resources with an `after_write` hook (rollups, search index, dispatch queue)
+need each document's before-image, so their updates and deletes go through
+find_one_and_update / find_one_and_delete one document at a time, like the
+single-item routes; a read-then-bulk_write would hand the hook stale
+before-images when another request edits a document in between. Writes to
+different documents run concurrently.
+"""
+
+import asyncio
+from collections import defaultdict
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException
+from pydantic import BaseModel, ValidationError
+from pymongo import DeleteOne, InsertOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
+
+from sync import record_deletes
+
+if TYPE_CHECKING:
+    from crud import Resource
+
+MAX_BULK_ITEMS = 1000
+
+Change = Tuple[Optional[dict], Optional[dict]]
+
+
+class BulkUpdateItem(BaseModel):
+    id: str
+    data: Dict[str, Any]
+
+
+class BulkRequest(BaseModel):
+    create: List[Dict[str, Any]] = []
+    update: List[BulkUpdateItem] = []
+    delete: List[str] = []
+
+
+def _error(op: str, index: int, message: str) -> dict:
+    return {"op": op, "index": index, "status": "error", "error": message}
+
+
+def validation_message(error: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(str(p) for p in e['loc'])}: {e['msg']}" for e in error.errors())
+
+
+async def _write_one_by_one(collection, resource: "Resource", updates: List[Tuple[dict, ObjectId, dict]],
+                            deletes: List[Tuple[dict, ObjectId]]) -> List[Change]:
+    """Apply updates and deletes with find_one_and_*, returning the changes with exact before-images"""
+    by_id: Dict[ObjectId, list] = defaultdict(list)
+    for result, oid, update_data in updates:
+        by_id[oid].append((result, update_data))
+    for result, oid in deletes:
+        by_id[oid].append((result, None))
+
+    async def write(oid: ObjectId, items: list) -> List[Change]:
+        # Items for the same document run in request order, so later ones build on earlier ones
+        changes: List[Change] = []
+        for result, update_data in items:
+            try:
+                if update_data is None:
+                    before = await collection.find_one_and_delete({"_id": oid})
+                    after = None
+                elif update_data:
+                    before = await collection.find_one_and_update(
+                        {"_id": oid}, resource.build_update(update_data),
+                        return_document=ReturnDocument.BEFORE
+                    )
+                    after = before and {**before, **update_data}
+                else:
+                    # Nothing to set; only report whether the document exists
+                    if not await collection.find_one({"_id": oid}, {"_id": 1}):
+                        result.update(status="error", error="Not found")
+                    continue
+            except OperationFailure as e:
+                result.update(status="error", error=str(e))
+                continue
+            if before is None:
+                result.update(status="error", error="Not found")
+                continue
+            changes.append((before, after))
+        return changes
+
+    per_document = await asyncio.gather(*(write(oid, items) for oid, items in by_id.items()))
+    return [change for changes in per_document for change in changes]
+
+
+async def run_bulk(db, resource: "Resource", request: BulkRequest) -> dict:
+    total = len(request.create) + len(request.update) + len(request.delete)
+    if total > MAX_BULK_ITEMS:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BULK_ITEMS} items per bulk request")
+
+    collection = db[resource.collection]
+    now = datetime.utcnow()
+    results: List[dict] = []
+    ops = []
+    pending: List[Tuple[dict, Change]] = []  # parallel to ops
+
+    for index, raw in enumerate(request.create):
+        try:
+            doc = resource.model(**raw).dict()
+        except ValidationError as e:
+            results.append(_error("create", index, validation_message(e)))
+            continue
+        if resource.prepare:
+            doc = resource.prepare(doc)
+        if resource.syncable:
+            doc["updated_date"] = now
+        doc["_id"] = ObjectId()
+        result = {"op": "create", "index": index, "status": "ok", "_id": str(doc["_id"])}
+        results.append(result)
+        ops.append(InsertOne(doc))
+        pending.append((result, (None, doc)))
+
+    def parse_id(op: str, index: int, raw_id: str) -> Optional[ObjectId]:
+        try:
+            return ObjectId(raw_id)
+        except (InvalidId, TypeError):
+            results.append(_error(op, index, f"Invalid id: {raw_id}"))
+            return None
+
+    update_ids = [parse_id("update", i, item.id) for i, item in enumerate(request.update)]
+    delete_ids = [parse_id("delete", i, raw_id) for i, raw_id in enumerate(request.delete)]
+
+    updates: List[Tuple[dict, ObjectId, dict]] = []  # (result, _id, update_data)
+    for index, (item, oid) in enumerate(zip(request.update, update_ids)):
+        if oid is None:
+            continue
+        try:
+            update = resource.update_model(**item.data).dict()
+        except ValidationError as e:
+            results.append(_error("update", index, validation_message(e)))
+            continue
+        update_data = {k: v for k, v in update.items() if v is not None}
+        if update_data and resource.stamps_updated_date:
+            update_data["updated_date"] = now
+        result = {"op": "update", "index": index, "status": "ok", "_id": item.id}
+        results.append(result)
+        updates.append((result, oid, update_data))
+
+    deletes: List[Tuple[dict, ObjectId]] = []  # (result, _id)
+    for index, (raw_id, oid) in enumerate(zip(request.delete, delete_ids)):
+        if oid is None:
+            continue
+        result = {"op": "delete", "index": index, "status": "ok", "_id": raw_id}
+        results.append(result)
+        deletes.append((result, oid))
+
+    written: List[Change] = []
+    if resource.after_write:
+        written = await _write_one_by_one(collection, resource, updates, deletes)
+    else:
+        # One round trip tells us which targets exist
+        target_ids = [oid for _, oid, _ in updates] + [oid for _, oid in deletes]
+        existing = set()
+        if target_ids:
+            async for doc in collection.find({"_id": {"$in": target_ids}}, {"_id": 1}):
+                existing.add(doc["_id"])
+        for result, oid, update_data in updates:
+            if oid not in existing:
+                result.update(status="error", error="Not found")
+            elif update_data:
+                ops.append(UpdateOne({"_id": oid}, resource.build_update(update_data)))
+                # No after_write to feed, so the id and the new fields are all we keep
+                pending.append((result, ({"_id": oid}, {"_id": oid, **update_data})))
+        for result, oid in deletes:
+            if oid not in existing:
+                result.update(status="error", error="Not found")
+                continue
+            existing.discard(oid)
+            ops.append(DeleteOne({"_id": oid}))
+            pending.append((result, ({"_id": oid}, None)))
+
+    failed_ops = set()
+    if ops:
+        try:
+            await collection.bulk_write(ops, ordered=False)
+        except BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                failed_ops.add(write_error["index"])
+                result = pending[write_error["index"]][0]
+                result["status"] = "error"
+                result["error"] = write_error.get("errmsg", "Write failed")
+
+    changes = written + [change for i, (_, change) in enumerate(pending) if i not in failed_ops]
+    if resource.after_write and changes:
+        await resource.after_write(changes)
+    if resource.syncable:
+        deleted_ids = [before["_id"] for before, after in changes if after is None]
+        await record_deletes(db, resource.collection, deleted_ids, now)
+
+    results.sort(key=lambda r: (("create", "update", "delete").index(r["op"]), r["index"]))
+    counts = {"created": 0, "updated": 0, "deleted": 0, "failed": 0}
+    for result in results:
+        if result["status"] != "ok":
+            counts["failed"] += 1
+        else:
+            counts[{"create": "created", "update": "updated", "delete": "deleted"}[result["op"]]] += 1
+    return {"results": results, "counts": counts}
+
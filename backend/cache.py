@@ -0,0 +1,207 @@
+"""
+Response cache for the read-heavy summary endpoints.
+
+`CacheMiddleware` serves GET requests under the configured path prefixes from
+a `ResponseCache`. Each prefix is tagged with the collections its response
+is built from; writes call `ResponseCache.invalidate(collection)`, which bumps
+that tag's version. Cache keys embed the current versions of their tags, so
+a write orphans every dependent entry at once and there is nothing to scan
+or delete.
+
+Every cached response carries an ETag. A request whose If-None-Match matches
+gets a 304 with no body, whether the entry came from the cache or was just
+rendered.
+
+Backends, picked by CACHE_BACKEND:
+    memory (default)  per-process TTL + LRU store (CACHE_TTL_SECONDS, CACHE_MAX_ENTRIES)
+    redis             shared store at CACHE_REDIS_URL, so a write in one worker
+                      invalidates every worker; needs the `redis` package
+    off               no caching
+With the memory backend each uvicorn worker has its own cache, so a write
+handled by one worker leaves the others serving their entry until its TTL.
+"""
+
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_TTL_SECONDS = 60
+DEFAULT_MAX_ENTRIES = 512
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    etag: str
+    content_type: str
+
+    def encode(self) -> bytes:
+        return f"{self.etag}\n{self.content_type}\n".encode() + self.body
+
+    @classmethod
+    def decode(cls, raw: bytes) -> "CachedResponse":
+        etag, content_type, body = raw.split(b"\n", 2)
+        return cls(body, etag.decode(), content_type.decode())
+
+
+def make_etag(body: bytes) -> str:
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+class MemoryBackend:
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, CachedResponse]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, response = item
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return response
+
+    async def set(self, key: str, response: CachedResponse, ttl: int):
+        self._entries[key] = (time.monotonic() + ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def versions(self, tags: Sequence[str]) -> List[int]:
+        return [self._versions.get(tag, 0) for tag in tags]
+
+    async def bump(self, tags: Iterable[str]):
+        for tag in tags:
+            self._versions[tag] = self._versions.get(tag, 0) + 1
+
+
+class RedisBackend:
+    def __init__(self, url: str, prefix: str = "cache:"):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise RuntimeError("CACHE_BACKEND=redis needs the `redis` package (pip install redis)") from e
+        self.redis = redis.from_url(url)
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[CachedResponse]:
+        raw = await self.redis.get(self.prefix + key)
+        return CachedResponse.decode(raw) if raw is not None else None
+
+    async def set(self, key: str, response: CachedResponse, ttl: int):
+        await self.redis.set(self.prefix + key, response.encode(), ex=ttl)
+
+    async def versions(self, tags: Sequence[str]) -> List[int]:
+        values = await self.redis.mget([f"{self.prefix}tag:{tag}" for tag in tags])
+        return [int(value or 0) for value in values]
+
+    async def bump(self, tags: Iterable[str]):
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for tag in tags:
+                pipe.incr(f"{self.prefix}tag:{tag}")
+            await pipe.execute()
+
+
+class ResponseCache:
+    def __init__(self, backend=None, ttl: int = DEFAULT_TTL_SECONDS):
+        self.backend = backend
+        self.ttl = ttl
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        kind = os.environ.get("CACHE_BACKEND", "memory")
+        ttl = int(os.environ.get("CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS))
+        if kind == "off":
+            return cls(None, ttl)
+        if kind == "redis":
+            return cls(RedisBackend(os.environ.get("CACHE_REDIS_URL", "redis://localhost:6379/0")), ttl)
+        return cls(MemoryBackend(int(os.environ.get("CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))), ttl)
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    async def key(self, path: str, query: str, tags: Sequence[str]) -> str:
+        versions = await self.backend.versions(tags)
+        return f"{path}?{query}#" + ",".join(f"{tag}={v}" for tag, v in zip(tags, versions))
+
+    async def invalidate(self, *collections: str):
+        """Drop every cached response built from any of `collections`"""
+        if self.enabled:
+            await self.backend.bump(collections)
+
+
+@dataclass(frozen=True)
+class CacheRule:
+    prefix: str
+    tags: Tuple[str, ...]
+
+
+class CacheMiddleware:
+    """ASGI middleware serving the GET routes matched by `rules` through `cache`"""
+
+    def __init__(self, app, cache: ResponseCache, rules: Sequence[CacheRule]):
+        self.app = app
+        self.cache = cache
+        self.rules = rules
+
+    def _rule(self, path: str) -> Optional[CacheRule]:
+        return next((rule for rule in self.rules if path.startswith(rule.prefix)), None)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or not self.cache.enabled:
+            return await self.app(scope, receive, send)
+        rule = self._rule(scope["path"])
+        if rule is None:
+            return await self.app(scope, receive, send)
+
+        query = "&".join(sorted(scope["query_string"].decode().split("&")))
+        key = await self.cache.key(scope["path"], query, rule.tags)
+        if_none_match = dict(scope["headers"]).get(b"if-none-match", b"").decode()
+
+        cached = await self.cache.backend.get(key)
+        if cached is not None:
+            return await self._send(send, cached, if_none_match, hit=True)
+
+        status, headers, chunks = 200, [], []
+
+        async def capture(message):
+            nonlocal status, headers
+            if message["type"] == "http.response.start":
+                status, headers = message["status"], message.get("headers", [])
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+        body = b"".join(chunks)
+        if status != 200:
+            await send({"type": "http.response.start", "status": status, "headers": headers})
+            return await send({"type": "http.response.body", "body": body})
+
+        content_type = dict(headers).get(b"content-type", b"application/json").decode()
+        response = CachedResponse(body, make_etag(body), content_type)
+        await self.cache.backend.set(key, response, self.cache.ttl)
+        await self._send(send, response, if_none_match, hit=False)
+
+    async def _send(self, send, response: CachedResponse, if_none_match: str, hit: bool):
+        headers = [
+            (b"etag", response.etag.encode()),
+            (b"cache-control", b"private, no-cache"),
+            (b"x-cache", b"hit" if hit else b"miss"),
+        ]
+        if response.etag in (tag.strip() for tag in if_none_match.split(",")):
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            return await send({"type": "http.response.body", "body": b""})
+        headers += [
+            (b"content-type", response.content_type.encode()),
+            (b"content-length", str(len(response.body)).encode()),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": response.body})
@@ -0,0 +1,240 @@
+"""
+CRUD router factory shared by every collection resource.
+
+`crud_router(resource, get_db)` builds the create / list / get / update /
+delete / bulk routes for one `Resource`. Every resource goes through the same
+code path, so id parsing, error mapping, projections and update round trips
+are handled here once (documents are returned as-is; ORJSONRoute renders
+their ObjectIds):
+
+* updates are a single find_one_and_update instead of update_one + find_one
+* GET routes accept `?fields=a,b` to project the returned documents
+* a malformed id is a 400 and a missing document is a 404
+* GET /<path>/export?format=ndjson|csv streams the whole collection
+* POST /<path>/import?format=ndjson|csv streams a file in (`importable` resources)
+* `syncable` resources stamp updated_date on every write and leave a tombstone
+  per delete, for GET /api/sync (see sync.py)
+"""
+
+import inspect
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type, Union
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from pydantic import BaseModel
+from pymongo import ReturnDocument
+
+from bulk import BulkRequest, run_bulk
+from export import ExportFormat, export_response
+from importer import IMPORT_BATCH_SIZE, MAX_IMPORT_BATCH_SIZE, import_stream
+from pagination import PageParams, paginate
+from serialization import ORJSONRoute
+from sync import record_deletes
+
+Change = Tuple[Optional[dict], Optional[dict]]
+
+
+@dataclass
+class Resource:
+    path: str
+    collection: str
+    model: Type[BaseModel]
+    update_model: Type[BaseModel]
+    # Used in messages: "<label> not found", "<deleted_label or label> deleted successfully"
+    label: str
+    deleted_label: Optional[str] = None
+    # Order of list pages
+    sort_field: str = "_id"
+    direction: int = 1
+    # Fields that can be passed as equality filters on the list route
+    list_filters: Tuple[str, ...] = ()
+    # Applied to every document of a list page (e.g. masking secrets)
+    list_transform: Optional[Callable[[dict], dict]] = None
+    # Stamp updated_date on update
+    touch_updated_date: bool = False
+    # Derive stored fields on create
+    prepare: Optional[Callable[[dict], dict]] = None
+    # Build the update document from the changed fields; defaults to {"$set": ...}.
+    # Resources with after_write must stick to $set so the after-image can be derived.
+    update_doc: Optional[Callable[[dict], Union[dict, list]]] = None
+    # Keep derived state in sync; receives (before, after) images, None for create/delete
+    after_write: Optional[Callable[[List[Change]], Awaitable[None]]] = None
+    # Expose POST /<path>/import for bulk loading historical data
+    importable: bool = False
+    # Served by /api/sync: updated_date on every write, tombstones for deletes
+    syncable: bool = False
+
+    @property
+    def stamps_updated_date(self) -> bool:
+        return self.touch_updated_date or self.syncable
+
+    def build_update(self, update_data: dict) -> Union[dict, list]:
+        return self.update_doc(update_data) if self.update_doc else {"$set": update_data}
+
+
+def parse_object_id(value: str) -> ObjectId:
+    try:
+        return ObjectId(value)
+    except (InvalidId, TypeError):
+        raise HTTPException(status_code=400, detail=f"Invalid id: {value}")
+
+
+def parse_fields(fields: Optional[str]) -> Optional[Dict[str, int]]:
+    """Turn `?fields=a,b` into a projection; None means the whole document"""
+    if not fields:
+        return None
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    return {name: 1 for name in names} or None
+
+
+def _list_filter_dependency(filters: Tuple[str, ...]):
+    def list_filters(**kwargs) -> dict:
+        return {name: value for name, value in kwargs.items() if value is not None}
+
+    list_filters.__signature__ = inspect.Signature([
+        inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=Query(None), annotation=Optional[str])
+        for name in filters
+    ])
+    return list_filters
+
+
+def crud_router(
+    resource: Resource,
+    get_db: Callable[[], Any],
+    on_write: Optional[Callable[[str], Awaitable[None]]] = None,
+) -> APIRouter:
+    """`on_write(collection)` runs after every successful write, e.g. to invalidate caches"""
+    router = APIRouter(route_class=ORJSONRoute)
+    name = resource.collection
+    update_model = resource.update_model
+
+    def collection():
+        return get_db()[resource.collection]
+
+    async def written():
+        if on_write:
+            await on_write(resource.collection)
+
+    async def create(item: resource.model):
+        doc = item.dict()
+        if resource.prepare:
+            doc = resource.prepare(doc)
+        if resource.syncable:
+            doc["updated_date"] = datetime.utcnow()
+        await collection().insert_one(doc)
+        if resource.after_write:
+            await resource.after_write([(None, doc)])
+        await written()
+        return doc
+
+    async def list_items(
+        page: PageParams = Depends(),
+        fields: Optional[str] = None,
+        query: dict = Depends(_list_filter_dependency(resource.list_filters)),
+    ):
+        return await paginate(
+            collection(), page, query,
+            sort_field=resource.sort_field,
+            direction=resource.direction,
+            projection=parse_fields(fields),
+            transform=resource.list_transform,
+        )
+
+    async def export(
+        export_format: ExportFormat = Query("ndjson", alias="format"),
+        fields: Optional[str] = None,
+        query: dict = Depends(_list_filter_dependency(resource.list_filters)),
+    ):
+        projection = parse_fields(fields)
+        columns = ["_id", *(projection or resource.model.model_fields)]
+        return export_response(collection(), export_format, columns, query, projection,
+                               filename=resource.path.replace("/", "-"), transform=resource.list_transform)
+
+    async def get_item(item_id: str, fields: Optional[str] = None):
+        doc = await collection().find_one({"_id": parse_object_id(item_id)}, parse_fields(fields))
+        if not doc:
+            raise HTTPException(status_code=404, detail=f"{resource.label} not found")
+        return doc
+
+    async def update_item(item_id: str, item_update: update_model, fields: Optional[str] = None):
+        oid = parse_object_id(item_id)
+        update_data = {k: v for k, v in item_update.dict().items() if v is not None}
+        if not update_data:
+            return await get_item(item_id, fields)
+        if resource.stamps_updated_date:
+            update_data["updated_date"] = datetime.utcnow()
+
+        if resource.after_write:
+            before = await collection().find_one_and_update(
+                {"_id": oid}, resource.build_update(update_data),
+                return_document=ReturnDocument.BEFORE
+            )
+            if before is None:
+                raise HTTPException(status_code=404, detail=f"{resource.label} not found")
+            doc = {**before, **update_data}
+            await resource.after_write([(before, doc)])
+            projection = parse_fields(fields)
+            if projection:
+                doc = {k: v for k, v in doc.items() if k in projection or k == "_id"}
+        else:
+            doc = await collection().find_one_and_update(
+                {"_id": oid}, resource.build_update(update_data),
+                projection=parse_fields(fields),
+                return_document=ReturnDocument.AFTER
+            )
+            if doc is None:
+                raise HTTPException(status_code=404, detail=f"{resource.label} not found")
+        await written()
+        return doc
+
+    async def delete_item(item_id: str):
+        oid = parse_object_id(item_id)
+        if resource.after_write:
+            doc = await collection().find_one_and_delete({"_id": oid})
+            deleted = doc is not None
+            if deleted:
+                await resource.after_write([(doc, None)])
+        else:
+            deleted = (await collection().delete_one({"_id": oid})).deleted_count > 0
+        if not deleted:
+            raise HTTPException(status_code=404, detail=f"{resource.label} not found")
+        if resource.syncable:
+            await record_deletes(get_db(), resource.collection, [oid])
+        await written()
+        return {"message": f"{resource.deleted_label or resource.label} deleted successfully"}
+
+    async def bulk(request: BulkRequest):
+        result = await run_bulk(get_db(), resource, request)
+        if any(result["counts"][op] for op in ("created", "updated", "deleted")):
+            await written()
+        return result
+
+    async def import_items(
+        request: Request,
+        import_format: ExportFormat = Query("ndjson", alias="format"),
+        batch_size: int = Query(IMPORT_BATCH_SIZE, ge=1, le=MAX_IMPORT_BATCH_SIZE),
+    ):
+        report = await import_stream(get_db(), resource, request.stream(), import_format, batch_size)
+        if report["inserted"]:
+            await written()
+        return report
+
+    for handler, verb in [(create, "create"), (list_items, "list"), (export, "export"), (get_item, "get"),
+                          (update_item, "update"), (delete_item, "delete"), (bulk, "bulk"),
+                          (import_items, "import")]:
+        handler.__name__ = f"{verb}_{name}"
+
+    path = f"/{resource.path}"
+    router.add_api_route(path, create, methods=["POST"])
+    router.add_api_route(path, list_items, methods=["GET"])
+    router.add_api_route(f"{path}/bulk", bulk, methods=["POST"])
+    router.add_api_route(f"{path}/export", export, methods=["GET"])
+    if resource.importable:
+        router.add_api_route(f"{path}/import", import_items, methods=["POST"])
+    router.add_api_route(f"{path}/{{item_id}}", get_item, methods=["GET"])
+    router.add_api_route(f"{path}/{{item_id}}", update_item, methods=["PUT"])
+    router.add_api_route(f"{path}/{{item_id}}", delete_item, methods=["DELETE"])
+    return router
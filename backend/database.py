@@ -0,0 +1,172 @@
+"""
+MongoDB client configuration, lifecycle and connection pool metrics.
+
+`Database.from_env()` builds the Motor client from env config:
+    MONGO_URL, DB_NAME
+    MONGO_MAX_POOL_SIZE            connections per server (default 100)
+    MONGO_MIN_POOL_SIZE            connections kept open while idle (default 10)
+    MONGO_MAX_IDLE_TIME_MS         close connections idle this long (default 300000)
+    MONGO_WAIT_QUEUE_TIMEOUT_MS    fail a checkout after waiting this long (default 10000)
+    MONGO_COMPRESSORS              wire compression, e.g. "zstd,snappy,zlib" (default off;
+                                   zstd needs `zstandard`, snappy needs `python-snappy`)
+Motor doesn't connect until first use, so building the client at import
+does no I/O. The app lifespan calls `connect()`, which opens minPoolSize
+connections up front so the first burst of tab loads doesn't pay for
+connection setup and TLS handshakes, and `close()` on shutdown.
+
+`PoolMonitor` is a pymongo pool listener. It tracks open, in-use and
+waiting checkouts, plus the time spent waiting for a connection, and
+exports them through `metrics.Metrics`. Rising waiters and checkout wait
+mean the pool is too small for the request concurrency.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Sequence
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+from metrics import DB_LATENCY_BUCKETS, Counter, Gauge, Histogram, Metrics
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_POOL_SIZE = 100
+DEFAULT_MIN_POOL_SIZE = 10
+DEFAULT_MAX_IDLE_TIME_MS = 300_000
+DEFAULT_WAIT_QUEUE_TIMEOUT_MS = 10_000
+HEALTH_CHECK_TIMEOUT_SECONDS = 2.0
+
+
+def pool_options_from_env() -> Dict[str, object]:
+    options = {
+        "maxPoolSize": int(os.environ.get("MONGO_MAX_POOL_SIZE", DEFAULT_MAX_POOL_SIZE)),
+        "minPoolSize": int(os.environ.get("MONGO_MIN_POOL_SIZE", DEFAULT_MIN_POOL_SIZE)),
+        "maxIdleTimeMS": int(os.environ.get("MONGO_MAX_IDLE_TIME_MS", DEFAULT_MAX_IDLE_TIME_MS)),
+        "waitQueueTimeoutMS": int(os.environ.get("MONGO_WAIT_QUEUE_TIMEOUT_MS", DEFAULT_WAIT_QUEUE_TIMEOUT_MS)),
+    }
+    compressors = os.environ.get("MONGO_COMPRESSORS", "").strip()
+    if compressors:
+        options["compressors"] = compressors
+    return options
+
+
+class PoolMonitor(monitoring.ConnectionPoolListener):
+    """Connection pool gauges, summed over every server the client talks to"""
+
+    def __init__(self, max_pool_size: int):
+        self.open = Gauge("mongodb_pool_connections_open", "Open MongoDB connections")
+        self.in_use = Gauge("mongodb_pool_connections_in_use", "MongoDB connections checked out")
+        self.waiting = Gauge("mongodb_pool_checkouts_waiting", "Operations waiting for a MongoDB connection")
+        self.max_size = Gauge("mongodb_pool_max_size", "maxPoolSize per server")
+        self.max_size.value = max_pool_size
+        self.checkout_failures = Counter("mongodb_pool_checkout_failures_total",
+                                         "Connection checkouts that failed (e.g. waitQueueTimeoutMS)")
+        self.checkout_wait = Histogram("mongodb_pool_checkout_wait_seconds", "Time spent waiting for a connection",
+                                       (), DB_LATENCY_BUCKETS)
+        self._lock = threading.Lock()
+        # Checkout start and end events fire on the same thread
+        self._checkout = threading.local()
+
+    @property
+    def collectors(self) -> Sequence:
+        return (self.open, self.in_use, self.waiting, self.max_size, self.checkout_failures, self.checkout_wait)
+
+    def snapshot(self) -> dict:
+        return {
+            "open": self.open.value,
+            "in_use": self.in_use.value,
+            "waiting": self.waiting.value,
+            "max_size": self.max_size.value,
+            "saturation": round(self.in_use.value / self.max_size.value, 3) if self.max_size.value else None,
+            "checkout_failures": self.checkout_failures.value,
+        }
+
+    def _add(self, gauge: Gauge, delta: int):
+        with self._lock:
+            gauge.value += delta
+
+    def connection_created(self, event):
+        self._add(self.open, 1)
+
+    def connection_closed(self, event):
+        self._add(self.open, -1)
+
+    def connection_check_out_started(self, event):
+        self._checkout.started = time.perf_counter()
+        self._add(self.waiting, 1)
+
+    def connection_checked_out(self, event):
+        self._add(self.waiting, -1)
+        self._add(self.in_use, 1)
+        started = getattr(self._checkout, "started", None)
+        if started is not None:
+            self.checkout_wait.observe((), time.perf_counter() - started)
+
+    def connection_check_out_failed(self, event):
+        self._add(self.waiting, -1)
+        self._add(self.checkout_failures, 1)
+        if event.reason == monitoring.ConnectionCheckOutFailedReason.TIMEOUT:
+            logger.warning("MongoDB connection checkout timed out on %s; the pool is saturated", event.address)
+
+    def connection_checked_in(self, event):
+        self._add(self.in_use, -1)
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        pass
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_ready(self, event):
+        pass
+
+
+class Database:
+    def __init__(self, url: str, name: str, metrics: Optional[Metrics] = None,
+                 listeners: Sequence = (), **pool_options):
+        self.pool_options = pool_options
+        self.pool = PoolMonitor(pool_options.get("maxPoolSize", DEFAULT_MAX_POOL_SIZE))
+        if metrics:
+            metrics.register(*self.pool.collectors)
+        self.client = AsyncIOMotorClient(url, event_listeners=[self.pool, *listeners], **pool_options)
+        self.db = self.client[name]
+
+    @classmethod
+    def from_env(cls, metrics: Optional[Metrics] = None, listeners: Sequence = ()) -> "Database":
+        return cls(os.environ["MONGO_URL"], os.environ["DB_NAME"], metrics, listeners, **pool_options_from_env())
+
+    async def connect(self):
+        """Open minPoolSize connections now rather than on the first requests"""
+        warm = max(1, min(self.pool_options.get("minPoolSize", 0), self.pool_options.get("maxPoolSize", 1)))
+        start = time.perf_counter()
+        # Concurrent pings each check out their own connection
+        await asyncio.gather(*(self.client.admin.command("ping") for _ in range(warm)))
+        logger.info("MongoDB pool warmed: %d connections open in %.0f ms",
+                    self.pool.open.value, (time.perf_counter() - start) * 1000)
+
+    async def health(self) -> dict:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self.client.admin.command("ping"), HEALTH_CHECK_TIMEOUT_SECONDS)
+            status, error = "ok", None
+        except Exception as e:
+            status, error = "unavailable", f"{type(e).__name__}: {e}"
+        return {
+            "status": status,
+            "ping_ms": round((time.perf_counter() - start) * 1000, 2),
+            "error": error,
+            "pool": self.pool.snapshot(),
+        }
+
+    def close(self):
+        self.client.close()
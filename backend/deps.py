@@ -0,0 +1,53 @@
+"""
+Process-wide singletons shared by server.py and the feature routers.
+
+Importing this loads .env and builds the metrics registry and the response
+cache. The MongoDB client is built by `get_database()` on first use, so
+importing the app needs no MONGO_URL / DB_NAME; handlers reach the database
+through `get_db()`. The routers in routers/ import from here rather than
+from server, so a router can be imported on its own, and lazily, without a
+cycle.
+"""
+
+from functools import cache
+from pathlib import Path
+from typing import Dict
+
+from dotenv import load_dotenv
+from fastapi import APIRouter
+
+from cache import ResponseCache
+from crud import Resource, crud_router
+from database import Database
+from metrics import CommandTimer, Metrics
+
+ROOT_DIR = Path(__file__).parent
+load_dotenv(ROOT_DIR / '.env')
+
+# Request / MongoDB command timings, exported at /metrics
+metrics = Metrics()
+
+@cache
+def get_database() -> Database:
+    """The MongoDB connection; pool settings come from env (see database.py) and the
+    app lifespan warms the pool on startup and closes it on shutdown"""
+    return Database.from_env(metrics, listeners=[CommandTimer(metrics)])
+
+def get_db():
+    return get_database().db
+
+response_cache = ResponseCache.from_env()
+
+# path -> resource, for the import CLI (python importer.py <path> <file>)
+importable_resources: Dict[str, Resource] = {}
+
+# path -> resource, for delta sync (GET /api/sync)
+syncable_resources: Dict[str, Resource] = {}
+
+def mount(router: APIRouter, resource: Resource):
+    """Add a collection's CRUD routes; its writes invalidate cached responses built from it"""
+    router.include_router(crud_router(resource, get_db, on_write=response_cache.invalidate))
+    if resource.importable:
+        importable_resources[resource.path] = resource
+    if resource.syncable:
+        syncable_resources[resource.path] = resource
@@ -0,0 +1,239 @@
+"""
+Time- and priority-ordered dispatch queue for scheduled posts.
+
+A post is due at `due_at`: its "HH:MM" `scheduled_time` on the day of
+`scheduled_date`, both read in the post's timezone and stored as naive UTC.
+The timezone is the offset `scheduled_date` was sent with (kept on the post as
+`schedule_timezone`), or SCHEDULE_TIMEZONE (an IANA name, default UTC) for
+dates sent without one. `priority_rank` turns `priority` into a sortable number
+(high 0, medium 1, low 2). Both are stored on the post and kept current by
+the scheduled post write paths, and (status, due_at, priority_rank) is
+indexed.
+
+`DispatchQueue` mirrors the next `window` scheduled posts in a heap keyed by
+(due_at, priority_rank), refilled from MongoDB with one indexed query. Posts
+leave it through a second "ready" heap keyed by (priority_rank, due_at), so
+the next due instant is a peek and, once a backlog builds up, high-priority
+posts go out before older low-priority ones.
+
+Posts written before due_at existed are migrated at startup, or with
+    python -m dispatch --migrate
+"""
+
+import heapq
+import os
+from datetime import datetime, time, timedelta, timezone, tzinfo
+from typing import Dict, List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from bson import ObjectId
+
+PRIORITY_RANKS = {"high": 0, "medium": 1, "low": 2}
+DEFAULT_PRIORITY_RANK = PRIORITY_RANKS["medium"]
+
+DISPATCH_FIELDS = ("scheduled_date", "scheduled_time", "priority")
+
+
+def _time_part(index: int) -> dict:
+    return {"$convert": {
+        "input": {"$arrayElemAt": [{"$split": [{"$ifNull": ["$scheduled_time", ""]}, ":"]}, index]},
+        "to": "int", "onError": 0, "onNull": 0,
+    }}
+
+
+def schedule_timezone() -> str:
+    return os.environ.get("SCHEDULE_TIMEZONE", "UTC")
+
+
+def _offset_name(value: datetime) -> str:
+    """"+05:30" style name of an aware datetime's offset, as MongoDB date operators accept it"""
+    minutes = int(value.utcoffset().total_seconds()) // 60
+    sign = "-" if minutes < 0 else "+"
+    hours, minutes = divmod(abs(minutes), 60)
+    return f"{sign}{hours:02d}:{minutes:02d}"
+
+
+def _zone(name: str) -> tzinfo:
+    if name[:1] in "+-":
+        hours, minutes = name[1:].split(":")
+        offset = timedelta(hours=int(hours), minutes=int(minutes))
+        return timezone(-offset if name[0] == "-" else offset)
+    return ZoneInfo(name)
+
+
+# Server-side equivalents of compute_due_at / priority_rank for pipeline updates
+def due_at_expr(default_timezone: str) -> dict:
+    return {"$let": {
+        "vars": {"tz": {"$ifNull": ["$schedule_timezone", default_timezone]}},
+        "in": {"$let": {
+            "vars": {"day": {"$dateToParts": {"date": "$scheduled_date", "timezone": "$$tz"}}},
+            "in": {"$dateFromParts": {
+                "year": "$$day.year", "month": "$$day.month", "day": "$$day.day",
+                "hour": _time_part(0), "minute": _time_part(1), "timezone": "$$tz",
+            }},
+        }},
+    }}
+
+
+PRIORITY_RANK_EXPR = {"$switch": {
+    "branches": [{"case": {"$eq": ["$priority", name]}, "then": rank} for name, rank in PRIORITY_RANKS.items()],
+    "default": DEFAULT_PRIORITY_RANK,
+}}
+
+
+def compute_due_at(scheduled_date: datetime, scheduled_time: Optional[str],
+                   schedule_tz: Optional[str] = None) -> datetime:
+    """Naive UTC instant of `scheduled_time` on `scheduled_date`'s day in its timezone
+
+    An aware `scheduled_date` carries its own offset; a naive one is a UTC
+    instant (as read back from MongoDB) whose day is taken in `schedule_tz`,
+    falling back to SCHEDULE_TIMEZONE.
+    """
+    def part(index: int) -> int:
+        try:
+            return int((scheduled_time or "").split(":")[index])
+        except (IndexError, ValueError):
+            return 0
+
+    if scheduled_date.tzinfo is not None:
+        local = scheduled_date
+    else:
+        local = scheduled_date.replace(tzinfo=timezone.utc).astimezone(_zone(schedule_tz or schedule_timezone()))
+    # Wall-clock arithmetic, like $dateFromParts, so DST changes don't shift the time of day
+    due_at = datetime.combine(local.date(), time(), local.tzinfo) + timedelta(hours=part(0), minutes=part(1))
+    # due_at is compared with naive UTC times read from MongoDB
+    return due_at.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def priority_rank(priority: Optional[str]) -> int:
+    return PRIORITY_RANKS.get(priority, DEFAULT_PRIORITY_RANK)
+
+
+def with_dispatch_fields(post: dict) -> dict:
+    if post["scheduled_date"].tzinfo is not None:
+        post["schedule_timezone"] = _offset_name(post["scheduled_date"])
+    post["due_at"] = compute_due_at(post["scheduled_date"], post.get("scheduled_time"), post.get("schedule_timezone"))
+    post["priority_rank"] = priority_rank(post.get("priority"))
+    return post
+
+
+def dispatch_update(update_data: dict):
+    """Update document for a scheduled post that keeps due_at and priority_rank in step"""
+    if not any(field in update_data for field in DISPATCH_FIELDS):
+        return {"$set": update_data}
+    literals = dict(update_data)
+    scheduled_date = update_data.get("scheduled_date")
+    if isinstance(scheduled_date, datetime) and scheduled_date.tzinfo is not None:
+        literals["schedule_timezone"] = _offset_name(scheduled_date)
+    return [
+        {"$set": {k: {"$literal": v} for k, v in literals.items()}},
+        {"$set": {"due_at": due_at_expr(schedule_timezone()), "priority_rank": PRIORITY_RANK_EXPR}},
+    ]
+
+
+async def migrate_due_at(db) -> int:
+    """Stamp due_at / priority_rank on posts created before they existed"""
+    result = await db.scheduled_posts.update_many(
+        {"due_at": {"$exists": False}, "scheduled_date": {"$type": "date"}},
+        [{"$set": {"due_at": due_at_expr(schedule_timezone()), "priority_rank": PRIORITY_RANK_EXPR}}],
+    )
+    return result.modified_count
+
+
+Key = Tuple[datetime, int]
+
+
+class DispatchQueue:
+    def __init__(self, collection, window: int = 1000):
+        self.collection = collection
+        self.window = window
+        self._entries: Dict[ObjectId, Key] = {}  # live key per post; heap items that disagree are stale
+        self._upcoming: List[Tuple[datetime, int, ObjectId]] = []
+        self._ready: List[Tuple[int, datetime, ObjectId]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def refill(self):
+        """Replace the heap with the next `window` scheduled posts"""
+        docs = await self.collection.find(
+            {"status": "scheduled", "due_at": {"$ne": None}},
+            {"due_at": 1, "priority_rank": 1},
+        ).sort([("due_at", 1), ("priority_rank", 1)]).limit(self.window).to_list(self.window)
+        self._entries = {
+            doc["_id"]: (doc["due_at"], doc.get("priority_rank", DEFAULT_PRIORITY_RANK)) for doc in docs
+        }
+        self._upcoming = [(due_at, rank, oid) for oid, (due_at, rank) in self._entries.items()]
+        heapq.heapify(self._upcoming)
+        self._ready = []
+
+    def push(self, post: dict):
+        """Track a post written by this process without waiting for the next refill"""
+        if post.get("status") != "scheduled" or post.get("due_at") is None:
+            self.discard(post["_id"])
+            return
+        key = (post["due_at"], post.get("priority_rank", DEFAULT_PRIORITY_RANK))
+        self._entries[post["_id"]] = key
+        heapq.heappush(self._upcoming, (key[0], key[1], post["_id"]))
+
+    def discard(self, post_id: ObjectId):
+        self._entries.pop(post_id, None)
+
+    def _promote(self, now: datetime):
+        while self._upcoming and self._upcoming[0][0] <= now:
+            due_at, rank, oid = heapq.heappop(self._upcoming)
+            if self._entries.get(oid) == (due_at, rank):
+                heapq.heappush(self._ready, (rank, due_at, oid))
+
+    def next_due(self) -> Optional[datetime]:
+        """Earliest due_at still waiting in the queue"""
+        if self._ready:
+            return self._ready[0][1]
+        while self._upcoming:
+            due_at, rank, oid = self._upcoming[0]
+            if self._entries.get(oid) == (due_at, rank):
+                return due_at
+            heapq.heappop(self._upcoming)
+        return None
+
+    def has_due(self, now: datetime) -> bool:
+        self._promote(now)
+        return bool(self._ready)
+
+    def pop_due(self, now: datetime, count: int) -> List[ObjectId]:
+        """Up to `count` due post ids, highest priority (then oldest) first"""
+        self._promote(now)
+        ids = []
+        while self._ready and len(ids) < count:
+            rank, due_at, oid = heapq.heappop(self._ready)
+            if self._entries.get(oid) == (due_at, rank):
+                del self._entries[oid]
+                ids.append(oid)
+        return ids
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+    import os
+    from pathlib import Path
+
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description="Inspect or migrate the scheduled post dispatch fields")
+    parser.add_argument("--migrate", action="store_true", help="stamp due_at / priority_rank on older posts")
+    args = parser.parse_args()
+
+    load_dotenv(Path(__file__).parent / '.env')
+
+    async def main():
+        client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+        db = client[os.environ['DB_NAME']]
+        if args.migrate:
+            print(f"Migrated {await migrate_due_at(db)} posts")
+        missing = await db.scheduled_posts.count_documents({"due_at": {"$exists": False}})
+        print(f"{missing} posts without due_at")
+        client.close()
+
+    asyncio.run(main())
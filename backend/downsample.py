@@ -0,0 +1,46 @@
+"""
+Largest-Triangle-Three-Buckets downsampling for chart series.
+
+LTTB keeps the first and last points and, for every bucket in between, the
+point forming the largest triangle with the previously kept point and the
+average of the next bucket. Peaks and troughs survive, flat stretches don't.
+"""
+
+from typing import Callable, List, TypeVar
+
+T = TypeVar("T")
+
+
+def lttb(points: List[T], threshold: int, x: Callable[[T], float], y: Callable[[T], float]) -> List[T]:
+    """Reduce `points` (sorted by x) to at most `threshold` points"""
+    if threshold >= len(points) or threshold < 3:
+        return list(points)
+
+    sampled = [points[0]]
+    bucket_size = (len(points) - 2) / (threshold - 2)
+    kept = 0
+
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, len(points))
+        next_bucket = points[next_start:next_end] or [points[-1]]
+        avg_x = sum(x(p) for p in next_bucket) / len(next_bucket)
+        avg_y = sum(y(p) for p in next_bucket) / len(next_bucket)
+
+        ax, ay = x(points[kept]), y(points[kept])
+        best_area = -1.0
+        best = start
+        for j in range(start, end):
+            area = abs((ax - avg_x) * (y(points[j]) - ay) - (ax - x(points[j])) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+
+        sampled.append(points[best])
+        kept = best
+
+    sampled.append(points[-1])
+    return sampled
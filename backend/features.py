@@ -0,0 +1,122 @@
+"""
+Feature routers imported on first use.
+
+The API is split into feature modules under routers/ (core, business
+analytics, social). Each module defines a `router` and may define
+    async def startup()    run once, after the routes are added
+    async def shutdown()   run on app shutdown if startup ran
+Declaring models and routes is most of the app's import time, so a worker
+only pays for the features it serves. `FeatureRouters.include()` imports a
+feature and adds its routes; `load()` also runs its startup, once, even
+under concurrent first requests.
+
+`LazyFeatureMiddleware` sits in front of routing. A request under one of a
+feature's path prefixes loads that feature before it is routed, so the
+first request pays the import (tens of ms, on the event loop) and every
+later one finds the routes already in place. The OpenAPI schema and docs
+pages load every feature, so they always describe the whole API.
+Set LAZY_ROUTERS=false to load everything during startup instead.
+"""
+
+import asyncio
+import importlib
+import logging
+import os
+import time
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+
+def lazy_from_env() -> bool:
+    return os.environ.get("LAZY_ROUTERS", "true").lower() != "false"
+
+
+@dataclass(frozen=True)
+class Feature:
+    name: str
+    module: str
+    # Requests under these paths need the feature's routes; empty for
+    # features the app includes up front
+    prefixes: Tuple[str, ...] = ()
+
+    def serves(self, path: str) -> bool:
+        return any(path == prefix or path.startswith(prefix + "/") for prefix in self.prefixes)
+
+
+class FeatureRouters:
+    def __init__(self, app: FastAPI, features: Sequence[Feature]):
+        self.app = app
+        self.features: Dict[str, Feature] = {feature.name: feature for feature in features}
+        self.modules: Dict[str, ModuleType] = {}
+        self._started: List[str] = []
+        self._lock = asyncio.Lock()
+
+    def include(self, name: str) -> ModuleType:
+        """Import a feature and add its routes (no startup); returns its module"""
+        module = self.modules.get(name)
+        if module is None:
+            start = time.perf_counter()
+            module = importlib.import_module(self.features[name].module)
+            self.app.include_router(module.router)
+            # Rebuilt with the new routes on the next /openapi.json
+            self.app.openapi_schema = None
+            self.modules[name] = module
+            logger.info("Loaded %s routes in %.0f ms", name, (time.perf_counter() - start) * 1000)
+        return module
+
+    async def load(self, name: str) -> ModuleType:
+        """Include a feature and run its startup hook, once"""
+        if name in self._started:
+            return self.modules[name]
+        async with self._lock:
+            module = self.include(name)
+            if name not in self._started:
+                startup = getattr(module, "startup", None)
+                if startup:
+                    await startup()
+                self._started.append(name)
+        return module
+
+    async def load_all(self):
+        for name in self.features:
+            await self.load(name)
+
+    async def shutdown(self):
+        """Run the shutdown hooks of started features, last started first"""
+        while self._started:
+            shutdown = getattr(self.modules[self._started.pop()], "shutdown", None)
+            if shutdown:
+                await shutdown()
+
+    def feature_for(self, path: str) -> Optional[str]:
+        for feature in self.features.values():
+            if feature.name not in self._started and feature.serves(path):
+                return feature.name
+        return None
+
+
+class LazyFeatureMiddleware:
+    """ASGI middleware loading the feature a request needs before it is routed"""
+
+    def __init__(self, app, features: FeatureRouters):
+        self.app = app
+        self.features = features
+        fastapi_app = features.app
+        self.schema_paths = {path for path in (fastapi_app.openapi_url, fastapi_app.docs_url,
+                                               fastapi_app.redoc_url) if path}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            path = scope["path"]
+            if path in self.schema_paths:
+                await self.features.load_all()
+            else:
+                name = self.features.feature_for(path)
+                if name:
+                    await self.features.load(name)
+        await self.app(scope, receive, send)
@@ -0,0 +1,226 @@
+"""
+Streaming CSV / NDJSON import into a collection resource.
+
+The file is parsed as it arrives, one chunk at a time, and every row is
+validated on its own against the resource's Pydantic model. Valid rows are
+written with unordered `insert_many` batches, and the next batch is parsed
+while the previous one is in flight. Memory stays at about two batches
+whatever the size of the file. Invalid rows go into the report with their
+row number and don't stop the import.
+
+Upload (the file is the raw request body, so nothing is spooled to disk):
+    curl -X POST --data-binary @revenue.csv 'localhost:8001/api/revenue/import?format=csv'
+
+CLI (from backend/):
+    python importer.py revenue revenue.csv --batch-size 2000
+"""
+
+import asyncio
+import codecs
+import csv
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, AsyncIterator, List, Optional, Tuple, Union
+
+import orjson
+from bson import ObjectId
+from pydantic import ValidationError
+from pymongo.errors import BulkWriteError
+
+from bulk import validation_message
+
+if TYPE_CHECKING:
+    from crud import Resource
+
+IMPORT_BATCH_SIZE = 1000
+MAX_IMPORT_BATCH_SIZE = 10000
+# Rows past this many errors are still counted, just not listed
+MAX_REPORTED_ERRORS = 1000
+READ_CHUNK_SIZE = 1 << 20
+
+# (row number, parsed row or the reason it could not be parsed)
+Record = Tuple[int, Union[dict, str]]
+
+
+async def _ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    pending = b""
+    row = 0
+    async for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            if not line.strip():
+                continue
+            row += 1
+            yield row, _json_row(line)
+    if pending.strip():
+        yield row + 1, _json_row(pending)
+
+
+def _json_row(line: bytes) -> Union[dict, str]:
+    try:
+        value = orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        return f"Invalid JSON: {e}"
+    return value if isinstance(value, dict) else "Expected a JSON object"
+
+
+async def _csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    header: Optional[List[str]] = None
+    pending = ""
+    row = 0
+
+    def rows(lines: List[str]):
+        nonlocal header, row
+        for values in csv.reader(lines):
+            if not values:
+                continue
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            row += 1
+            # Empty cells are missing values, so the model's defaults apply
+            yield row, {name: value for name, value in zip(header, values) if value != ""}
+
+    async for chunk in chunks:
+        lines = (pending + decoder.decode(chunk)).split("\n")
+        tail = lines.pop()
+        # A quoted field can span lines (and chunks): only hand csv the lines
+        # up to the last newline that falls outside quotes
+        quoted, cut = False, 0
+        for i, line in enumerate(lines):
+            if line.count('"') % 2:
+                quoted = not quoted
+            if not quoted:
+                cut = i + 1
+        pending = "\n".join(lines[cut:] + [tail])
+        for record in rows([line + "\n" for line in lines[:cut]]):
+            yield record
+    pending += decoder.decode(b"", final=True)
+    if pending.strip():
+        for record in rows(pending.split("\n")):
+            yield record
+
+
+async def file_chunks(path: str, chunk_size: int = READ_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+async def import_stream(
+    db,
+    resource: "Resource",
+    chunks: AsyncIterator[bytes],
+    import_format: str,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    max_errors: int = MAX_REPORTED_ERRORS,
+) -> dict:
+    """Validate and insert every row of `chunks`; returns counts, rows/sec and the row errors"""
+    collection = db[resource.collection]
+    records = _csv_records(chunks) if import_format == "csv" else _ndjson_records(chunks)
+    counts = {"rows": 0, "inserted": 0, "failed": 0}
+    errors: List[dict] = []
+
+    def fail(row: int, message: str):
+        counts["failed"] += 1
+        if len(errors) < max_errors:
+            errors.append({"row": row, "error": message})
+
+    async def flush(batch: List[Tuple[int, dict]]):
+        failed = set()
+        try:
+            await collection.insert_many([doc for _, doc in batch], ordered=False)
+        except BulkWriteError as e:
+            for write_error in e.details.get("writeErrors", []):
+                failed.add(write_error["index"])
+                fail(batch[write_error["index"]][0], write_error.get("errmsg", "Write failed"))
+        inserted = [doc for i, (_, doc) in enumerate(batch) if i not in failed]
+        counts["inserted"] += len(inserted)
+        if resource.after_write and inserted:
+            await resource.after_write([(None, doc) for doc in inserted])
+
+    start = time.perf_counter()
+    batch: List[Tuple[int, dict]] = []
+    in_flight: Optional[asyncio.Task] = None
+    try:
+        async for row, raw in records:
+            counts["rows"] += 1
+            if isinstance(raw, str):
+                fail(row, raw)
+                continue
+            try:
+                doc = resource.model(**raw).dict()
+            except ValidationError as e:
+                fail(row, validation_message(e))
+                continue
+            if resource.prepare:
+                doc = resource.prepare(doc)
+            if resource.syncable:
+                doc["updated_date"] = datetime.utcnow()
+            doc["_id"] = ObjectId()
+            batch.append((row, doc))
+            if len(batch) >= batch_size:
+                if in_flight:
+                    await in_flight
+                in_flight = asyncio.create_task(flush(batch))
+                batch = []
+        if in_flight:
+            await in_flight
+        if batch:
+            await flush(batch)
+    except BaseException:
+        if in_flight and not in_flight.done():
+            in_flight.cancel()
+        raise
+
+    elapsed = time.perf_counter() - start
+    return {
+        **counts,
+        "elapsed_s": round(elapsed, 3),
+        "rows_per_sec": round(counts["rows"] / elapsed, 1) if elapsed > 0 else None,
+        "errors": errors,
+        "errors_truncated": counts["failed"] > len(errors),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+
+    parser = argparse.ArgumentParser(description="Import a CSV or NDJSON file into a collection resource")
+    parser.add_argument("resource", help="resource path, e.g. revenue or performance")
+    parser.add_argument("file")
+    parser.add_argument("--format", choices=["csv", "ndjson"],
+                        help="defaults to the file extension (.csv, otherwise ndjson)")
+    parser.add_argument("--batch-size", type=int, default=IMPORT_BATCH_SIZE)
+    args = parser.parse_args()
+
+    # server loads .env and builds the client; each feature router defines its resources with their hooks.
+    # Routes are only included: startup hooks would start the post scheduler and recurring generator.
+    import server
+    from rollups import ensure_revenue_rollup
+
+    for name in server.features.features:
+        server.features.include(name)
+    resource = server.importable_resources.get(args.resource)
+    if resource is None:
+        parser.error(f"resource must be one of: {', '.join(server.importable_resources)}")
+    import_format = args.format or ("csv" if args.file.lower().endswith(".csv") else "ndjson")
+
+    async def main():
+        db = server.get_db()
+        try:
+            if resource.collection == "revenue":
+                # The revenue hook updates the rollup incrementally, so it has to exist first
+                await ensure_revenue_rollup(db)
+            report = await import_stream(db, resource, file_chunks(args.file), import_format,
+                                         args.batch_size)
+            if report["inserted"]:
+                await server.response_cache.invalidate(resource.collection)
+            print(json.dumps(report, indent=2))
+        finally:
+            server.get_database().close()
+
+    asyncio.run(main())
@@ -0,0 +1,146 @@
+"""
+Declarative index registry for every hot query path.
+
+Each entry names the collection, the key pattern and the queries it serves.
+`ensure_indexes` is applied at app startup and is idempotent: MongoDB skips
+indexes that already exist with the same name and key pattern.
+
+Report missing indexes and usage stats from the command line:
+    python -m indexes            # report only
+    python -m indexes --apply    # create missing indexes, then report
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from sync import TOMBSTONE_RETENTION, TOMBSTONES
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    collection: str
+    keys: Tuple[Tuple[str, int], ...]
+    serves: str
+    options: Dict = field(default_factory=dict)
+
+    @property
+    def name(self) -> str:
+        return "_".join(f"{key}_{direction}" for key, direction in self.keys)
+
+    def model(self) -> IndexModel:
+        return IndexModel(list(self.keys), name=self.name, **self.options)
+
+
+INDEXES: List[IndexSpec] = [
+    IndexSpec("calendar", (("scheduled_date", ASCENDING),),
+              "dashboard upcoming calendar items"),
+    IndexSpec("tasks", (("status", ASCENDING), ("due_date", ASCENDING)),
+              "dashboard pending/urgent tasks"),
+    IndexSpec("tasks", (("recurring_task_id", ASCENDING), ("occurrence_date", ASCENDING)),
+              "one task per recurring occurrence (idempotent generation)",
+              {"unique": True, "partialFilterExpression": {"recurring_task_id": {"$type": "string"},
+                                                 "occurrence_date": {"$type": "date"}}}),
+    IndexSpec("revenue", (("payment_date", DESCENDING), ("_id", DESCENDING)),
+              "revenue list pages, monthly dashboard income"),
+    IndexSpec("revenue", (("payment_status", ASCENDING), ("payment_date", DESCENDING)),
+              "category summary status/date windows"),
+    IndexSpec("performance", (("recorded_date", DESCENDING), ("_id", DESCENDING)),
+              "performance list pages, trends"),
+    IndexSpec("performance", (("views", DESCENDING), ("_id", DESCENDING)),
+              "top content by views"),
+    IndexSpec("performance", (("engagement_rate", DESCENDING), ("_id", DESCENDING)),
+              "top content by engagement, engagement_rate backfill"),
+    IndexSpec("ideas", (("created_date", DESCENDING), ("_id", DESCENDING)),
+              "idea list pages"),
+    IndexSpec("recurring_tasks", (("is_active", ASCENDING), ("next_due_date", ASCENDING)),
+              "due recurring templates"),
+    IndexSpec("scheduled_posts", (("status", ASCENDING), ("scheduled_date", ASCENDING)),
+              "status-filtered post list"),
+    IndexSpec("scheduled_posts", (("status", ASCENDING), ("due_at", ASCENDING), ("priority_rank", ASCENDING)),
+              "dispatch queue refill"),
+    IndexSpec("scheduled_posts", (("scheduled_date", ASCENDING), ("_id", ASCENDING)),
+              "scheduled post list pages, content calendar"),
+    IndexSpec("scheduled_posts", (("status", ASCENDING), ("lease_expires_at", ASCENDING)),
+              "scheduler release of expired publishing leases"),
+    IndexSpec("posting_logs", (("platform", ASCENDING), ("posted_at", DESCENDING)),
+              "posting history filtered by platform"),
+    IndexSpec("posting_logs", (("posted_at", DESCENDING),),
+              "posting history"),
+    IndexSpec("videos", (("updated_date", ASCENDING),),
+              "delta sync changes"),
+    IndexSpec("study_notes", (("updated_date", ASCENDING),),
+              "delta sync changes"),
+    IndexSpec("calendar", (("updated_date", ASCENDING),),
+              "delta sync changes"),
+    IndexSpec("tasks", (("updated_date", ASCENDING),),
+              "delta sync changes"),
+    IndexSpec("ideas", (("updated_date", ASCENDING),),
+              "delta sync changes, idea search refresh"),
+    IndexSpec(TOMBSTONES, (("deleted_date", ASCENDING),),
+              "delta sync deletes, tombstone expiry",
+              {"expireAfterSeconds": int(TOMBSTONE_RETENTION.total_seconds())}),
+]
+
+
+def _by_collection() -> Dict[str, List[IndexSpec]]:
+    grouped: Dict[str, List[IndexSpec]] = {}
+    for spec in INDEXES:
+        grouped.setdefault(spec.collection, []).append(spec)
+    return grouped
+
+
+async def ensure_indexes(db) -> Dict[str, List[str]]:
+    """Create every registered index; returns the index names per collection"""
+    created = {}
+    for collection, specs in _by_collection().items():
+        created[collection] = await db[collection].create_indexes([spec.model() for spec in specs])
+    return created
+
+
+async def index_report(db) -> Dict[str, Dict]:
+    """Compare the registry against the live indexes and attach $indexStats usage"""
+    report = {}
+    for collection, specs in _by_collection().items():
+        existing = await db[collection].index_information()
+        existing_keys = {tuple((k, int(d)) for k, d in info["key"]) for info in existing.values()}
+        usage = await db[collection].aggregate([{"$indexStats": {}}]).to_list(None)
+        report[collection] = {
+            "missing": [spec.name for spec in specs if spec.keys not in existing_keys],
+            "usage": {
+                stat["name"]: {
+                    "ops": stat["accesses"]["ops"],
+                    "since": stat["accesses"]["since"],
+                }
+                for stat in usage
+            },
+        }
+    return report
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+    import json
+    import os
+    from pathlib import Path
+
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description="Report (and optionally create) registered MongoDB indexes")
+    parser.add_argument("--apply", action="store_true", help="create missing indexes before reporting")
+    args = parser.parse_args()
+
+    load_dotenv(Path(__file__).parent / '.env')
+
+    async def main():
+        client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+        db = client[os.environ['DB_NAME']]
+        if args.apply:
+            await ensure_indexes(db)
+        print(json.dumps(await index_report(db), indent=2, default=str))
+        client.close()
+
+    asyncio.run(main())
@@ -0,0 +1,270 @@
+"""
+Request latency and MongoDB round-trip instrumentation.
+
+`MetricsMiddleware` times every HTTP request and records, per route template
+(e.g. /api/tasks/{item_id}, never the raw path):
+    http_request_duration_seconds   latency histogram, by method/route/status
+    http_response_size_bytes        body size histogram
+    http_requests_in_flight         requests currently being handled
+    http_request_db_calls           MongoDB round trips per request
+    http_request_db_seconds         time spent in those round trips
+
+`CommandTimer` is a pymongo command listener. Motor runs each operation on
+its executor with a copy of the caller's contextvars, so the listener finds
+the `RequestStats` of the request that issued the command and adds the round
+trip to it. Commands issued outside a request (scheduler, recurring
+generator) only go into the global mongodb_command_duration_seconds.
+
+Everything is exported in the Prometheus text format by `Metrics.render()`
+(served at /metrics). With SERVER_TIMING_ENABLED=true every response also
+carries a Server-Timing header, so the browser's network panel shows the
+app and db times:
+    Server-Timing: app;dur=12.4, db;dur=8.1;desc="3 calls"
+Requests slower than SLOW_REQUEST_MS (default 1000) are logged with the
+same breakdown.
+"""
+
+import logging
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from pymongo import monitoring
+from starlette.routing import Match
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+DB_CALL_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+INF_BUCKET = 'le="+Inf"'
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Histogram:
+    # observe() is also called from Motor's executor threads
+    def __init__(self, name: str, help: str, labels: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Labels, List[float]] = {}  # per-bucket counts, then sum, then count
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Labels, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 2)
+            if index < len(self.buckets):
+                series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = {labels: list(values) for labels, values in self._series.items()}
+        for labels, values in sorted(series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, values):
+                cumulative += count
+                le = f'le="{_format_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labels, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labels, labels, INF_BUCKET)} {values[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labels, labels)} {_format_number(values[-2])}")
+            lines.append(f"{self.name}_count{_format_labels(self.labels, labels)} {values[-1]}")
+        return lines
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self.value = 0
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}", f"{self.name} {self.value}"]
+
+
+class Counter(Gauge):
+    kind = "counter"
+
+
+class Metrics:
+    def __init__(self):
+        self.in_flight = Gauge("http_requests_in_flight", "HTTP requests currently being handled")
+        self.latency = Histogram(
+            "http_request_duration_seconds", "HTTP request latency",
+            ("method", "route", "status"), LATENCY_BUCKETS,
+        )
+        self.response_size = Histogram(
+            "http_response_size_bytes", "HTTP response body size",
+            ("method", "route"), SIZE_BUCKETS,
+        )
+        self.request_db_calls = Histogram(
+            "http_request_db_calls", "MongoDB round trips per HTTP request",
+            ("method", "route"), DB_CALL_BUCKETS,
+        )
+        self.request_db_seconds = Histogram(
+            "http_request_db_seconds", "Time spent in MongoDB round trips per HTTP request",
+            ("method", "route"), LATENCY_BUCKETS,
+        )
+        self.db_command = Histogram(
+            "mongodb_command_duration_seconds", "MongoDB command latency",
+            ("command", "outcome"), DB_LATENCY_BUCKETS,
+        )
+        self.extra: list = []
+
+    def register(self, *collectors):
+        """Export more gauges / counters / histograms (e.g. the connection pool's)"""
+        self.extra.extend(collectors)
+
+    def render(self) -> bytes:
+        lines = []
+        for metric in (self.in_flight, self.latency, self.response_size,
+                       self.request_db_calls, self.request_db_seconds, self.db_command, *self.extra):
+            lines.extend(metric.render())
+        return ("\n".join(lines) + "\n").encode()
+
+
+@dataclass
+class RequestStats:
+    db_calls: int = 0
+    db_seconds: float = 0.0
+
+
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+
+class CommandTimer(monitoring.CommandListener):
+    """Command listener feeding `metrics` and the current request's `RequestStats`"""
+
+    def __init__(self, metrics: Metrics):
+        self.metrics = metrics
+        self._lock = threading.Lock()
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self._record(event, "ok")
+
+    def failed(self, event):
+        self._record(event, "failed")
+
+    def _record(self, event, outcome: str):
+        seconds = event.duration_micros / 1_000_000
+        self.metrics.db_command.observe((event.command_name, outcome), seconds)
+        stats = _current_request.get()
+        if stats is not None:
+            # A request's gathered queries complete on different executor threads
+            with self._lock:
+                stats.db_calls += 1
+                stats.db_seconds += seconds
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing every HTTP request into `metrics`"""
+
+    def __init__(self, app, metrics: Metrics, server_timing: bool = False,
+                 slow_request_seconds: Optional[float] = None):
+        self.app = app
+        self.metrics = metrics
+        self.server_timing = server_timing
+        self.slow_request_seconds = slow_request_seconds
+        self._route_paths: Optional[Dict[object, str]] = None
+        self._route_count = 0
+
+    @classmethod
+    def options_from_env(cls) -> dict:
+        slow_ms = float(os.environ.get("SLOW_REQUEST_MS", 1000))
+        return {
+            "server_timing": os.environ.get("SERVER_TIMING_ENABLED", "false").lower() == "true",
+            "slow_request_seconds": slow_ms / 1000 if slow_ms > 0 else None,
+        }
+
+    def _route(self, scope) -> str:
+        """The matched route's path template, so /api/tasks/<id> is one series"""
+        routes = scope["app"].routes
+        # Feature routers add routes after the first request (see features.py)
+        if self._route_paths is None or self._route_count != len(routes):
+            self._route_count = len(routes)
+            self._route_paths = {route.endpoint: route.path for route in routes if hasattr(route, "endpoint")}
+        path = self._route_paths.get(scope.get("endpoint"))
+        if path:
+            return path
+        # Responses served before routing (e.g. cache hits) carry no endpoint
+        for route in routes:
+            if route.matches(scope)[0] == Match.FULL:
+                return route.path
+        return "unmatched"
+
+    def _timing_header(self, elapsed: float, stats: RequestStats) -> bytes:
+        return (f"app;dur={elapsed * 1000:.1f}, "
+                f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.db_calls} calls"').encode()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        start = time.perf_counter()
+        status, size = 500, 0
+
+        async def instrumented_send(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    headers = [*message.get("headers", []),
+                               (b"server-timing", self._timing_header(time.perf_counter() - start, stats))]
+                    message = {**message, "headers": headers}
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        self.metrics.in_flight.value += 1
+        try:
+            await self.app(scope, receive, instrumented_send)
+        finally:
+            self.metrics.in_flight.value -= 1
+            _current_request.reset(token)
+            elapsed = time.perf_counter() - start
+            method, route = scope["method"], self._route(scope)
+            self.metrics.latency.observe((method, route, str(status)), elapsed)
+            self.metrics.response_size.observe((method, route), size)
+            self.metrics.request_db_calls.observe((method, route), stats.db_calls)
+            self.metrics.request_db_seconds.observe((method, route), stats.db_seconds)
+            if self.slow_request_seconds is not None and elapsed >= self.slow_request_seconds:
+                logger.warning(
+                    "Slow request: %s %s -> %s in %.0f ms (%d db calls, %.0f ms in db)",
+                    method, scope["path"], status, elapsed * 1000, stats.db_calls, stats.db_seconds * 1000,
+                )
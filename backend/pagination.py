@@ -0,0 +1,93 @@
+"""
+Keyset (cursor) pagination shared by the collection list endpoints.
+
+A page is ordered by (sort_field, _id) and the cursor encodes the last
+(sort_field, _id) pair that was returned, so fetching the next page is a
+range seek on that compound key instead of a skip over earlier rows.
+"""
+
+import base64
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from bson import ObjectId, json_util
+from fastapi import HTTPException, Query
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+class PageParams:
+    """Query parameters accepted by every paginated list endpoint"""
+
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        after: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    ):
+        self.limit = limit
+        self.after = after
+
+
+def encode_cursor(doc: dict, sort_field: str) -> str:
+    payload = json_util.dumps({"v": doc.get(sort_field), "id": doc["_id"]})
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, ObjectId]:
+    try:
+        payload = json_util.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return payload["v"], payload["id"]
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _after_filter(sort_field: str, value: Any, last_id: ObjectId, direction: int) -> dict:
+    op = "$gt" if direction == 1 else "$lt"
+    if sort_field == "_id":
+        return {"_id": {op: last_id}}
+
+    # Documents without the sort field sort before every value ascending and
+    # after every value descending, so they are reached last in either case
+    same_value = {sort_field: value, "_id": {op: last_id}}
+    if value is None:
+        return {"$or": [same_value, {sort_field: {"$ne": None}}]} if direction == 1 else same_value
+    clauses = [{sort_field: {op: value}}, same_value]
+    if direction == -1:
+        clauses.append({sort_field: None})
+    return {"$or": clauses}
+
+
+async def paginate(
+    collection,
+    page: PageParams,
+    query: Optional[dict] = None,
+    sort_field: str = "_id",
+    direction: int = 1,
+    projection: Optional[Dict[str, int]] = None,
+    transform: Optional[Callable[[dict], dict]] = None,
+) -> Dict[str, Any]:
+    """Return one page of `collection` as {"items": [...], "next_cursor": str | None}
+
+    A `projection` always keeps the sort field, which the cursor is built from.
+    """
+    query = dict(query or {})
+    if page.after:
+        value, last_id = decode_cursor(page.after)
+        after = _after_filter(sort_field, value, last_id, direction)
+        query = {"$and": [query, after]} if query else after
+
+    sort = [(sort_field, direction)]
+    if sort_field != "_id":
+        sort.append(("_id", direction))
+
+    if projection:
+        projection = {**projection, sort_field: 1}
+
+    docs = await collection.find(query, projection).sort(sort).limit(page.limit + 1).to_list(page.limit + 1)
+    has_more = len(docs) > page.limit
+    docs = docs[:page.limit]
+    next_cursor = encode_cursor(docs[-1], sort_field) if has_more else None
+
+    if transform:
+        docs = [transform(doc) for doc in docs]
+    return {"items": docs, "next_cursor": next_cursor}
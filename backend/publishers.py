@@ -0,0 +1,218 @@
+"""
+Publisher pool that sends scheduled posts to the social platforms.
+
+A `Publisher` knows how to post to one platform. `PublisherPool` puts a
+bounded pool of concurrent publishes per platform in front of it:
+
+* every attempt first takes a token from the platform's token bucket, so a
+  backlog drains at the platform's allowed rate and no faster
+* a `PublishError(retryable=True)` is retried with exponential backoff and
+  full jitter, up to `max_attempts`
+* once retries are exhausted the post is dead-lettered (`DeadLetterError`);
+  a non-retryable error fails it immediately
+
+Rate limits are read from PUBLISH_RATE_LIMITS, a JSON object keyed by
+platform, with "*" as the fallback for platforms that aren't listed:
+    PUBLISH_RATE_LIMITS='{"instagram": {"rate": 0.5, "burst": 5, "workers": 2}, "*": {"rate": 1}}'
+
+PUBLISHER_BACKEND picks the implementation: "placeholder" (default, marks
+posts as published until the OAuth integrations land) or "fake" (configurable
+latency and failures, for tests and benchmarks). The pool's clock, sleep and
+jitter source are injectable, so tests can check its timing without waiting.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = {"rate": 1.0, "burst": 5, "workers": 4}
+
+
+class PublishError(Exception):
+    def __init__(self, message: str, retryable: bool = True):
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class DeadLetterError(PublishError):
+    """Raised once a post has used up its retries"""
+
+    def __init__(self, message: str, attempts: int):
+        super().__init__(message, retryable=False)
+        self.attempts = attempts
+
+
+@dataclass
+class RateLimit:
+    rate: float  # tokens per second
+    burst: int  # bucket size
+    workers: int  # concurrent publishes
+
+
+def load_rate_limits(raw: Optional[str] = None) -> Dict[str, RateLimit]:
+    config = json.loads(raw if raw is not None else os.environ.get("PUBLISH_RATE_LIMITS", "{}"))
+    fallback = {**DEFAULT_LIMIT, **config.pop("*", {})}
+    limits = {"*": RateLimit(**fallback)}
+    for platform, limit in config.items():
+        limits[platform] = RateLimit(**{**fallback, **limit})
+    return limits
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int,
+                 clock: Callable[[], float] = time.monotonic, sleep=asyncio.sleep):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self):
+        # The lock queues waiters so tokens are handed out in arrival order
+        async with self._lock:
+            self._refill()
+            while self.tokens < 1:
+                await self.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+
+class Publisher:
+    """Posts one scheduled post to its platform and returns the platform's response"""
+
+    async def publish(self, post: dict) -> Dict:
+        raise NotImplementedError
+
+
+class PlaceholderPublisher(Publisher):
+    async def publish(self, post: dict) -> Dict:
+        return {
+            "platform_post_id": "auto_" + str(post["_id"])[:8],
+            "response_data": {"note": "Auto-posted (OAuth pending)"},
+        }
+
+
+class FakePublisher(Publisher):
+    """In-memory publisher with configurable latency and failure rate"""
+
+    def __init__(self, latency: float = 0.0, failure_rate: float = 0.0,
+                 retryable: bool = True, seed: Optional[int] = None):
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.retryable = retryable
+        self.random = random.Random(seed)
+        self.published: List[dict] = []
+        self.attempts = 0
+
+    async def publish(self, post: dict) -> Dict:
+        self.attempts += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.random.random() < self.failure_rate:
+            raise PublishError("fake publisher failure", retryable=self.retryable)
+        self.published.append(post)
+        return {"platform_post_id": f"fake_{uuid.uuid4().hex[:12]}", "response_data": {"fake": True}}
+
+
+PUBLISHER_BACKENDS = {"placeholder": PlaceholderPublisher, "fake": FakePublisher}
+
+
+class PublisherPool:
+    def __init__(
+        self,
+        publishers: Dict[str, Publisher],
+        limits: Optional[Dict[str, RateLimit]] = None,
+        max_attempts: int = 5,
+        backoff_base: float = 2.0,
+        backoff_max: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep=asyncio.sleep,
+        rng: Optional[random.Random] = None,
+    ):
+        self.publishers = publishers
+        self.limits = limits or load_rate_limits("{}")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.clock = clock
+        self.sleep = sleep
+        # Draws the backoff jitter
+        self.random = rng or random.Random()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._slots: Dict[str, asyncio.Semaphore] = {}
+
+    @classmethod
+    def from_env(cls, **kwargs) -> "PublisherPool":
+        backend = PUBLISHER_BACKENDS[os.environ.get("PUBLISHER_BACKEND", "placeholder")]
+        return cls(
+            {"*": backend()},
+            limits=load_rate_limits(),
+            max_attempts=int(os.environ.get("PUBLISH_MAX_ATTEMPTS", 5)),
+            backoff_base=float(os.environ.get("PUBLISH_BACKOFF_SECONDS", 2.0)),
+            **kwargs,
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Publishes that can be in flight at once across the configured platforms"""
+        return sum(limit.workers for limit in self.limits.values())
+
+    def _limit(self, platform: str) -> RateLimit:
+        return self.limits.get(platform) or self.limits["*"]
+
+    def _publisher(self, platform: str) -> Publisher:
+        publisher = self.publishers.get(platform) or self.publishers.get("*")
+        if publisher is None:
+            raise PublishError(f"No publisher for platform {platform!r}", retryable=False)
+        return publisher
+
+    def _bucket(self, platform: str) -> TokenBucket:
+        if platform not in self._buckets:
+            limit = self._limit(platform)
+            self._buckets[platform] = TokenBucket(limit.rate, limit.burst, clock=self.clock, sleep=self.sleep)
+        return self._buckets[platform]
+
+    def _worker_slots(self, platform: str) -> asyncio.Semaphore:
+        if platform not in self._slots:
+            self._slots[platform] = asyncio.Semaphore(self._limit(platform).workers)
+        return self._slots[platform]
+
+    def backoff(self, attempt: int) -> float:
+        return self.random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1)))
+
+    async def publish(self, post: dict) -> Dict:
+        """Publish through the platform's worker pool, retrying transient failures"""
+        platform = post.get("platform", "unknown")
+        publisher = self._publisher(platform)
+        for attempt in range(1, self.max_attempts + 1):
+            async with self._worker_slots(platform):
+                await self._bucket(platform).acquire()
+                try:
+                    return await publisher.publish(post)
+                except PublishError as e:
+                    error = e
+                except Exception as e:
+                    error = PublishError(str(e))
+            if not error.retryable:
+                raise error
+            if attempt < self.max_attempts:
+                delay = self.backoff(attempt)
+                logger.info("Retrying post %s on %s in %.1fs (attempt %d): %s",
+                            post.get("_id"), platform, delay, attempt, error)
+                await self.sleep(delay)
+        raise DeadLetterError(f"Gave up after {self.max_attempts} attempts: {error}", self.max_attempts)
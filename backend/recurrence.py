@@ -0,0 +1,296 @@
+"""
+Recurring task generation.
+
+A recurring template's `next_due_date` is its next occurrence. Each run finds
+the active templates that are due, creates a task for every occurrence that
+has come due since (catching up on missed periods), and moves
+`next_due_date` to the first occurrence still in the future.
+
+Occurrences follow the calendar. `frequency` is daily, weekly or monthly and
+`frequency_detail` narrows it down:
+    "Every Monday", "Mon, Thu", "Weekdays"      -> those days of the week
+    "1st of month", "15th", "Last day of month" -> that day of each month
+    "1st Monday of month", "Last Friday"         -> that weekday of each month
+Without a detail, weekly repeats on the same weekday and monthly on the same
+day of the month, clamped to shorter months (Jan 31 -> Feb 29 -> Mar 31).
+That day is the template's `anchor_day`, taken from its first due date (and
+again whenever next_due_date is edited), so a clamped occurrence doesn't
+become the new anchor.
+
+Templates are processed in batches: one insert_many for the new tasks and one
+bulk_write for the template advances per batch, instead of two round trips
+per template. `RecurringTaskGenerator` runs this on a background interval.
+
+Generation is idempotent, so any number of processes can run it at once:
+every generated task carries (recurring_task_id, occurrence_date), which is
+unique on tasks, and duplicate inserts are dropped; a template only advances
+if its next_due_date is still the value the occurrences were computed from.
+Tasks are inserted before the advance, so a crash in between just means the
+next run re-inserts (and drops) the same occurrences.
+"""
+
+import asyncio
+import calendar
+import logging
+import re
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+DUPLICATE_KEY = 11000
+
+# Stop catching up on a single template after this many occurrences per run;
+# the rest are generated by the following runs
+MAX_CATCH_UP = 366
+
+WEEKDAY_NAMES = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+ORDINALS = {"1st": 1, "first": 1, "2nd": 2, "second": 2, "3rd": 3, "third": 3,
+            "4th": 4, "fourth": 4, "last": -1}
+LAST = -1
+
+
+@dataclass(frozen=True)
+class Rule:
+    frequency: str  # daily, weekly, monthly
+    weekdays: FrozenSet[int] = frozenset()
+    month_day: Optional[int] = None  # 1-31 or LAST
+    nth: Optional[int] = None  # with one weekday: 1-4 or LAST ("1st Monday of month")
+
+
+def _weekday(word: str) -> Optional[int]:
+    word = word[:-1] if word.endswith("s") else word  # "Mondays", "Tues"
+    if len(word) < 3:
+        return None
+    for index, name in enumerate(WEEKDAY_NAMES):
+        if name.startswith(word):
+            return index
+    return None
+
+
+def parse_rule(frequency: Optional[str], detail: Optional[str]) -> Rule:
+    frequency = (frequency or "weekly").lower()
+    text = (detail or "").lower()
+    words = re.findall(r"[a-z0-9]+", text)
+    monthly = frequency == "monthly" or "month" in text
+
+    weekdays = set()
+    for word in words:
+        if word in ("weekday", "weekdays"):
+            weekdays.update(range(5))
+        elif word in ("weekend", "weekends"):
+            weekdays.update((5, 6))
+        elif _weekday(word) is not None:
+            weekdays.add(_weekday(word))
+
+    nth = next((ORDINALS[word] for word in words if word in ORDINALS), None)
+    if weekdays:
+        if monthly and nth is not None and len(weekdays) == 1:
+            return Rule("monthly", weekdays=frozenset(weekdays), nth=nth)
+        return Rule("weekly", weekdays=frozenset(weekdays))
+
+    if monthly:
+        if "last" in words:
+            return Rule("monthly", month_day=LAST)
+        day = next((int(m) for m in re.findall(r"\b(\d{1,2})(?:st|nd|rd|th)?\b", text)), None)
+        return Rule("monthly", month_day=day if day and 1 <= day <= 31 else None)
+
+    return Rule(frequency if frequency in ("daily", "weekly") else "weekly")
+
+
+def _in_month(value: datetime, months: int, rule: Rule, anchor_day: int) -> datetime:
+    """`value` moved `months` months on, to the rule's day of that month"""
+    month_index = value.month - 1 + months
+    year, month = value.year + month_index // 12, month_index % 12 + 1
+    first_weekday, last = calendar.monthrange(year, month)
+    if rule.nth is not None:
+        weekday = next(iter(rule.weekdays))
+        first = 1 + (weekday - first_weekday) % 7
+        if rule.nth == LAST:
+            day = first + 7 * ((last - first) // 7)
+        else:
+            day = min(first + 7 * (rule.nth - 1), last)
+    else:
+        day = last if anchor_day == LAST else min(anchor_day, last)
+    return value.replace(year=year, month=month, day=day)
+
+
+def next_occurrence(rule: Rule, current: datetime, anchor_day: Optional[int] = None) -> datetime:
+    """The first occurrence strictly after `current`, keeping its time of day.
+
+    `anchor_day` is the day of month a monthly rule without its own day repeats
+    on; it defaults to `current`'s day.
+    """
+    if rule.frequency == "daily":
+        return current + timedelta(days=1)
+    if rule.frequency == "weekly":
+        if not rule.weekdays:
+            return current + timedelta(weeks=1)
+        return next(current + timedelta(days=days) for days in range(1, 8)
+                    if (current + timedelta(days=days)).weekday() in rule.weekdays)
+    anchor_day = rule.month_day or anchor_day or current.day
+    this_month = _in_month(current, 0, rule, anchor_day)
+    return this_month if this_month > current else _in_month(current, 1, rule, anchor_day)
+
+
+def _utc(value: datetime) -> datetime:
+    # next_due_date is read back from MongoDB as naive UTC
+    return value.astimezone(timezone.utc).replace(tzinfo=None) if value.tzinfo else value
+
+
+def with_anchor_day(template: dict) -> dict:
+    """Record the day of month a new template repeats on (Resource.prepare)"""
+    return {**template, "anchor_day": _utc(template["next_due_date"]).day}
+
+
+def anchor_update(update_data: dict) -> dict:
+    """$set for a template edit; a new next_due_date re-anchors the series (Resource.update_doc)"""
+    if update_data.get("next_due_date"):
+        update_data = with_anchor_day(update_data)
+    return {"$set": update_data}
+
+
+def anchor_day(template: dict) -> int:
+    # Templates created before anchor_day was stored anchor on their next due date
+    return template.get("anchor_day") or template["next_due_date"].day
+
+
+def due_occurrences(template: dict, now: datetime, limit: int = MAX_CATCH_UP) -> Tuple[List[datetime], datetime]:
+    """Occurrences of `template` due by `now`, and the next_due_date to store afterwards"""
+    rule = parse_rule(template.get("frequency"), template.get("frequency_detail"))
+    anchor = anchor_day(template)
+    occurrence = template["next_due_date"]
+    due = []
+    while occurrence <= now and len(due) < limit:
+        due.append(occurrence)
+        occurrence = next_occurrence(rule, occurrence, anchor)
+    return due, occurrence
+
+
+def build_task(template: dict, occurrence: datetime, now: datetime) -> dict:
+    return {
+        "title": template["title"],
+        "description": template.get("description", ""),
+        "priority": template.get("priority", "medium"),
+        "status": "pending",
+        "due_date": occurrence,
+        "category": template.get("category", ""),
+        "created_date": now,
+        # tasks are synced to the app (see sync.py)
+        "updated_date": now,
+        "recurring_task_id": str(template["_id"]),
+        "occurrence_date": occurrence,
+    }
+
+
+def _advance(template: dict, next_due: datetime, now: datetime) -> Tuple[dict, dict]:
+    """Filter and update moving a template on; a concurrent run that advanced it first wins"""
+    return (
+        {"_id": template["_id"], "next_due_date": template["next_due_date"]},
+        {"$set": {"next_due_date": next_due, "last_generated_date": now, "anchor_day": anchor_day(template)}},
+    )
+
+
+async def _insert_new(db, tasks: List[dict]) -> int:
+    """Insert tasks, skipping occurrences that another run already generated"""
+    try:
+        result = await db.tasks.insert_many(tasks, ordered=False)
+        return len(result.inserted_ids)
+    except BulkWriteError as e:
+        errors = e.details.get("writeErrors", [])
+        if any(error["code"] != DUPLICATE_KEY for error in errors):
+            raise
+        return e.details["nInserted"]
+
+
+async def _flush(db, templates: List[dict], now: datetime) -> Dict[str, int]:
+    tasks, advances = [], []
+    for template in templates:
+        due, next_due = due_occurrences(template, now)
+        if not due:
+            continue
+        tasks.extend(build_task(template, occurrence, now) for occurrence in due)
+        advances.append(UpdateOne(*_advance(template, next_due, now)))
+    inserted = await _insert_new(db, tasks) if tasks else 0
+    advanced = (await db.recurring_tasks.bulk_write(advances, ordered=False)).modified_count if advances else 0
+    return {"templates": advanced, "tasks": inserted}
+
+
+async def generate_due_tasks(db, now: Optional[datetime] = None, batch_size: int = 1000) -> Dict[str, int]:
+    """Create tasks for every due occurrence of every active template"""
+    now = now or datetime.utcnow()
+    counts = {"templates": 0, "tasks": 0}
+    last_id = None
+    while True:
+        query = {"is_active": True, "next_due_date": {"$lte": now}}
+        if last_id is not None:
+            query["_id"] = {"$gt": last_id}
+        # Keyset over _id so templates advanced by this run are not seen twice
+        templates = await db.recurring_tasks.find(query).sort("_id", 1).limit(batch_size).to_list(batch_size)
+        if not templates:
+            return counts
+        for key, value in (await _flush(db, templates, now)).items():
+            counts[key] += value
+        last_id = templates[-1]["_id"]
+
+
+async def generate_next_task(db, template: dict, now: Optional[datetime] = None) -> dict:
+    """Create the task for a template's next occurrence, due or not, and advance it"""
+    now = now or datetime.utcnow()
+    rule = parse_rule(template.get("frequency"), template.get("frequency_detail"))
+    occurrence = template["next_due_date"]
+    task = build_task(template, occurrence, now)
+    try:
+        await db.tasks.insert_one(task)
+    except DuplicateKeyError:
+        # Generated concurrently (or before a crash); hand back the existing task
+        task = await db.tasks.find_one({"recurring_task_id": task["recurring_task_id"], "occurrence_date": occurrence})
+    next_due = next_occurrence(rule, occurrence, anchor_day(template))
+    await db.recurring_tasks.update_one(*_advance(template, next_due, now))
+    return task
+
+
+class RecurringTaskGenerator:
+    """Runs `generate_due_tasks` every `interval` seconds"""
+
+    def __init__(self, db, interval: float = 300.0, clock: Callable[[], datetime] = datetime.utcnow,
+                 on_write: Optional[Callable[..., Awaitable[None]]] = None):
+        self.db = db
+        self.interval = interval
+        self.clock = clock
+        self.on_write = on_write
+        self._stopped = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    async def run_once(self) -> Dict[str, int]:
+        counts = await generate_due_tasks(self.db, self.clock())
+        if self.on_write and (counts["tasks"] or counts["templates"]):
+            await self.on_write("tasks", "recurring_tasks")
+        return counts
+
+    async def run(self):
+        while not self._stopped.is_set():
+            try:
+                counts = await self.run_once()
+                if counts["tasks"]:
+                    logger.info("Generated recurring tasks: %s", counts)
+            except Exception:
+                logger.exception("Recurring task generation failed")
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def start(self):
+        self._stopped.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        self._stopped.set()
+        if self._task:
+            await self._task
+            self._task = None
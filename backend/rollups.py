@@ -0,0 +1,111 @@
+"""
+Materialized monthly revenue rollups.
+
+`revenue_monthly` holds one tiny document per month:
+    {"_id": "2024-12", "month": "2024-12", "total_received": .., "total_pending": .., "count": ..}
+
+The revenue write handlers keep it current with $inc deltas: a record is
+removed from the bucket it used to be in and added to the bucket it is in
+now, which covers amount edits, Pending <-> Received moves and payment_date
+moves between months. `rebuild_revenue_rollup` recomputes it from scratch:
+    python -m rollups --rebuild
+"""
+
+from datetime import timezone
+from typing import Iterable, Optional, Tuple
+
+from pymongo import UpdateOne
+
+ROLLUP_COLLECTION = "revenue_monthly"
+
+
+def _bucket_update(revenue: dict, sign: int) -> Optional[UpdateOne]:
+    payment_date = revenue.get("payment_date")
+    if not payment_date:
+        return None
+    if payment_date.tzinfo is not None:
+        # Bucket by the UTC month, like the rebuild and the naive-UTC dates read back from MongoDB
+        payment_date = payment_date.astimezone(timezone.utc)
+    month_key = payment_date.strftime('%Y-%m')
+    amount = sign * revenue.get("amount", 0)
+    received = revenue.get("payment_status") == "Received"
+    return UpdateOne(
+        {"_id": month_key},
+        {
+            "$inc": {
+                "total_received": amount if received else 0,
+                "total_pending": 0 if received else amount,
+                "count": sign,
+            },
+            "$setOnInsert": {"month": month_key},
+        },
+        upsert=True,
+    )
+
+
+async def apply_revenue_changes(db, changes: Iterable[Tuple[Optional[dict], Optional[dict]]]):
+    """Move each revenue record's contribution from its `before` bucket to its `after` bucket"""
+    ops = []
+    for before, after in changes:
+        if before:
+            ops.append(_bucket_update(before, -1))
+        if after:
+            ops.append(_bucket_update(after, 1))
+    ops = [op for op in ops if op]
+    if ops:
+        await db[ROLLUP_COLLECTION].bulk_write(ops, ordered=True)
+
+
+async def rebuild_revenue_rollup(db):
+    """Recompute every month from the revenue collection and atomically replace the rollup"""
+    await db.revenue.aggregate([
+        {"$match": {"payment_date": {"$type": "date"}}},
+        {"$group": {
+            "_id": {"$dateToString": {"format": "%Y-%m", "date": "$payment_date"}},
+            "total_received": {"$sum": {"$cond": [{"$eq": ["$payment_status", "Received"]}, "$amount", 0]}},
+            "total_pending": {"$sum": {"$cond": [{"$eq": ["$payment_status", "Received"]}, 0, "$amount"]}},
+            "count": {"$sum": 1},
+        }},
+        {"$set": {"month": "$_id"}},
+        {"$out": ROLLUP_COLLECTION},
+    ]).to_list(None)
+
+
+async def ensure_revenue_rollup(db):
+    """Build the rollup on first start against an existing revenue history"""
+    if await db[ROLLUP_COLLECTION].estimated_document_count() == 0 and \
+            await db.revenue.estimated_document_count() > 0:
+        await rebuild_revenue_rollup(db)
+
+
+async def monthly_revenue_summary(db):
+    return await db[ROLLUP_COLLECTION].find(
+        {"count": {"$gt": 0}}, {"_id": 0}
+    ).sort("_id", -1).to_list(None)
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+    import json
+    import os
+    from pathlib import Path
+
+    from dotenv import load_dotenv
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    parser = argparse.ArgumentParser(description="Inspect or rebuild the revenue_monthly rollup")
+    parser.add_argument("--rebuild", action="store_true", help="recompute the rollup from the revenue collection")
+    args = parser.parse_args()
+
+    load_dotenv(Path(__file__).parent / '.env')
+
+    async def main():
+        client = AsyncIOMotorClient(os.environ['MONGO_URL'])
+        db = client[os.environ['DB_NAME']]
+        if args.rebuild:
+            await rebuild_revenue_rollup(db)
+        print(json.dumps(await monthly_revenue_summary(db), indent=2))
+        client.close()
+
+    asyncio.run(main())
@@ -0,0 +1,263 @@
+"""
+Business analytics: revenue tracking and content performance. Loaded on the
+first /api/revenue or /api/performance request (see features.py).
+"""
+
+import asyncio
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+
+from crud import Resource
+from deps import get_db, mount
+from downsample import lttb
+from rollups import apply_revenue_changes, ensure_revenue_rollup, monthly_revenue_summary
+from serialization import ORJSONRoute
+
+router = APIRouter(prefix="/api", route_class=ORJSONRoute)
+
+# ===================== MODELS - REVENUE TRACKING =====================
+
+class Revenue(BaseModel):
+    amount: float
+    source_category: str  # Course Sales, Freelance, Other
+    source_detail: Optional[str] = ""  # Course name, Client name
+    platform: Optional[str] = ""  # YouTube, Udemy, Direct, etc.
+    payment_status: str = "Pending"  # Pending, Received
+    payment_date: datetime
+    description: Optional[str] = ""
+    created_date: datetime = Field(default_factory=datetime.utcnow)
+
+class RevenueUpdate(BaseModel):
+    amount: Optional[float] = None
+    source_category: Optional[str] = None
+    source_detail: Optional[str] = None
+    platform: Optional[str] = None
+    payment_status: Optional[str] = None
+    payment_date: Optional[datetime] = None
+    description: Optional[str] = None
+
+# ===================== CONTENT PERFORMANCE ANALYTICS =====================
+
+class ContentPerformance(BaseModel):
+    content_id: Optional[str] = ""
+    content_title: str
+    content_type: str  # Video, Post, Story, Course, Reel
+    platform: str  # YouTube, Instagram, Facebook, etc.
+    views: int = 0
+    likes: int = 0
+    comments: int = 0
+    shares: int = 0
+    reach: int = 0
+    recorded_date: datetime = Field(default_factory=datetime.utcnow)
+    created_date: datetime = Field(default_factory=datetime.utcnow)
+
+class ContentPerformanceUpdate(BaseModel):
+    content_id: Optional[str] = None
+    content_title: Optional[str] = None
+    content_type: Optional[str] = None
+    platform: Optional[str] = None
+    views: Optional[int] = None
+    likes: Optional[int] = None
+    comments: Optional[int] = None
+    shares: Optional[int] = None
+    reach: Optional[int] = None
+    recorded_date: Optional[datetime] = None
+
+# ===================== REVENUE TRACKING ROUTES =====================
+
+async def _sync_revenue_rollup(changes):
+    await apply_revenue_changes(get_db(), changes)
+
+mount(router, Resource(
+    "revenue", "revenue", Revenue, RevenueUpdate,
+    label="Revenue record", sort_field="payment_date", direction=-1,
+    after_write=_sync_revenue_rollup, importable=True
+))
+
+@router.get("/revenue/summary/monthly")
+async def get_monthly_revenue_summary():
+    """Get revenue summary grouped by month, read from the revenue_monthly rollup"""
+    return await monthly_revenue_summary(get_db())
+
+@router.get("/revenue/summary/category")
+async def get_revenue_by_category(
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    status: str = "Received",
+    group_by: List[str] = Query([]),
+):
+    """Get revenue summary grouped by category (and optionally platform/source_detail)
+
+    `status` is Received, Pending or all; `from`/`to` bound payment_date.
+    """
+    unknown = set(group_by) - {"platform", "source_detail"}
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Cannot group by: {', '.join(sorted(unknown))}")
+
+    match = {}
+    if status != "all":
+        match["payment_status"] = status
+    if date_from or date_to:
+        match["payment_date"] = {}
+        if date_from:
+            match["payment_date"]["$gte"] = date_from
+        if date_to:
+            match["payment_date"]["$lte"] = date_to
+
+    group_key = {"category": {"$ifNull": ["$source_category", "Other"]}}
+    for field in group_by:
+        group_key[field] = f"${field}"
+    row_fields = {key: f"$_id.{key}" for key in group_key}
+
+    return await get_db().revenue.aggregate([
+        {"$match": match},
+        {"$group": {"_id": group_key, "total": {"$sum": "$amount"}, "count": {"$sum": 1}}},
+        {"$project": {"_id": 0, **row_fields, "total": 1, "count": 1}},
+        {"$sort": {"total": -1}}
+    ]).to_list(None)
+
+# ===================== CONTENT PERFORMANCE ROUTES =====================
+
+# engagement_rate is stored on every performance document so top-N queries
+# can be answered by an index walk instead of computing it per request
+ENGAGEMENT_RATE_EXPR = {"$cond": [
+    {"$gt": [{"$ifNull": ["$views", 0]}, 0]},
+    {"$multiply": [
+        {"$divide": [
+            {"$add": [{"$ifNull": ["$likes", 0]}, {"$ifNull": ["$comments", 0]}, {"$ifNull": ["$shares", 0]}]},
+            "$views"
+        ]},
+        100
+    ]},
+    0
+]}
+
+def engagement_rate(perf: dict) -> float:
+    total_engagement = perf.get('likes', 0) + perf.get('comments', 0) + perf.get('shares', 0)
+    views = perf.get('views', 0)
+    return (total_engagement / views * 100) if views > 0 else 0
+
+def performance_update_pipeline(update_data: dict) -> list:
+    """Pipeline update so engagement_rate is recomputed from the merged counts"""
+    return [
+        {"$set": {k: {"$literal": v} for k, v in update_data.items()}},
+        {"$set": {"engagement_rate": ENGAGEMENT_RATE_EXPR}}
+    ]
+
+async def backfill_engagement_rate():
+    """Store engagement_rate on performance documents written before it existed"""
+    await get_db().performance.update_many(
+        {"engagement_rate": None},
+        [{"$set": {"engagement_rate": ENGAGEMENT_RATE_EXPR}}]
+    )
+
+
+def _with_engagement_rate(doc):
+    doc["engagement_rate"] = engagement_rate(doc)
+    return doc
+
+mount(router, Resource(
+    "performance", "performance", ContentPerformance, ContentPerformanceUpdate,
+    label="Performance record", sort_field="recorded_date", direction=-1,
+    prepare=_with_engagement_rate, update_doc=performance_update_pipeline, importable=True
+))
+
+@router.get("/performance/analytics/top-content")
+async def get_top_performing_content(
+    limit: int = Query(10, ge=1, le=100),
+    platform: Optional[str] = None,
+    content_type: Optional[str] = None,
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+):
+    """Get top performing content by views and engagement"""
+    query = {}
+    if platform:
+        query["platform"] = platform
+    if content_type:
+        query["content_type"] = content_type
+    if date_from or date_to:
+        query["recorded_date"] = {}
+        if date_from:
+            query["recorded_date"]["$gte"] = date_from
+        if date_to:
+            query["recorded_date"]["$lte"] = date_to
+
+    top_by_views, top_by_engagement = await asyncio.gather(
+        get_db().performance.find(query).sort([("views", -1), ("_id", -1)]).limit(limit).to_list(limit),
+        get_db().performance.find(query).sort([("engagement_rate", -1), ("_id", -1)]).limit(limit).to_list(limit),
+    )
+
+    return {
+        'top_by_views': top_by_views,
+        'top_by_engagement': top_by_engagement
+    }
+
+@router.get("/performance/analytics/trends")
+async def get_performance_trends(
+    interval: Literal["day", "week", "month"] = "day",
+    group_by: Literal["platform", "content_type"] = "platform",
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    max_points: Optional[int] = Query(None, ge=3, le=1000),
+):
+    """Get performance totals per time bucket for each platform (or content type)
+
+    With `max_points`, each series is downsampled (LTTB on views) to at most that many points.
+    """
+    match = {"recorded_date": {"$type": "date"}}
+    if date_from:
+        match["recorded_date"]["$gte"] = date_from
+    if date_to:
+        match["recorded_date"]["$lte"] = date_to
+
+    date_trunc = {"date": "$recorded_date", "unit": interval}
+    if interval == "week":
+        date_trunc["startOfWeek"] = "monday"
+
+    buckets = await get_db().performance.aggregate([
+        {"$match": match},
+        {"$group": {
+            "_id": {"bucket": {"$dateTrunc": date_trunc}, "series": f"${group_by}"},
+            "views": {"$sum": "$views"},
+            "likes": {"$sum": "$likes"},
+            "comments": {"$sum": "$comments"},
+            "shares": {"$sum": "$shares"},
+            "count": {"$sum": 1}
+        }},
+        {"$sort": {"_id.bucket": 1}}
+    ]).to_list(None)
+
+    series = {}
+    for bucket in buckets:
+        series.setdefault(bucket["_id"]["series"], []).append(bucket)
+    if max_points:
+        series = {
+            name: lttb(points, max_points, x=lambda p: p["_id"]["bucket"].timestamp(), y=lambda p: p["views"])
+            for name, points in series.items()
+        }
+
+    trends = []
+    for name, points in series.items():
+        for point in points:
+            trends.append({
+                'date': point["_id"]["bucket"].strftime('%Y-%m-%d'),
+                group_by: name or '',
+                'views': point['views'],
+                'likes': point['likes'],
+                'comments': point['comments'],
+                'shares': point['shares'],
+                'count': point['count']
+            })
+    trends.sort(key=lambda t: t['date'])
+    
+    return trends
+
+# ===================== LIFECYCLE =====================
+
+async def startup():
+    await ensure_revenue_rollup(get_db())
+    await backfill_engagement_rate()
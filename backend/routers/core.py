@@ -0,0 +1,381 @@
+"""
+Core productivity features: videos, study notes, calendar, tasks, the
+dashboard, the idea bank and recurring tasks, plus delta sync, health and
+admin routes.
+Included when the app is built; the other features load on first use.
+"""
+
+import asyncio
+import os
+from datetime import datetime, timedelta
+from functools import cache
+from typing import List, Optional
+
+from bson import ObjectId
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel, Field
+
+from crud import Resource, parse_object_id
+from deps import get_database, get_db, mount, response_cache, syncable_resources
+from indexes import index_report
+from pagination import PageParams
+from recurrence import RecurringTaskGenerator, anchor_update, generate_next_task, with_anchor_day
+from rollups import monthly_revenue_summary, rebuild_revenue_rollup
+from search import IdeaSearchIndex
+from serialization import ORJSONResponse, ORJSONRoute
+from sync import backfill_updated_date, changes_since
+
+router = APIRouter(prefix="/api", route_class=ORJSONRoute)
+
+# ===================== MODELS =====================
+
+class VideoStage(BaseModel):
+    name: str
+    completed: bool = False
+    completed_date: Optional[datetime] = None
+
+class VideoProject(BaseModel):
+    title: str
+    description: Optional[str] = ""
+    stages: List[VideoStage] = Field(default_factory=lambda: [
+        VideoStage(name="Idea"),
+        VideoStage(name="Script"),
+        VideoStage(name="PPT"),
+        VideoStage(name="Recording"),
+        VideoStage(name="Editing"),
+        VideoStage(name="Upload")
+    ])
+    due_date: Optional[datetime] = None
+    created_date: datetime = Field(default_factory=datetime.utcnow)
+
+class VideoProjectUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    stages: Optional[List[VideoStage]] = None
+    due_date: Optional[datetime] = None
+
+class StudyNote(BaseModel):
+    title: str
+    subject: str
+    content: Optional[str] = ""
+    progress_percentage: int = 0
+    created_date: datetime = Field(default_factory=datetime.utcnow)
+    updated_date: datetime = Field(default_factory=datetime.utcnow)
+
+class StudyNoteUpdate(BaseModel):
+    title: Optional[str] = None
+    subject: Optional[str] = None
+    content: Optional[str] = None
+    progress_percentage: Optional[int] = None
+
+class CalendarItem(BaseModel):
+    title: str
+    content_type: str
+    scheduled_date: datetime
+    status: str = "draft"  # draft, scheduled, posted
+    platform: Optional[str] = ""
+    description: Optional[str] = ""
+    created_date: datetime = Field(default_factory=datetime.utcnow)
+
+class CalendarItemUpdate(BaseModel):
+    title: Optional[str] = None
+    content_type: Optional[str] = None
+    scheduled_date: Optional[datetime] = None
+    status: Optional[str] = None
+    platform: Optional[str] = None
+    description: Optional[str] = None
+
+class Task(BaseModel):
+    title: str
+    description: Optional[str] = ""
+    priority: str = "medium"  # low, medium, high
+    status: str = "pending"  # pending, in_progress, completed
+    due_date: Optional[datetime] = None
+    category: Optional[str] = ""
+    created_date: datetime = Field(default_factory=datetime.utcnow)
+    # Set on tasks generated from a recurring template; unique together
+    recurring_task_id: Optional[str] = None
+    occurrence_date: Optional[datetime] = None
+
+class TaskUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    priority: Optional[str] = None
+    status: Optional[str] = None
+    due_date: Optional[datetime] = None
+    category: Optional[str] = None
+
+# ===================== IDEA BANK / RESEARCH VAULT =====================
+
+class IdeaBank(BaseModel):
+    title: str
+    content: Optional[str] = ""
+    tags: List[str] = Field(default_factory=list)
+    category: Optional[str] = ""
+    links: List[str] = Field(default_factory=list)
+    priority: str = "medium"  # low, medium, high
+    status: str = "idea"  # idea, researching, ready, used
+    created_date: datetime = Field(default_factory=datetime.utcnow)
+    updated_date: datetime = Field(default_factory=datetime.utcnow)
+
+class IdeaBankUpdate(BaseModel):
+    title: Optional[str] = None
+    content: Optional[str] = None
+    tags: Optional[List[str]] = None
+    category: Optional[str] = None
+    links: Optional[List[str]] = None
+    priority: Optional[str] = None
+    status: Optional[str] = None
+
+# ===================== RECURRING TASKS =====================
+
+class RecurringTask(BaseModel):
+    title: str
+    description: Optional[str] = ""
+    priority: str = "medium"
+    category: Optional[str] = ""
+    frequency: str = "weekly"  # daily, weekly, monthly
+    frequency_detail: Optional[str] = ""  # "Every Monday", "1st of month", etc.
+    next_due_date: datetime
+    last_generated_date: Optional[datetime] = None
+    is_active: bool = True
+    created_date: datetime = Field(default_factory=datetime.utcnow)
+
+class RecurringTaskUpdate(BaseModel):
+    title: Optional[str] = None
+    description: Optional[str] = None
+    priority: Optional[str] = None
+    category: Optional[str] = None
+    frequency: Optional[str] = None
+    frequency_detail: Optional[str] = None
+    next_due_date: Optional[datetime] = None
+    is_active: Optional[bool] = None
+
+# ===================== VIDEO PROJECTS ROUTES =====================
+
+mount(router, Resource(
+    "videos", "videos", VideoProject, VideoProjectUpdate,
+    label="Video", touch_updated_date=True, syncable=True
+))
+
+# ===================== STUDY NOTES ROUTES =====================
+
+mount(router, Resource(
+    "study-notes", "study_notes", StudyNote, StudyNoteUpdate,
+    label="Study note", touch_updated_date=True, syncable=True
+))
+
+# ===================== CALENDAR ROUTES =====================
+
+mount(router, Resource(
+    "calendar", "calendar", CalendarItem, CalendarItemUpdate,
+    label="Calendar item", syncable=True
+))
+
+# ===================== TASKS ROUTES =====================
+
+mount(router, Resource(
+    "tasks", "tasks", Task, TaskUpdate,
+    label="Task", syncable=True
+))
+
+# ===================== DASHBOARD STATS ROUTE =====================
+
+async def _first_or_empty(cursor):
+    results = await cursor.to_list(1)
+    return results[0] if results else {}
+
+async def _video_stats():
+    # A video is in progress while any of its stages is not completed
+    return await _first_or_empty(get_db().videos.aggregate([
+        {"$project": {
+            "in_progress": {"$cond": [
+                {"$in": [False, {"$map": {
+                    "input": {"$ifNull": ["$stages", []]},
+                    "as": "stage",
+                    "in": {"$ifNull": ["$$stage.completed", False]}
+                }}]},
+                1,
+                0
+            ]}
+        }},
+        {"$group": {
+            "_id": None,
+            "total": {"$sum": 1},
+            "in_progress": {"$sum": "$in_progress"}
+        }}
+    ]))
+
+async def _task_stats(now: datetime):
+    three_days_from_now = now + timedelta(days=3)
+    return await _first_or_empty(get_db().tasks.aggregate([
+        {"$match": {"status": {"$in": ["pending", "in_progress"]}}},
+        {"$facet": {
+            "pending": [{"$count": "count"}],
+            "urgent": [
+                {"$match": {"due_date": {"$gte": now, "$lte": three_days_from_now}}},
+                {"$sort": {"due_date": 1}},
+                {"$limit": 5}
+            ]
+        }}
+    ]))
+
+async def _monthly_revenue_stats(now: datetime):
+    first_day_of_month = datetime(now.year, now.month, 1)
+    rows = await get_db().revenue.aggregate([
+        {"$match": {"payment_date": {"$gte": first_day_of_month}}},
+        {"$group": {"_id": "$payment_status", "total": {"$sum": "$amount"}}}
+    ]).to_list(None)
+    return {row["_id"]: row["total"] for row in rows}
+
+@router.get("/dashboard/stats")
+async def get_dashboard_stats():
+    """Get dashboard stats; every number is computed inside MongoDB"""
+    now = datetime.utcnow()
+    video_stats, upcoming_items, task_stats, total_notes, revenue_totals = await asyncio.gather(
+        _video_stats(),
+        get_db().calendar.count_documents({"scheduled_date": {"$gte": now}, "status": {"$ne": "posted"}}),
+        _task_stats(now),
+        get_db().study_notes.count_documents({}),
+        _monthly_revenue_stats(now),
+    )
+
+    pending = task_stats.get("pending") or [{}]
+    urgent_tasks = task_stats.get("urgent", [])
+
+    return {
+        "videos_in_progress": video_stats.get("in_progress", 0),
+        "upcoming_calendar_items": upcoming_items,
+        "pending_tasks": pending[0].get("count", 0),
+        "urgent_tasks": urgent_tasks,  # Top 5 urgent tasks
+        "total_videos": video_stats.get("total", 0),
+        "total_study_notes": total_notes,
+        "monthly_income": revenue_totals.get("Received", 0),
+        "pending_payments": revenue_totals.get("Pending", 0),
+    }
+
+# ===================== IDEA BANK ROUTES =====================
+
+# Inverted index over title/content/tags/category, kept in sync on every idea write
+idea_search = IdeaSearchIndex()
+
+async def _sync_idea_search(changes):
+    for before, after in changes:
+        if after:
+            idea_search.add(after)
+        else:
+            idea_search.remove(str(before["_id"]))
+
+mount(router, Resource(
+    "ideas", "ideas", IdeaBank, IdeaBankUpdate,
+    label="Idea", sort_field="created_date", direction=-1, touch_updated_date=True, syncable=True,
+    after_write=_sync_idea_search
+))
+
+@router.get("/ideas/search/{query}")
+async def search_ideas(query: str, tag: Optional[str] = None, page: PageParams = Depends()):
+    """Ranked search over title, content, tags and category with prefix and typo matching"""
+    if page.after and not page.after.isdigit():
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    offset = int(page.after or 0)
+
+    await idea_search.refresh(get_db().ideas)
+    idea_ids, total, facets = idea_search.search(query, tag=tag, offset=offset, limit=page.limit)
+
+    ideas = await get_db().ideas.find({"_id": {"$in": [ObjectId(i) for i in idea_ids]}}).to_list(len(idea_ids))
+    by_id = {str(idea["_id"]): idea for idea in ideas}
+    items = [by_id[idea_id] for idea_id in idea_ids if idea_id in by_id]
+    for idea_id in idea_ids:
+        if idea_id not in by_id:
+            # Deleted without a tombstone (outside the API); stop counting it
+            idea_search.remove(idea_id)
+
+    return {
+        "items": items,
+        "next_cursor": str(offset + page.limit) if offset + page.limit < total else None,
+        "total": total,
+        "facets": {"tags": facets},
+    }
+
+# ===================== RECURRING TASKS ROUTES =====================
+
+@cache
+def get_recurring_generator() -> RecurringTaskGenerator:
+    # Built on first use, with the database
+    return RecurringTaskGenerator(
+        get_db(), interval=float(os.environ.get("RECURRING_INTERVAL_SECONDS", 300)),
+        on_write=response_cache.invalidate
+    )
+
+mount(router, Resource(
+    "recurring-tasks", "recurring_tasks", RecurringTask, RecurringTaskUpdate,
+    label="Recurring task", prepare=with_anchor_day, update_doc=anchor_update
+))
+
+@router.post("/recurring-tasks/{task_id}/generate")
+async def generate_task_from_recurring(task_id: str):
+    """Generate a new task instance from recurring task"""
+    recurring_task = await get_db().recurring_tasks.find_one({"_id": parse_object_id(task_id)})
+    if not recurring_task:
+        raise HTTPException(status_code=404, detail="Recurring task not found")
+    new_task = await generate_next_task(get_db(), recurring_task)
+    await response_cache.invalidate("tasks", "recurring_tasks")
+    return new_task
+
+@router.post("/recurring-tasks/auto-generate")
+async def auto_generate_recurring_tasks():
+    """Auto-generate tasks from all active recurring tasks that are due"""
+    counts = await get_recurring_generator().run_once()
+    return {
+        "message": f"Generated {counts['tasks']} tasks from {counts['templates']} recurring templates",
+        "count": counts["tasks"],
+        "templates": counts["templates"],
+    }
+
+# ===================== DELTA SYNC ROUTE =====================
+
+@router.get("/sync")
+async def sync_changes(since: Optional[str] = None, resources: Optional[str] = None):
+    """Documents created, updated or deleted since `since` (the token from the previous sync)
+
+    `resources=tasks,ideas` limits the response to those resource paths; see sync.py.
+    """
+    selected = list(syncable_resources.values())
+    if resources:
+        names = [name.strip() for name in resources.split(",") if name.strip()]
+        unknown = set(names) - set(syncable_resources)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Cannot sync: {', '.join(sorted(unknown))}")
+        selected = [syncable_resources[name] for name in names]
+    return await changes_since(get_db(), selected, since)
+
+# ===================== ADMIN ROUTES =====================
+
+@router.get("/health")
+async def health_check():
+    """Database ping and connection pool usage; 503 when MongoDB is unreachable"""
+    health = await get_database().health()
+    return ORJSONResponse(health, status_code=200 if health["status"] == "ok" else 503)
+
+@router.get("/admin/indexes")
+async def get_index_report():
+    """Report registered indexes missing from the database and index usage stats"""
+    return await index_report(get_db())
+
+@router.post("/admin/rollups/revenue/rebuild")
+async def rebuild_revenue_rollups():
+    """Recompute the revenue_monthly rollup from the revenue collection"""
+    await rebuild_revenue_rollup(get_db())
+    await response_cache.invalidate("revenue")
+    return await monthly_revenue_summary(get_db())
+
+# ===================== LIFECYCLE =====================
+
+async def startup():
+    await backfill_updated_date(get_db(), [resource.collection for resource in syncable_resources.values()])
+    await idea_search.rebuild(get_db().ideas)
+    if os.environ.get("RECURRING_GENERATOR_ENABLED", "true").lower() != "false":
+        get_recurring_generator().start()
+
+async def shutdown():
+    await get_recurring_generator().stop()
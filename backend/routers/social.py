@@ -0,0 +1,279 @@
+"""
+Social media automation: connections, scheduled posts and their publisher,
+posting logs and the OAuth / Google Sheets placeholders. Loaded on the first
+/api/social request, or at startup when the post scheduler runs in this
+process (see server.py).
+"""
+
+import os
+from datetime import datetime
+from functools import cache
+from typing import Dict, Optional
+
+from fastapi import APIRouter, HTTPException, Query
+from pydantic import BaseModel, Field
+
+from crud import Resource, parse_object_id
+from deps import get_db, mount, response_cache
+from dispatch import dispatch_update, migrate_due_at, with_dispatch_fields
+from export import ExportFormat, export_response
+from publishers import PublisherPool
+from scheduler import PostScheduler
+from serialization import ORJSONRoute
+
+router = APIRouter(prefix="/api", route_class=ORJSONRoute)
+
+# ===================== SOCIAL MEDIA AUTOMATION MODELS =====================
+
+class SocialConnection(BaseModel):
+    platform: str  # meta_instagram, meta_facebook, youtube, google_sheets
+    account_name: str
+    access_token: str
+    refresh_token: Optional[str] = None
+    token_expires_at: Optional[datetime] = None
+    is_active: bool = True
+    connected_date: datetime = Field(default_factory=datetime.utcnow)
+
+class SocialConnectionUpdate(BaseModel):
+    account_name: Optional[str] = None
+    access_token: Optional[str] = None
+    refresh_token: Optional[str] = None
+    token_expires_at: Optional[datetime] = None
+    is_active: Optional[bool] = None
+
+class ScheduledPost(BaseModel):
+    topic: str
+    caption: str
+    platform: str  # instagram, facebook, youtube
+    media_url: Optional[str] = ""
+    hashtags: Optional[str] = ""
+    scheduled_date: datetime
+    scheduled_time: str  # HH:MM format
+    priority: str = "medium"  # low, medium, high
+    status: str = "scheduled"  # scheduled, publishing, posted, failed, dead_letter, cancelled
+    notes: Optional[str] = ""
+    sheet_row_id: Optional[str] = None  # For tracking Google Sheets source
+    created_date: datetime = Field(default_factory=datetime.utcnow)
+
+class ScheduledPostUpdate(BaseModel):
+    topic: Optional[str] = None
+    caption: Optional[str] = None
+    platform: Optional[str] = None
+    media_url: Optional[str] = None
+    hashtags: Optional[str] = None
+    scheduled_date: Optional[datetime] = None
+    scheduled_time: Optional[str] = None
+    priority: Optional[str] = None
+    status: Optional[str] = None
+    notes: Optional[str] = None
+
+class PostingLog(BaseModel):
+    post_id: str
+    platform: str
+    topic: str
+    posted_at: datetime = Field(default_factory=datetime.utcnow)
+    status: str  # success, failed, dead_letter
+    platform_post_id: Optional[str] = None  # ID from platform API
+    error_message: Optional[str] = None
+    response_data: Optional[Dict] = None
+
+class GoogleSheetsConfig(BaseModel):
+    sheet_id: str
+    sheet_name: str = "Content Schedule"
+    auto_sync: bool = False
+    sync_frequency_minutes: int = 60
+    last_sync: Optional[datetime] = None
+
+# ===================== SOCIAL MEDIA AUTOMATION ROUTES =====================
+
+publisher_pool = PublisherPool.from_env()
+
+@cache
+def get_post_scheduler() -> PostScheduler:
+    # Built on first use, with the database
+    return PostScheduler.from_env(get_db(), publish=publisher_pool.publish, on_write=response_cache.invalidate)
+
+# Social Connections Management
+def _mask_connection_tokens(conn):
+    # Don't expose full tokens in list view for security
+    if conn.get("access_token"):
+        conn["access_token"] = conn["access_token"][:10] + "..."
+    if conn.get("refresh_token"):
+        conn["refresh_token"] = "***"
+    return conn
+
+mount(router, Resource(
+    "social/connections", "social_connections", SocialConnection, SocialConnectionUpdate,
+    label="Connection", list_transform=_mask_connection_tokens
+))
+
+# Scheduled Posts Management
+async def _queue_scheduled_posts(changes):
+    for before, after in changes:
+        if after:
+            # The after-image of an update is the response too, so refresh its dispatch fields in place
+            get_post_scheduler().enqueue(with_dispatch_fields(after))
+        else:
+            get_post_scheduler().queue.discard(before["_id"])
+
+mount(router, Resource(
+    "social/scheduled-posts", "scheduled_posts", ScheduledPost, ScheduledPostUpdate,
+    label="Post", deleted_label="Scheduled post", sort_field="scheduled_date", direction=1,
+    list_filters=("status", "platform"),
+    prepare=with_dispatch_fields, update_doc=dispatch_update, after_write=_queue_scheduled_posts
+))
+
+# Content Calendar View
+@router.get("/social/calendar")
+async def get_content_calendar(start_date: Optional[str] = None, end_date: Optional[str] = None):
+    """Get calendar view of scheduled posts"""
+    query = {}
+    
+    if start_date and end_date:
+        from datetime import datetime as dt
+        try:
+            start = dt.fromisoformat(start_date.replace('Z', '+00:00'))
+            end = dt.fromisoformat(end_date.replace('Z', '+00:00'))
+            query["scheduled_date"] = {"$gte": start, "$lte": end}
+        except:
+            pass
+    
+    posts = await get_db().scheduled_posts.find(query).sort("scheduled_date", 1).to_list(1000)
+    
+    # Group by date for calendar view
+    calendar_data = {}
+    for post in posts:
+        date_key = post["scheduled_date"].strftime('%Y-%m-%d') if post.get("scheduled_date") else "unscheduled"
+        
+        if date_key not in calendar_data:
+            calendar_data[date_key] = []
+        calendar_data[date_key].append(post)
+    
+    return calendar_data
+
+# Google Sheets Integration
+@router.post("/social/sync-sheets")
+async def sync_from_google_sheets(sheet_config: GoogleSheetsConfig):
+    """
+    Placeholder for Google Sheets sync - will be implemented with actual OAuth
+    For now, accepts manual data or returns instructions
+    """
+    # Store config
+    config_dict = sheet_config.dict()
+    config_dict["last_sync"] = datetime.utcnow()
+    
+    # Check if config exists
+    existing = await get_db().sheets_config.find_one({"sheet_id": sheet_config.sheet_id})
+    if existing:
+        await get_db().sheets_config.update_one(
+            {"sheet_id": sheet_config.sheet_id},
+            {"$set": config_dict}
+        )
+    else:
+        await get_db().sheets_config.insert_one(config_dict)
+    
+    return {
+        "message": "Google Sheets configuration saved. OAuth integration pending.",
+        "instructions": "To enable auto-sync, you'll need to: 1) Create Google Cloud project, 2) Enable Google Sheets API, 3) Create OAuth credentials, 4) Connect in app",
+        "sheet_id": sheet_config.sheet_id,
+        "status": "configured"
+    }
+
+@router.get("/social/sheets-config")
+async def get_sheets_config():
+    config = await get_db().sheets_config.find_one()
+    return config or {"message": "No Google Sheets configured"}
+
+# Manual Publish Post
+@router.post("/social/publish/{post_id}")
+async def publish_post_now(post_id: str):
+    """
+    Manually trigger posting (placeholder - actual API integration pending)
+    """
+    oid = parse_object_id(post_id)
+    # Claim it like the scheduler does so a manual publish can't race a scheduled
+    # one, and never claim a post that already went out
+    post = await get_post_scheduler().claim({"_id": oid, "status": {"$nin": ["publishing", "posted"]}})
+    if not post:
+        current = await get_db().scheduled_posts.find_one({"_id": oid}, {"status": 1})
+        if not current:
+            raise HTTPException(status_code=404, detail="Post not found")
+        if current.get("status") == "posted":
+            raise HTTPException(status_code=409, detail="Post has already been published")
+        raise HTTPException(status_code=409, detail="Post is already being published")
+
+    status = await get_post_scheduler().process(post)
+    await response_cache.invalidate("scheduled_posts")
+    if status != "posted":
+        raise HTTPException(status_code=502, detail=f"Publishing failed, post is now {status}")
+    return {
+        "message": "Post published successfully (placeholder)",
+        "post_id": post_id,
+        "platform": post.get("platform"),
+        "note": "Actual posting will work once OAuth is configured"
+    }
+
+# Posting History/Logs
+@router.get("/social/posting-logs")
+async def get_posting_logs(platform: Optional[str] = None, limit: int = 50):
+    query = {}
+    if platform:
+        query["platform"] = platform
+    
+    return await get_db().posting_logs.find(query).sort("posted_at", -1).limit(limit).to_list(limit)
+
+@router.get("/social/posting-logs/export")
+async def export_posting_logs(
+    export_format: ExportFormat = Query("ndjson", alias="format"),
+    platform: Optional[str] = None,
+):
+    query = {"platform": platform} if platform else {}
+    return export_response(get_db().posting_logs, export_format, ["_id", *PostingLog.model_fields], query)
+
+# OAuth Placeholders (to be implemented with actual OAuth flows)
+@router.get("/social/oauth/meta/authorize")
+async def meta_oauth_authorize():
+    return {
+        "message": "Meta OAuth flow placeholder",
+        "instructions": "To enable: 1) Create Meta Developer App, 2) Add Instagram/Facebook permissions, 3) Get App ID and Secret, 4) Configure OAuth redirect URL",
+        "redirect_url_needed": "/api/social/oauth/meta/callback"
+    }
+
+@router.get("/social/oauth/youtube/authorize")
+async def youtube_oauth_authorize():
+    return {
+        "message": "YouTube OAuth flow placeholder",
+        "instructions": "To enable: 1) Create Google Cloud project, 2) Enable YouTube Data API, 3) Create OAuth 2.0 credentials, 4) Configure authorized redirect URIs",
+        "redirect_url_needed": "/api/social/oauth/youtube/callback"
+    }
+
+@router.get("/social/oauth/sheets/authorize")
+async def sheets_oauth_authorize():
+    return {
+        "message": "Google Sheets OAuth flow placeholder",
+        "instructions": "To enable: 1) Use same Google Cloud project as YouTube, 2) Enable Google Sheets API, 3) Use same OAuth credentials",
+        "redirect_url_needed": "/api/social/oauth/sheets/callback"
+    }
+
+# Drain due posts now instead of waiting for the scheduler's next pass
+@router.post("/social/check-due-posts")
+async def check_and_post_due_posts():
+    """Check for posts that are due and post them"""
+    counts = await get_post_scheduler().drain()
+    return {
+        "message": f"Checked and posted {counts['posted']} due posts",
+        "count": counts["posted"],
+        "failed": counts["failed"],
+        "dead_letter": counts["dead_letter"],
+        "note": "Actual API posting will work once OAuth is configured"
+    }
+
+# ===================== LIFECYCLE =====================
+
+async def startup():
+    await migrate_due_at(get_db())
+    if os.environ.get("SCHEDULER_ENABLED", "true").lower() != "false":
+        get_post_scheduler().start()
+
+async def shutdown():
+    await get_post_scheduler().stop()
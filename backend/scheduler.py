@@ -0,0 +1,250 @@
+"""
+Background scheduler that publishes due social posts.
+
+Every app process runs one `PostScheduler`. A post is claimed atomically by
+flipping it from `scheduled` to `publishing` with find_one_and_update and
+stamping a lease (`lease_owner`, `lease_expires_at`), so several uvicorn
+workers can poll the same collection without posting anything twice. Only the
+lease owner may complete a claim; a lease that expires (the worker died
+mid-publish) is released back to `scheduled` on the next pass. While a publish
+is in flight the owner renews its lease every third of the lease, so a publish
+held up by rate limits and retry backoff doesn't outlive it.
+
+Due posts come out of a `DispatchQueue` (see dispatch.py) in due_at order,
+highest priority first once they are overdue, and the loop sleeps until the
+next due_at or the poll interval, whichever is sooner. A drain keeps up to
+`concurrency` publishes in flight and claims the next post as soon as one
+finishes, so a post in retry backoff holds one slot, not the whole batch.
+
+The clock (and the sleep between lease renewals) is injectable, which lets a
+test drive due-ness and lease expiry against a real mongod without sleeping:
+
+    now = datetime(2024, 1, 1, 9, 0)
+    scheduler = PostScheduler(db, clock=lambda: now)
+    await scheduler.drain()
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from pymongo import ReturnDocument
+
+from dispatch import DispatchQueue
+from publishers import DeadLetterError, PlaceholderPublisher
+
+logger = logging.getLogger(__name__)
+
+Publish = Callable[[dict], Awaitable[Dict]]
+
+
+class PostScheduler:
+    def __init__(
+        self,
+        db,
+        publish: Optional[Publish] = None,
+        clock: Callable[[], datetime] = datetime.utcnow,
+        poll_interval: float = 15.0,
+        batch_size: int = 20,
+        # Posts handed to `publish` at once; the publisher pool applies the per-platform limits
+        concurrency: int = 20,
+        lease_seconds: int = 300,
+        owner: Optional[str] = None,
+        on_write: Optional[Callable[[str], Awaitable[None]]] = None,
+        sleep=asyncio.sleep,
+    ):
+        self.db = db
+        self.publish = publish or PlaceholderPublisher().publish
+        self.clock = clock
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.lease = timedelta(seconds=lease_seconds)
+        self.on_write = on_write
+        self.sleep = sleep
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.queue = DispatchQueue(db.scheduled_posts)
+        self._stopped = asyncio.Event()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_env(cls, db, **kwargs) -> "PostScheduler":
+        return cls(
+            db,
+            poll_interval=float(os.environ.get("SCHEDULER_POLL_SECONDS", 15)),
+            batch_size=int(os.environ.get("SCHEDULER_BATCH_SIZE", 20)),
+            concurrency=int(os.environ.get("SCHEDULER_CONCURRENCY", 20)),
+            lease_seconds=int(os.environ.get("SCHEDULER_LEASE_SECONDS", 300)),
+            **kwargs,
+        )
+
+    async def release_expired(self) -> int:
+        """Hand posts whose lease ran out back to the queue"""
+        result = await self.db.scheduled_posts.update_many(
+            {"status": "publishing", "lease_expires_at": {"$lt": self.clock()}},
+            {"$set": {"status": "scheduled"}, "$unset": {"lease_owner": "", "lease_expires_at": ""}},
+        )
+        return result.modified_count
+
+    async def claim(self, query: dict) -> Optional[dict]:
+        """Atomically take the post matching `query` for this worker"""
+        return await self.db.scheduled_posts.find_one_and_update(
+            query,
+            {"$set": {
+                "status": "publishing",
+                "lease_owner": self.owner,
+                "lease_expires_at": self.clock() + self.lease,
+            }},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    async def renew(self, post: dict) -> bool:
+        """Extend the lease on a post this worker is still publishing"""
+        update = await self.db.scheduled_posts.update_one(
+            {"_id": post["_id"], "status": "publishing", "lease_owner": self.owner},
+            {"$set": {"lease_expires_at": self.clock() + self.lease}},
+        )
+        return update.modified_count > 0
+
+    async def _keep_lease(self, post: dict):
+        """Renew the lease every third of its length until cancelled"""
+        while True:
+            await self.sleep(self.lease.total_seconds() / 3)
+            try:
+                if not await self.renew(post):
+                    logger.warning("Lost the lease on post %s while publishing it", post["_id"])
+                    return
+            except Exception:
+                # Try again on the next beat; the lease still has two thirds left
+                logger.exception("Renewing the lease on post %s failed", post["_id"])
+
+    async def claim_batch(self, limit: Optional[int] = None) -> List[dict]:
+        """Claim up to `limit` (default batch_size) due posts; fewer means none are left"""
+        limit = limit or self.batch_size
+        now = self.clock()
+        posts = []
+        refilled = False
+        while len(posts) < limit:
+            ids = self.queue.pop_due(now, limit - len(posts))
+            if not ids:
+                if refilled:
+                    break
+                await self.queue.refill()
+                refilled = True
+                continue
+            for oid in ids:
+                # Another worker may have claimed it, or it may have been edited since the refill
+                post = await self.claim({"_id": oid, "status": "scheduled", "due_at": {"$lte": now}})
+                if post:
+                    posts.append(post)
+        return posts
+
+    def enqueue(self, post: dict):
+        """Pick up a post (with its dispatch fields) written by this process before the next refill"""
+        self.queue.push(post)
+        self._wake.set()
+
+    async def complete(self, post: dict, status: str, result: Optional[Dict] = None,
+                       error: Optional[str] = None) -> bool:
+        """Record the outcome, unless another worker has taken the lease over in the meantime"""
+        now = self.clock()
+        update = await self.db.scheduled_posts.update_one(
+            {"_id": post["_id"], "status": "publishing", "lease_owner": self.owner},
+            {"$set": {"status": status}, "$unset": {"lease_owner": "", "lease_expires_at": ""}},
+        )
+        if update.modified_count == 0:
+            logger.warning("Lost the lease on post %s before it completed", post["_id"])
+            return False
+        result = result or {}
+        await self.db.posting_logs.insert_one({
+            "post_id": str(post["_id"]),
+            "platform": post.get("platform", "unknown"),
+            "topic": post.get("topic", ""),
+            "posted_at": now,
+            "status": "success" if status == "posted" else status,
+            "platform_post_id": result.get("platform_post_id"),
+            "error_message": error,
+            "response_data": result.get("response_data"),
+        })
+        return True
+
+    async def _publish_leased(self, post: dict) -> Dict:
+        keep_lease = asyncio.create_task(self._keep_lease(post))
+        try:
+            return await self.publish(post)
+        finally:
+            keep_lease.cancel()
+
+    async def process(self, post: dict) -> str:
+        """Publish one claimed post; returns the status it ended up in"""
+        try:
+            result = await self._publish_leased(post)
+        except DeadLetterError as e:
+            logger.error("Dead-lettering post %s: %s", post["_id"], e)
+            await self.complete(post, "dead_letter", error=str(e))
+            return "dead_letter"
+        except Exception as e:
+            logger.exception("Publishing post %s failed", post["_id"])
+            await self.complete(post, "failed", error=str(e))
+            return "failed"
+        return "posted" if await self.complete(post, "posted", result) else "failed"
+
+    async def drain(self) -> Dict[str, int]:
+        """Publish every post that is due now, claiming one whenever a publish slot frees up"""
+        counts = {"posted": 0, "failed": 0, "dead_letter": 0, "released": await self.release_expired()}
+        in_flight: Set[asyncio.Task] = set()
+        exhausted = False
+        while True:
+            # Posts enqueued by this process while the drain runs are due without a refill
+            if exhausted and self.queue.has_due(self.clock()):
+                exhausted = False
+            free = self.concurrency - len(in_flight)
+            if not exhausted and free > 0 and not self._stopped.is_set():
+                limit = min(free, self.batch_size)
+                posts = await self.claim_batch(limit)
+                exhausted = len(posts) < limit
+                in_flight.update(asyncio.create_task(self.process(post)) for post in posts)
+            if not in_flight:
+                return counts
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                counts[task.result()] += 1
+            if self.on_write:
+                await self.on_write("scheduled_posts")
+
+    async def run(self):
+        while not self._stopped.is_set():
+            try:
+                counts = await self.drain()
+                if counts["posted"] or counts["failed"] or counts["dead_letter"]:
+                    logger.info("Scheduler %s drained due posts: %s", self.owner, counts)
+            except Exception:
+                logger.exception("Scheduler pass failed")
+            await self._sleep()
+
+    async def _sleep(self):
+        timeout = self.poll_interval
+        next_due = self.queue.next_due()
+        if next_due is not None:
+            timeout = min(timeout, max(0.0, (next_due - self.clock()).total_seconds()))
+        self._wake.clear()
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def start(self):
+        self._stopped.clear()
+        self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        self._stopped.set()
+        self._wake.set()
+        if self._task:
+            await self._task
+            self._task = None
@@ -0,0 +1,215 @@
+"""
+In-process inverted index for Idea Bank search.
+
+Ideas are tokenized into a term -> {idea_id: weight} posting map, weighted by
+the field a term came from. A query token matches exact terms, terms it is a
+prefix of and terms one edit away, so "pharm" finds "pharmacology" and
+"pharmacolgy" still finds it too. Scores are tf-idf over those expansions.
+
+Each query token scores at most MAX_POSTINGS_PER_TOKEN postings, reading long
+posting lists in descending weight order, so latency stays flat as the vault
+grows; `total` and the tag facets are counted over the scored candidates.
+
+The index is kept in sync by the idea write handlers and, for writes made by
+other workers, by pulling ideas whose updated_date moved since the last
+refresh and dropping the ideas with a delete tombstone since then
+(sync_tombstones, see sync.py), so `total` and the facets don't count them.
+Only a refresh (or rebuild) moves that watermark, to the time its reads
+started, and each refresh re-reads SYNC_OVERLAP before it: a local write
+says nothing about other workers' writes that committed around it. Search only
+returns ids and documents are re-read from MongoDB; an id that is gone
+without a tombstone (deleted outside the API) is dropped when a search
+finds it missing.
+"""
+
+import bisect
+import heapq
+import math
+import re
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sync import SYNC_OVERLAP, TOMBSTONES
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789"
+
+FIELD_WEIGHTS = {"title": 3.0, "tags": 2.5, "category": 2.0, "content": 1.0}
+PREFIX_WEIGHT = 0.6
+TYPO_WEIGHT = 0.4
+MAX_PREFIX_EXPANSIONS = 50
+MIN_PREFIX_LENGTH = 2
+MIN_TYPO_LENGTH = 4
+# Postings scored per query token; long lists are read highest-weight first
+MAX_POSTINGS_PER_TOKEN = 5000
+
+INDEXED_FIELDS = {"title": 1, "content": 1, "tags": 1, "category": 1, "updated_date": 1}
+
+
+def tokenize(text: str) -> List[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def _edits1(word: str) -> Iterable[str]:
+    splits = [(word[:i], word[i:]) for i in range(len(word) + 1)]
+    for left, right in splits:
+        if right:
+            yield left + right[1:]
+            for c in ALPHABET:
+                yield left + c + right[1:]
+        if len(right) > 1:
+            yield left + right[1] + right[0] + right[2:]
+        for c in ALPHABET:
+            yield left + c + right
+
+
+class IdeaSearchIndex:
+    def __init__(self, refresh_interval: float = 5.0):
+        self.refresh_interval = refresh_interval
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._doc_terms: Dict[str, Dict[str, float]] = {}
+        self._doc_tags: Dict[str, List[str]] = {}
+        self._vocab: List[str] = []
+        self._impact_order: Dict[str, List[Tuple[str, float]]] = {}
+        # When the last refresh (or rebuild) started reading; other workers'
+        # writes and deletes from then on still need pulling
+        self._last_synced: Optional[datetime] = None
+        self._last_refresh = 0.0
+
+    def __len__(self):
+        return len(self._doc_terms)
+
+    # ---------- maintenance ----------
+
+    def add(self, idea: dict):
+        """Index (or re-index) one idea document"""
+        idea_id = str(idea["_id"])
+        self.remove(idea_id)
+
+        terms: Dict[str, float] = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            value = idea.get(field) or ""
+            text = " ".join(value) if isinstance(value, list) else str(value)
+            for token in tokenize(text):
+                terms[token] = terms.get(token, 0.0) + weight
+
+        for term, weight in terms.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                bisect.insort(self._vocab, term)
+            postings[idea_id] = weight
+            self._impact_order.pop(term, None)
+        self._doc_terms[idea_id] = terms
+        self._doc_tags[idea_id] = list(dict.fromkeys(idea.get("tags") or []))
+
+    def remove(self, idea_id: str):
+        terms = self._doc_terms.pop(idea_id, None)
+        self._doc_tags.pop(idea_id, None)
+        if not terms:
+            return
+        for term in terms:
+            postings = self._postings[term]
+            postings.pop(idea_id, None)
+            self._impact_order.pop(term, None)
+            if not postings:
+                del self._postings[term]
+                del self._vocab[bisect.bisect_left(self._vocab, term)]
+
+    async def rebuild(self, collection):
+        self._postings.clear()
+        self._doc_terms.clear()
+        self._doc_tags.clear()
+        self._vocab.clear()
+        self._impact_order.clear()
+        self._last_synced = datetime.utcnow()
+        async for idea in collection.find({}, INDEXED_FIELDS):
+            self.add(idea)
+        self._last_refresh = time.monotonic()
+
+    async def refresh(self, collection):
+        """Pick up ideas written or deleted by other workers, at most once per refresh_interval"""
+        if time.monotonic() - self._last_refresh < self.refresh_interval:
+            return
+        self._last_refresh = time.monotonic()
+        now = datetime.utcnow()
+        # A write stamped just before the last refresh may have committed after
+        # it read, hence the overlap; re-indexing or removing twice is harmless
+        since = self._last_synced - SYNC_OVERLAP if self._last_synced else None
+        query = {"updated_date": {"$gte": since}} if since else {}
+        async for idea in collection.find(query, INDEXED_FIELDS):
+            self.add(idea)
+
+        # After the pull, so an idea updated and then deleted ends up removed
+        query = {"collection": collection.name}
+        if since:
+            query["deleted_date"] = {"$gte": since}
+        async for tombstone in collection.database[TOMBSTONES].find(query, {"doc_id": 1}):
+            self.remove(str(tombstone["doc_id"]))
+        self._last_synced = now
+
+    # ---------- querying ----------
+
+    def _postings_by_weight(self, term: str, budget: int) -> Iterable[Tuple[str, float]]:
+        postings = self._postings[term]
+        if len(postings) <= budget:
+            return postings.items()
+        ordered = self._impact_order.get(term)
+        if ordered is None:
+            ordered = self._impact_order[term] = sorted(postings.items(), key=lambda item: item[1], reverse=True)
+        return ordered[:budget]
+
+    def _expand(self, token: str) -> Dict[str, float]:
+        expansions = {}
+        if token in self._postings:
+            expansions[token] = 1.0
+        if len(token) >= MIN_PREFIX_LENGTH:
+            start = bisect.bisect_left(self._vocab, token)
+            for term in self._vocab[start:start + MAX_PREFIX_EXPANSIONS + 1]:
+                if not term.startswith(token):
+                    break
+                expansions.setdefault(term, PREFIX_WEIGHT)
+        if len(token) >= MIN_TYPO_LENGTH:
+            for candidate in set(_edits1(token)):
+                if candidate in self._postings:
+                    expansions.setdefault(candidate, TYPO_WEIGHT)
+        return expansions
+
+    def search(
+        self, query: str, tag: Optional[str] = None, offset: int = 0, limit: int = 20
+    ) -> Tuple[List[str], int, Dict[str, int]]:
+        """Return one page of idea ids in rank order, the match count and tag facets over all matches"""
+        tokens = list(dict.fromkeys(tokenize(query)))
+        total_docs = max(len(self._doc_terms), 1)
+
+        matched: Counter = Counter()
+        scores: Dict[str, float] = {}
+        for token in tokens:
+            best: Dict[str, float] = {}
+            budget = MAX_POSTINGS_PER_TOKEN
+            for term, expansion_weight in self._expand(token).items():
+                if budget <= 0:
+                    break
+                idf = math.log(1 + total_docs / len(self._postings[term]))
+                postings = self._postings_by_weight(term, budget)
+                budget -= len(postings)
+                for idea_id, weight in postings:
+                    score = expansion_weight * idf * weight
+                    if score > best.get(idea_id, 0.0):
+                        best[idea_id] = score
+            for idea_id, score in best.items():
+                matched[idea_id] += 1
+                scores[idea_id] = scores.get(idea_id, 0.0) + score
+
+        if tag:
+            tag_lower = tag.lower()
+            scores = {
+                idea_id: score for idea_id, score in scores.items()
+                if any(t.lower() == tag_lower for t in self._doc_tags.get(idea_id, []))
+            }
+
+        ranked = heapq.nlargest(offset + limit, scores, key=lambda idea_id: (matched[idea_id], scores[idea_id]))
+        facets = Counter(t for idea_id in scores for t in self._doc_tags.get(idea_id, []))
+        return ranked[offset:], len(scores), dict(facets.most_common())
@@ -0,0 +1,63 @@
+"""
+orjson response rendering for every API route.
+
+FastAPI runs a handler's return value through `jsonable_encoder` (a recursive
+pure-Python walk) before the response class renders it, even with a faster
+default response class. `ORJSONRoute` makes handlers hand their result to
+`ORJSONResponse` directly, and orjson serializes dicts, lists and datetimes
+natively in C. Only ObjectId (and the odd Decimal or Pydantic model) goes
+through the `default` hook, so handlers can return MongoDB documents as they
+come back from Motor, without rewriting `_id` row by row.
+"""
+
+import asyncio
+import functools
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from bson import ObjectId
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+
+
+def _default(obj: Any):
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _render_directly(call):
+    @functools.wraps(call)
+    async def endpoint(*args, **kwargs):
+        result = await call(*args, **kwargs)
+        return result if isinstance(result, Response) else ORJSONResponse(result)
+    return endpoint
+
+
+class ORJSONRoute(APIRoute):
+    """Route whose handler result skips jsonable_encoder and is rendered by ORJSONResponse"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Routes with a response_model still need FastAPI's validation and filtering
+        if self.response_model is None and asyncio.iscoroutinefunction(self.dependant.call):
+            self.dependant.call = _render_directly(self.dependant.call)
@@ -0,0 +1,96 @@
+"""
+Delta sync for the mobile client.
+
+GET /api/sync?since=<token> returns, for every syncable resource, the
+documents created or updated and the ids deleted since `token`, plus the
+token to send next time. Without a token (or with one older than the
+tombstone retention) the response is a full snapshot with `reset: true`,
+and the client replaces its local copy instead of merging.
+
+It relies on two things kept up by every writer of a syncable collection
+(crud, bulk, import, recurring generation):
+    updated_date    stamped on create and on every update
+    tombstones      one sync_tombstones document per delete, expired by a
+                    TTL index after TOMBSTONE_RETENTION
+
+A token is the server time the previous sync started at. A write stamped
+just before that time may commit just after the previous sync read, so
+each sync re-reads SYNC_OVERLAP before the token. Clients apply changes by
+_id (upsert changed, drop deleted), so the few repeated rows are harmless.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from fastapi import HTTPException
+
+if TYPE_CHECKING:
+    from crud import Resource
+
+TOMBSTONES = "sync_tombstones"
+TOMBSTONE_RETENTION = timedelta(days=30)
+SYNC_OVERLAP = timedelta(seconds=5)
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def encode_token(moment: datetime) -> str:
+    return str((moment - EPOCH) // timedelta(milliseconds=1))
+
+
+def decode_token(token: str) -> datetime:
+    if not token.isdigit():
+        raise HTTPException(status_code=400, detail="Invalid sync token")
+    return EPOCH + timedelta(milliseconds=int(token))
+
+
+async def record_deletes(db, collection: str, ids: Iterable, now: Optional[datetime] = None):
+    """Leave a tombstone for each deleted document, so the next delta sync reports it"""
+    now = now or datetime.utcnow()
+    tombstones = [{"collection": collection, "doc_id": doc_id, "deleted_date": now} for doc_id in ids]
+    if tombstones:
+        await db[TOMBSTONES].insert_many(tombstones)
+
+
+async def backfill_updated_date(db, collections: Iterable[str]):
+    """Stamp updated_date (from created_date) on documents written before it was kept"""
+    now = datetime.utcnow()
+    await asyncio.gather(*(
+        db[name].update_many(
+            {"updated_date": None},
+            [{"$set": {"updated_date": {"$ifNull": ["$created_date", now]}}}]
+        )
+        for name in collections
+    ))
+
+
+async def changes_since(db, resources: List["Resource"], token: Optional[str] = None) -> dict:
+    """Documents changed and ids deleted since `token` for each resource, keyed by resource path"""
+    now = datetime.utcnow()
+    since = decode_token(token) if token else None
+    reset = since is None or since < now - TOMBSTONE_RETENTION
+    window = None if reset else since - SYNC_OVERLAP
+
+    async def changed(resource: "Resource") -> List[dict]:
+        query = {"updated_date": {"$gte": window}} if window else {}
+        docs = await db[resource.collection].find(query).to_list(None)
+        return [resource.list_transform(doc) for doc in docs] if resource.list_transform else docs
+
+    async def deleted() -> Dict[str, list]:
+        ids: Dict[str, list] = {resource.collection: [] for resource in resources}
+        if window:
+            query = {"deleted_date": {"$gte": window}, "collection": {"$in": list(ids)}}
+            async for tombstone in db[TOMBSTONES].find(query, {"collection": 1, "doc_id": 1}):
+                ids[tombstone["collection"]].append(tombstone["doc_id"])
+        return ids
+
+    *changed_docs, deleted_ids = await asyncio.gather(*(changed(resource) for resource in resources), deleted())
+    return {
+        "token": encode_token(now),
+        "reset": reset,
+        "resources": {
+            resource.path: {"changed": docs, "deleted": deleted_ids[resource.collection]}
+            for resource, docs in zip(resources, changed_docs)
+        },
+    }
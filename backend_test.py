@@ -1,168 +1,127 @@
 #!/usr/bin/env python3
 """
-Comprehensive backend API testing for ManPharma Tutorials app
-Testing all NEW enhanced features:
+Backend API tests for ManPharma Tutorials, run concurrently.
+
+Scenarios, each with its own data so they can run side by side:
 1. Revenue Tracking API
-2. Content Performance Analytics API  
+2. Content Performance Analytics API
 3. Idea Bank API
 4. Recurring Tasks API
 5. Enhanced Dashboard Stats
+plus race checks that fire the same write many times at once:
+6. Manual publish of one scheduled post (it must be posted exactly once)
+7. Recurring task generation (one task per template occurrence)
+and a delta sync check:
+8. /sync reports tasks created, updated and deleted since its token
+
+Every scenario starts at the same time, and --repeat N runs N copies of the
+whole suite in parallel to shake out races. Created records are removed
+with one bulk delete per resource.
+
+By default the app runs in process (httpx ASGI transport, no server) against
+a throwaway database on the local mongod (MONGO_URL from backend/.env,
+database --db-name, dropped afterwards), with the post scheduler and the
+recurring generator switched off. --url targets a running server instead:
+    python backend_test.py --repeat 20
+    python backend_test.py --url http://localhost:8001/api
 """
 
-import requests
-import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Any
+import argparse
+import asyncio
+import os
 import sys
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+import orjson
+
+BACKEND_DIR = Path(__file__).resolve().parent / "backend"
 
-# Backend URL from environment configuration
-BASE_URL = "https://content-flow-hub-1.preview.emergentagent.com/api"
 
 class APITester:
-    def __init__(self, base_url: str):
-        self.base_url = base_url
-        self.test_results = []
-        self.created_ids = {
-            'revenue': [],
-            'performance': [],
-            'ideas': [],
-            'recurring_tasks': []
-        }
-    
-    def log_test(self, test_name: str, passed: bool, details: str = ""):
-        self.test_results.append({
-            'test': test_name,
-            'passed': passed,
-            'details': details
-        })
-        status = "✅ PASS" if passed else "❌ FAIL"
-        print(f"{status}: {test_name}")
-        if details:
-            print(f"   Details: {details}")
-    
-    def make_request(self, method: str, endpoint: str, data: Dict = None) -> requests.Response:
-        url = f"{self.base_url}{endpoint}"
-        headers = {'Content-Type': 'application/json'}
-        
+    """One copy of the suite; `results` collects (scenario, test, passed, details)"""
+
+    def __init__(self, client: httpx.AsyncClient, run: int, race_width: int):
+        self.client = client
+        self.run = run
+        self.race_width = race_width
+        self.results: List[Dict[str, Any]] = []
+        self.timings: Dict[str, float] = {}
+        # resource path -> ids to bulk delete afterwards
+        self.created_ids: Dict[str, List[str]] = defaultdict(list)
+
+    def log_test(self, scenario: str, test_name: str, passed: bool, details: str = ""):
+        self.results.append({"run": self.run, "scenario": scenario, "test": test_name,
+                             "passed": passed, "details": details})
+
+    async def call(self, scenario: str, test_name: str, method: str, endpoint: str,
+                   data: Optional[dict] = None, expect: int = 200) -> Optional[Any]:
+        """Make a request, log whether it returned `expect`, and return the JSON body if it did"""
         try:
-            if method == "GET":
-                return requests.get(url, headers=headers, timeout=30)
-            elif method == "POST":
-                return requests.post(url, json=data, headers=headers, timeout=30)
-            elif method == "PUT":
-                return requests.put(url, json=data, headers=headers, timeout=30)
-            elif method == "DELETE":
-                return requests.delete(url, headers=headers, timeout=30)
-        except Exception as e:
-            raise Exception(f"Request failed: {str(e)}")
-
-    def test_revenue_tracking(self):
-        """Test Revenue Tracking API endpoints"""
-        print("\n=== Testing Revenue Tracking API ===")
-        
-        # Test data for realistic educational content revenue
-        revenue_data = {
+            response = await self.client.request(method, endpoint, json=data)
+        except httpx.HTTPError as e:
+            self.log_test(scenario, test_name, False, f"Request failed: {e!r}")
+            return None
+        passed = response.status_code == expect
+        self.log_test(scenario, test_name, passed,
+                      "" if passed else f"Status: {response.status_code}, Response: {response.text[:200]}")
+        return response.json() if passed else None
+
+    async def create(self, scenario: str, test_name: str, resource: str, data: dict) -> Optional[dict]:
+        created = await self.call(scenario, test_name, "POST", f"/{resource}", data)
+        if created:
+            self.created_ids[resource].append(created["_id"])
+        return created
+
+    def has_fields(self, scenario: str, test_name: str, doc: dict, fields: List[str]):
+        missing = [field for field in fields if field not in doc]
+        self.log_test(scenario, test_name, not missing, f"Missing: {missing}" if missing else "")
+
+    async def export(self, resource: str, **params) -> List[dict]:
+        response = await self.client.get(f"/{resource}/export", params={"format": "ndjson", **params})
+        response.raise_for_status()
+        return [orjson.loads(line) for line in response.content.splitlines() if line]
+
+    async def test_revenue_tracking(self):
+        s = "revenue"
+        revenue = await self.create(s, "Revenue CREATE", "revenue", {
             "amount": 250.75,
             "source_category": "Course Sales",
             "source_detail": "Pharmaceutical Chemistry Course",
             "platform": "Udemy",
             "payment_status": "Received",
             "payment_date": "2024-12-15T10:00:00Z",
-            "description": "Q4 course sales revenue"
-        }
-        
-        # 1. CREATE Revenue
-        try:
-            response = self.make_request("POST", "/revenue", revenue_data)
-            if response.status_code == 200:
-                created_revenue = response.json()
-                revenue_id = created_revenue.get("_id")
-                self.created_ids['revenue'].append(revenue_id)
-                self.log_test("Revenue CREATE", True, f"Created with ID: {revenue_id}")
-                
-                # Verify required fields
-                required_fields = ['amount', 'source_category', 'payment_status', 'payment_date']
-                missing_fields = [field for field in required_fields if field not in created_revenue]
-                if missing_fields:
-                    self.log_test("Revenue CREATE - Required Fields", False, f"Missing: {missing_fields}")
-                else:
-                    self.log_test("Revenue CREATE - Required Fields", True)
-            else:
-                self.log_test("Revenue CREATE", False, f"Status: {response.status_code}, Response: {response.text}")
-        except Exception as e:
-            self.log_test("Revenue CREATE", False, str(e))
-        
-        # 2. GET All Revenues
-        try:
-            response = self.make_request("GET", "/revenue")
-            if response.status_code == 200:
-                revenues = response.json()
-                self.log_test("Revenue GET All", True, f"Retrieved {len(revenues)} revenues")
-            else:
-                self.log_test("Revenue GET All", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("Revenue GET All", False, str(e))
-        
-        # 3. GET Single Revenue
-        if self.created_ids['revenue']:
-            try:
-                response = self.make_request("GET", f"/revenue/{self.created_ids['revenue'][0]}")
-                if response.status_code == 200:
-                    revenue = response.json()
-                    self.log_test("Revenue GET Single", True, f"Retrieved: {revenue.get('source_detail', 'N/A')}")
-                else:
-                    self.log_test("Revenue GET Single", False, f"Status: {response.status_code}")
-            except Exception as e:
-                self.log_test("Revenue GET Single", False, str(e))
-        
-        # 4. UPDATE Revenue
-        if self.created_ids['revenue']:
-            try:
-                update_data = {"payment_status": "Pending", "amount": 300.0}
-                response = self.make_request("PUT", f"/revenue/{self.created_ids['revenue'][0]}", update_data)
-                if response.status_code == 200:
-                    updated_revenue = response.json()
-                    self.log_test("Revenue UPDATE", True, f"Updated status: {updated_revenue.get('payment_status')}")
-                else:
-                    self.log_test("Revenue UPDATE", False, f"Status: {response.status_code}")
-            except Exception as e:
-                self.log_test("Revenue UPDATE", False, str(e))
-        
-        # 5. Monthly Summary
-        try:
-            response = self.make_request("GET", "/revenue/summary/monthly")
-            if response.status_code == 200:
-                monthly_data = response.json()
-                self.log_test("Revenue Monthly Summary", True, f"Retrieved {len(monthly_data)} months")
-                
-                # Verify summary structure
-                if monthly_data and isinstance(monthly_data[0], dict):
-                    required_summary_fields = ['month', 'total_received', 'total_pending', 'count']
-                    first_month = monthly_data[0]
-                    has_all_fields = all(field in first_month for field in required_summary_fields)
-                    self.log_test("Revenue Monthly Summary Structure", has_all_fields)
-            else:
-                self.log_test("Revenue Monthly Summary", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("Revenue Monthly Summary", False, str(e))
-        
-        # 6. Category Summary
-        try:
-            response = self.make_request("GET", "/revenue/summary/category")
-            if response.status_code == 200:
-                category_data = response.json()
-                self.log_test("Revenue Category Summary", True, f"Retrieved {len(category_data)} categories")
-            else:
-                self.log_test("Revenue Category Summary", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("Revenue Category Summary", False, str(e))
-
-    def test_content_performance(self):
-        """Test Content Performance Analytics API"""
-        print("\n=== Testing Content Performance Analytics API ===")
-        
-        # Test data for realistic pharmaceutical content
-        performance_data = {
+            "description": "Q4 course sales revenue",
+        })
+        if revenue:
+            self.has_fields(s, "Revenue CREATE - Required Fields", revenue,
+                            ["amount", "source_category", "payment_status", "payment_date"])
+
+        reads = [self.call(s, "Revenue GET All", "GET", "/revenue"),
+                 self.call(s, "Revenue Category Summary", "GET", "/revenue/summary/category")]
+        if revenue:
+            reads.append(self.call(s, "Revenue GET Single", "GET", f"/revenue/{revenue['_id']}"))
+        await asyncio.gather(*reads)
+
+        if revenue:
+            updated = await self.call(s, "Revenue UPDATE", "PUT", f"/revenue/{revenue['_id']}",
+                                      {"payment_status": "Pending", "amount": 300.0})
+            if updated:
+                self.log_test(s, "Revenue UPDATE - Values", updated.get("payment_status") == "Pending"
+                              and updated.get("amount") == 300.0, str(updated))
+
+        monthly = await self.call(s, "Revenue Monthly Summary", "GET", "/revenue/summary/monthly")
+        if monthly:
+            self.has_fields(s, "Revenue Monthly Summary Structure", monthly[0],
+                            ["month", "total_received", "total_pending", "count"])
+
+    async def test_content_performance(self):
+        s = "performance"
+        performance = await self.create(s, "Performance CREATE", "performance", {
             "content_title": "Introduction to Pharmacokinetics",
             "content_type": "Video",
             "platform": "YouTube",
@@ -171,208 +130,70 @@ class APITester:
             "comments": 156,
             "shares": 78,
             "reach": 18950,
-            "recorded_date": "2024-12-15T08:00:00Z"
-        }
-        
-        # 1. CREATE Performance Record
-        try:
-            response = self.make_request("POST", "/performance", performance_data)
-            if response.status_code == 200:
-                created_performance = response.json()
-                performance_id = created_performance.get("_id")
-                self.created_ids['performance'].append(performance_id)
-                self.log_test("Performance CREATE", True, f"Created with ID: {performance_id}")
-                
-                # Verify required fields
-                required_fields = ['content_title', 'content_type', 'platform', 'views']
-                missing_fields = [field for field in required_fields if field not in created_performance]
-                if missing_fields:
-                    self.log_test("Performance CREATE - Required Fields", False, f"Missing: {missing_fields}")
-                else:
-                    self.log_test("Performance CREATE - Required Fields", True)
-            else:
-                self.log_test("Performance CREATE", False, f"Status: {response.status_code}, Response: {response.text}")
-        except Exception as e:
-            self.log_test("Performance CREATE", False, str(e))
-        
-        # 2. GET All Performance Records
-        try:
-            response = self.make_request("GET", "/performance")
-            if response.status_code == 200:
-                performances = response.json()
-                self.log_test("Performance GET All", True, f"Retrieved {len(performances)} records")
-            else:
-                self.log_test("Performance GET All", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("Performance GET All", False, str(e))
-        
-        # 3. GET Single Performance
-        if self.created_ids['performance']:
-            try:
-                response = self.make_request("GET", f"/performance/{self.created_ids['performance'][0]}")
-                if response.status_code == 200:
-                    performance = response.json()
-                    self.log_test("Performance GET Single", True, f"Retrieved: {performance.get('content_title', 'N/A')}")
-                else:
-                    self.log_test("Performance GET Single", False, f"Status: {response.status_code}")
-            except Exception as e:
-                self.log_test("Performance GET Single", False, str(e))
-        
-        # 4. UPDATE Performance
-        if self.created_ids['performance']:
-            try:
-                update_data = {"views": 16000, "likes": 920}
-                response = self.make_request("PUT", f"/performance/{self.created_ids['performance'][0]}", update_data)
-                if response.status_code == 200:
-                    updated_performance = response.json()
-                    self.log_test("Performance UPDATE", True, f"Updated views: {updated_performance.get('views')}")
-                else:
-                    self.log_test("Performance UPDATE", False, f"Status: {response.status_code}")
-            except Exception as e:
-                self.log_test("Performance UPDATE", False, str(e))
-        
-        # 5. Top Content Analytics
-        try:
-            response = self.make_request("GET", "/performance/analytics/top-content")
-            if response.status_code == 200:
-                top_content = response.json()
-                self.log_test("Performance Top Content Analytics", True, f"Retrieved analytics with keys: {list(top_content.keys())}")
-                
-                # Verify analytics structure
-                if 'top_by_views' in top_content and 'top_by_engagement' in top_content:
-                    self.log_test("Performance Analytics Structure", True)
-                else:
-                    self.log_test("Performance Analytics Structure", False, "Missing top_by_views or top_by_engagement")
-            else:
-                self.log_test("Performance Top Content Analytics", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("Performance Top Content Analytics", False, str(e))
-        
-        # 6. Performance Trends
-        try:
-            response = self.make_request("GET", "/performance/analytics/trends")
-            if response.status_code == 200:
-                trends = response.json()
-                self.log_test("Performance Trends Analytics", True, f"Retrieved {len(trends)} trend records")
-            else:
-                self.log_test("Performance Trends Analytics", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("Performance Trends Analytics", False, str(e))
-
-    def test_idea_bank(self):
-        """Test Idea Bank API"""
-        print("\n=== Testing Idea Bank API ===")
-        
-        # Test data for realistic pharmaceutical education ideas
-        idea_data = {
+            "recorded_date": "2024-12-15T08:00:00Z",
+        })
+        if performance:
+            self.has_fields(s, "Performance CREATE - Required Fields", performance,
+                            ["content_title", "content_type", "platform", "views"])
+
+        reads = [self.call(s, "Performance GET All", "GET", "/performance"),
+                 self.call(s, "Performance Trends Analytics", "GET", "/performance/analytics/trends")]
+        if performance:
+            reads.append(self.call(s, "Performance GET Single", "GET", f"/performance/{performance['_id']}"))
+        await asyncio.gather(*reads)
+
+        if performance:
+            updated = await self.call(s, "Performance UPDATE", "PUT", f"/performance/{performance['_id']}",
+                                      {"views": 16000, "likes": 920})
+            if updated:
+                self.log_test(s, "Performance UPDATE - Values", updated.get("views") == 16000, str(updated))
+
+        top_content = await self.call(s, "Performance Top Content Analytics", "GET",
+                                      "/performance/analytics/top-content")
+        if top_content is not None:
+            self.has_fields(s, "Performance Analytics Structure", top_content, ["top_by_views", "top_by_engagement"])
+
+    async def test_idea_bank(self):
+        s = "ideas"
+        idea = await self.create(s, "Idea CREATE", "ideas", {
             "title": "Drug Interaction Video Series",
             "content": "Create comprehensive series covering major drug interactions in clinical practice",
             "tags": ["pharmacology", "drug interactions", "clinical", "safety"],
             "category": "Educational Content",
             "links": ["https://example.com/drug-interactions", "https://research.pharma.com/interactions"],
             "priority": "high",
-            "status": "researching"
-        }
-        
-        # 1. CREATE Idea
-        try:
-            response = self.make_request("POST", "/ideas", idea_data)
-            if response.status_code == 200:
-                created_idea = response.json()
-                idea_id = created_idea.get("_id")
-                self.created_ids['ideas'].append(idea_id)
-                self.log_test("Idea CREATE", True, f"Created with ID: {idea_id}")
-                
-                # Verify required fields and arrays
-                if created_idea.get('tags') and isinstance(created_idea['tags'], list):
-                    self.log_test("Idea CREATE - Tags Array", True, f"Tags: {created_idea['tags']}")
-                else:
-                    self.log_test("Idea CREATE - Tags Array", False)
-                
-                if created_idea.get('links') and isinstance(created_idea['links'], list):
-                    self.log_test("Idea CREATE - Links Array", True, f"Links count: {len(created_idea['links'])}")
-                else:
-                    self.log_test("Idea CREATE - Links Array", False)
-            else:
-                self.log_test("Idea CREATE", False, f"Status: {response.status_code}, Response: {response.text}")
-        except Exception as e:
-            self.log_test("Idea CREATE", False, str(e))
-        
-        # 2. GET All Ideas
-        try:
-            response = self.make_request("GET", "/ideas")
-            if response.status_code == 200:
-                ideas = response.json()
-                self.log_test("Idea GET All", True, f"Retrieved {len(ideas)} ideas")
-            else:
-                self.log_test("Idea GET All", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("Idea GET All", False, str(e))
-        
-        # 3. GET Single Idea
-        if self.created_ids['ideas']:
-            try:
-                response = self.make_request("GET", f"/ideas/{self.created_ids['ideas'][0]}")
-                if response.status_code == 200:
-                    idea = response.json()
-                    self.log_test("Idea GET Single", True, f"Retrieved: {idea.get('title', 'N/A')}")
-                else:
-                    self.log_test("Idea GET Single", False, f"Status: {response.status_code}")
-            except Exception as e:
-                self.log_test("Idea GET Single", False, str(e))
-        
-        # 4. UPDATE Idea
-        if self.created_ids['ideas']:
-            try:
-                update_data = {
-                    "status": "ready",
-                    "priority": "medium",
-                    "tags": ["pharmacology", "video", "advanced"]
-                }
-                response = self.make_request("PUT", f"/ideas/{self.created_ids['ideas'][0]}", update_data)
-                if response.status_code == 200:
-                    updated_idea = response.json()
-                    self.log_test("Idea UPDATE", True, f"Updated status: {updated_idea.get('status')}")
-                    
-                    # Verify updated_date field
-                    if 'updated_date' in updated_idea:
-                        self.log_test("Idea UPDATE - Updated Date", True)
-                    else:
-                        self.log_test("Idea UPDATE - Updated Date", False)
-                else:
-                    self.log_test("Idea UPDATE", False, f"Status: {response.status_code}")
-            except Exception as e:
-                self.log_test("Idea UPDATE", False, str(e))
-        
-        # 5. Search Ideas
-        try:
-            # Search by title
-            response = self.make_request("GET", "/ideas/search/drug")
-            if response.status_code == 200:
-                search_results = response.json()
-                self.log_test("Idea SEARCH by Title", True, f"Found {len(search_results)} results for 'drug'")
-            else:
-                self.log_test("Idea SEARCH by Title", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("Idea SEARCH by Title", False, str(e))
-        
-        # Search by tag
-        try:
-            response = self.make_request("GET", "/ideas/search/pharmacology")
-            if response.status_code == 200:
-                search_results = response.json()
-                self.log_test("Idea SEARCH by Tag", True, f"Found {len(search_results)} results for 'pharmacology'")
-            else:
-                self.log_test("Idea SEARCH by Tag", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("Idea SEARCH by Tag", False, str(e))
-
-    def test_recurring_tasks(self):
-        """Test Recurring Tasks API"""
-        print("\n=== Testing Recurring Tasks API ===")
-        
-        # Test data for realistic recurring tasks
-        recurring_task_data = {
+            "status": "researching",
+        })
+        if idea:
+            self.log_test(s, "Idea CREATE - Tags Array", isinstance(idea.get("tags"), list) and bool(idea["tags"]))
+            self.log_test(s, "Idea CREATE - Links Array", isinstance(idea.get("links"), list) and bool(idea["links"]))
+
+        reads = [self.call(s, "Idea GET All", "GET", "/ideas")]
+        if idea:
+            reads.append(self.call(s, "Idea GET Single", "GET", f"/ideas/{idea['_id']}"))
+        await asyncio.gather(*reads)
+
+        if idea:
+            updated = await self.call(s, "Idea UPDATE", "PUT", f"/ideas/{idea['_id']}", {
+                "status": "ready",
+                "priority": "medium",
+                "tags": ["pharmacology", "video", "advanced"],
+            })
+            if updated:
+                self.log_test(s, "Idea UPDATE - Updated Date", "updated_date" in updated)
+
+        by_title, by_tag = await asyncio.gather(
+            self.call(s, "Idea SEARCH by Title", "GET", "/ideas/search/drug"),
+            self.call(s, "Idea SEARCH by Tag", "GET", "/ideas/search/pharmacology"),
+        )
+        for test_name, found in (("Idea SEARCH by Title - Results", by_title), ("Idea SEARCH by Tag - Results", by_tag)):
+            if idea and found is not None:
+                # Our own idea matches both, though it may sit on a later page with many parallel runs
+                self.log_test(s, test_name, len(found["items"]) > 0, f"{len(found['items'])} results")
+
+    async def test_recurring_tasks(self):
+        s = "recurring"
+        template = await self.create(s, "Recurring Task CREATE", "recurring-tasks", {
             "title": "Weekly Content Planning Session",
             "description": "Review upcoming content calendar and plan new pharmaceutical topics",
             "priority": "high",
@@ -380,245 +201,214 @@ class APITester:
             "frequency": "weekly",
             "frequency_detail": "Every Monday",
             "next_due_date": (datetime.utcnow() + timedelta(days=1)).isoformat() + "Z",
-            "is_active": True
-        }
-        
-        # 1. CREATE Recurring Task
-        try:
-            response = self.make_request("POST", "/recurring-tasks", recurring_task_data)
-            if response.status_code == 200:
-                created_task = response.json()
-                task_id = created_task.get("_id")
-                self.created_ids['recurring_tasks'].append(task_id)
-                self.log_test("Recurring Task CREATE", True, f"Created with ID: {task_id}")
-                
-                # Verify required fields
-                required_fields = ['title', 'frequency', 'next_due_date', 'is_active']
-                missing_fields = [field for field in required_fields if field not in created_task]
-                if missing_fields:
-                    self.log_test("Recurring Task CREATE - Required Fields", False, f"Missing: {missing_fields}")
-                else:
-                    self.log_test("Recurring Task CREATE - Required Fields", True)
-            else:
-                self.log_test("Recurring Task CREATE", False, f"Status: {response.status_code}, Response: {response.text}")
-        except Exception as e:
-            self.log_test("Recurring Task CREATE", False, str(e))
-        
-        # 2. GET All Recurring Tasks
-        try:
-            response = self.make_request("GET", "/recurring-tasks")
-            if response.status_code == 200:
-                tasks = response.json()
-                self.log_test("Recurring Task GET All", True, f"Retrieved {len(tasks)} recurring tasks")
-            else:
-                self.log_test("Recurring Task GET All", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("Recurring Task GET All", False, str(e))
-        
-        # 3. GET Single Recurring Task
-        if self.created_ids['recurring_tasks']:
-            try:
-                response = self.make_request("GET", f"/recurring-tasks/{self.created_ids['recurring_tasks'][0]}")
-                if response.status_code == 200:
-                    task = response.json()
-                    self.log_test("Recurring Task GET Single", True, f"Retrieved: {task.get('title', 'N/A')}")
-                else:
-                    self.log_test("Recurring Task GET Single", False, f"Status: {response.status_code}")
-            except Exception as e:
-                self.log_test("Recurring Task GET Single", False, str(e))
-        
-        # 4. UPDATE Recurring Task
-        if self.created_ids['recurring_tasks']:
-            try:
-                update_data = {"frequency": "monthly", "is_active": False}
-                response = self.make_request("PUT", f"/recurring-tasks/{self.created_ids['recurring_tasks'][0]}", update_data)
-                if response.status_code == 200:
-                    updated_task = response.json()
-                    self.log_test("Recurring Task UPDATE", True, f"Updated frequency: {updated_task.get('frequency')}")
-                else:
-                    self.log_test("Recurring Task UPDATE", False, f"Status: {response.status_code}")
-            except Exception as e:
-                self.log_test("Recurring Task UPDATE", False, str(e))
-        
-        # 5. Generate Task Instance (single)
-        if self.created_ids['recurring_tasks']:
+            "is_active": True,
+        })
+        if template:
+            self.has_fields(s, "Recurring Task CREATE - Required Fields", template,
+                            ["title", "frequency", "next_due_date", "is_active"])
+
+        reads = [self.call(s, "Recurring Task GET All", "GET", "/recurring-tasks")]
+        if template:
+            reads.append(self.call(s, "Recurring Task GET Single", "GET", f"/recurring-tasks/{template['_id']}"))
+        await asyncio.gather(*reads)
+
+        if template:
+            path = f"/recurring-tasks/{template['_id']}"
+            updated = await self.call(s, "Recurring Task UPDATE", "PUT", path, {"frequency": "monthly", "is_active": False})
+            if updated:
+                self.log_test(s, "Recurring Task UPDATE - Values", updated.get("frequency") == "monthly")
+
+            await self.call(s, "Recurring Task Make Due", "PUT", path,
+                            {"is_active": True, "next_due_date": datetime.utcnow().isoformat() + "Z"})
+            generated = await self.call(s, "Recurring Task GENERATE Instance", "POST", f"{path}/generate")
+            if generated:
+                self.created_ids["tasks"].append(generated["_id"])
+                self.log_test(s, "Recurring Task GENERATE - Correct Fields",
+                              bool(generated.get("due_date")) and generated.get("status") == "pending")
+
+        result = await self.call(s, "Recurring Task AUTO-GENERATE", "POST", "/recurring-tasks/auto-generate")
+        if result is not None:
+            self.has_fields(s, "Recurring Task AUTO-GENERATE Response", result, ["message", "count"])
+
+    async def test_enhanced_dashboard(self):
+        s = "dashboard"
+        stats = await self.call(s, "Dashboard Stats GET", "GET", "/dashboard/stats")
+        if stats is None:
+            return
+        self.has_fields(s, "Dashboard Stats - Enhanced Fields", stats, ["urgent_tasks", "monthly_income", "pending_payments"])
+        self.log_test(s, "Dashboard Stats - Urgent Tasks Array", isinstance(stats.get("urgent_tasks"), list))
+        self.log_test(s, "Dashboard Stats - Financial Fields",
+                      isinstance(stats.get("monthly_income"), (int, float))
+                      and isinstance(stats.get("pending_payments"), (int, float)))
+        self.has_fields(s, "Dashboard Stats - Original Fields", stats,
+                        ["videos_in_progress", "upcoming_calendar_items", "pending_tasks",
+                         "total_videos", "total_study_notes"])
+
+    async def test_publish_race(self):
+        """Publish one post from many clients at once: exactly one publish may go through"""
+        s = "publish_race"
+        post = await self.create(s, "Scheduled Post CREATE", "social/scheduled-posts", {
+            "topic": f"Race test {self.run}",
+            "caption": "Concurrent publish",
+            "platform": "instagram",
+            # Far enough out that a running scheduler won't pick it up
+            "scheduled_date": (datetime.utcnow() + timedelta(days=30)).isoformat() + "Z",
+            "scheduled_time": "10:00",
+        })
+        if not post:
+            return
+        responses = await asyncio.gather(
+            *(self.client.post(f"/social/publish/{post['_id']}") for _ in range(self.race_width)),
+            return_exceptions=True,
+        )
+        codes = Counter(r.status_code if isinstance(r, httpx.Response) else type(r).__name__ for r in responses)
+        self.log_test(s, "Concurrent PUBLISH - One Success", codes[200] == 1, str(dict(codes)))
+        self.log_test(s, "Concurrent PUBLISH - Others Rejected", codes[200] + codes[409] == self.race_width,
+                      str(dict(codes)))
+        logs = [log for log in await self.export("social/posting-logs", platform="instagram")
+                if log["post_id"] == post["_id"]]
+        self.log_test(s, "Concurrent PUBLISH - One Posting Log", len(logs) == 1, f"{len(logs)} logs")
+
+    async def test_recurrence_race(self):
+        """Generate one template's tasks from many clients at once: no occurrence may be created twice"""
+        s = "recurrence_race"
+        template = await self.create(s, "Recurring Task CREATE", "recurring-tasks", {
+            "title": f"Race test {self.run}",
+            "frequency": "daily",
+            "next_due_date": (datetime.utcnow() - timedelta(days=3)).isoformat() + "Z",
+        })
+        if not template:
+            return
+        path = f"/recurring-tasks/{template['_id']}"
+        calls = [self.client.post(f"{path}/generate") for _ in range(self.race_width)]
+        calls += [self.client.post("/recurring-tasks/auto-generate") for _ in range(self.race_width)]
+        responses = await asyncio.gather(*calls, return_exceptions=True)
+        failures = [r for r in responses if not isinstance(r, httpx.Response) or r.status_code != 200]
+        self.log_test(s, "Concurrent GENERATE - All Succeed", not failures, str(failures[:3]))
+
+        tasks = [task for task in await self.export("tasks", fields="recurring_task_id,occurrence_date")
+                 if task.get("recurring_task_id") == template["_id"]]
+        self.created_ids["tasks"].extend(task["_id"] for task in tasks)
+        occurrences = Counter(task["occurrence_date"] for task in tasks)
+        duplicates = {date: count for date, count in occurrences.items() if count > 1}
+        self.log_test(s, "Concurrent GENERATE - No Duplicate Occurrences", bool(tasks) and not duplicates,
+                      f"{len(tasks)} tasks, duplicates: {duplicates}")
+
+    async def test_delta_sync(self):
+        """Changes made after a sync come back from the next one, deletes as tombstones"""
+        s = "sync"
+        snapshot = await self.call(s, "Sync Snapshot", "GET", "/sync?resources=tasks")
+        if snapshot is None:
+            return
+        self.log_test(s, "Sync Snapshot - Reset", snapshot["reset"] is True and "tasks" in snapshot["resources"])
+
+        kept, removed = await asyncio.gather(
+            self.create(s, "Task CREATE", "tasks", {"title": f"Sync test {self.run}"}),
+            self.call(s, "Task CREATE (to delete)", "POST", "/tasks", {"title": f"Sync delete {self.run}"}),
+        )
+        if not kept or not removed:
+            return
+        await self.call(s, "Task UPDATE", "PUT", f"/tasks/{kept['_id']}", {"status": "in_progress"})
+        await self.call(s, "Task DELETE", "DELETE", f"/tasks/{removed['_id']}")
+
+        delta = await self.call(s, "Sync Delta", "GET", f"/sync?since={snapshot['token']}&resources=tasks")
+        if delta is None:
+            return
+        tasks = delta["resources"]["tasks"]
+        changed = {task["_id"]: task for task in tasks["changed"]}
+        self.log_test(s, "Sync Delta - Not Reset", delta["reset"] is False)
+        self.log_test(s, "Sync Delta - Updated Task", changed.get(kept["_id"], {}).get("status") == "in_progress",
+                      str(changed.get(kept["_id"])))
+        self.log_test(s, "Sync Delta - Deleted Task", removed["_id"] in tasks["deleted"]
+                      and removed["_id"] not in changed, str(tasks["deleted"][:5]))
+        await self.call(s, "Sync Invalid Token", "GET", "/sync?since=yesterday", expect=400)
+
+    async def cleanup(self):
+        """Delete everything this run created, one bulk request per resource"""
+        await asyncio.gather(*(
+            self.client.post(f"/{resource}/bulk", json={"delete": ids})
+            for resource, ids in self.created_ids.items() if ids
+        ))
+
+    async def run_all_tests(self):
+        scenarios = [self.test_revenue_tracking, self.test_content_performance, self.test_idea_bank,
+                     self.test_recurring_tasks, self.test_enhanced_dashboard,
+                     self.test_publish_race, self.test_recurrence_race, self.test_delta_sync]
+
+        async def timed(scenario):
+            start = time.perf_counter()
             try:
-                # First, make it active and due
-                update_data = {"is_active": True, "next_due_date": datetime.utcnow().isoformat() + "Z"}
-                self.make_request("PUT", f"/recurring-tasks/{self.created_ids['recurring_tasks'][0]}", update_data)
-                
-                # Now generate task instance
-                response = self.make_request("POST", f"/recurring-tasks/{self.created_ids['recurring_tasks'][0]}/generate")
-                if response.status_code == 200:
-                    generated_task = response.json()
-                    self.log_test("Recurring Task GENERATE Instance", True, f"Generated task: {generated_task.get('title', 'N/A')}")
-                    
-                    # Verify generated task has correct fields
-                    if generated_task.get('due_date') and generated_task.get('status') == 'pending':
-                        self.log_test("Recurring Task GENERATE - Correct Fields", True)
-                    else:
-                        self.log_test("Recurring Task GENERATE - Correct Fields", False)
-                else:
-                    self.log_test("Recurring Task GENERATE Instance", False, f"Status: {response.status_code}")
+                await scenario()
             except Exception as e:
-                self.log_test("Recurring Task GENERATE Instance", False, str(e))
-        
-        # 6. Auto-Generate All Due Tasks
-        try:
-            response = self.make_request("POST", "/recurring-tasks/auto-generate")
-            if response.status_code == 200:
-                result = response.json()
-                self.log_test("Recurring Task AUTO-GENERATE", True, f"Generated {result.get('count', 0)} tasks")
-                
-                # Verify response structure
-                if 'message' in result and 'count' in result:
-                    self.log_test("Recurring Task AUTO-GENERATE Response", True)
-                else:
-                    self.log_test("Recurring Task AUTO-GENERATE Response", False)
-            else:
-                self.log_test("Recurring Task AUTO-GENERATE", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("Recurring Task AUTO-GENERATE", False, str(e))
-
-    def test_enhanced_dashboard(self):
-        """Test Enhanced Dashboard Stats"""
-        print("\n=== Testing Enhanced Dashboard Stats ===")
-        
-        try:
-            response = self.make_request("GET", "/dashboard/stats")
-            if response.status_code == 200:
-                stats = response.json()
-                self.log_test("Dashboard Stats GET", True, f"Retrieved dashboard stats")
-                
-                # Verify enhanced fields are present
-                required_new_fields = ['urgent_tasks', 'monthly_income', 'pending_payments']
-                missing_fields = [field for field in required_new_fields if field not in stats]
-                
-                if missing_fields:
-                    self.log_test("Dashboard Stats - Enhanced Fields", False, f"Missing: {missing_fields}")
-                else:
-                    self.log_test("Dashboard Stats - Enhanced Fields", True)
-                
-                # Verify urgent_tasks is an array
-                if isinstance(stats.get('urgent_tasks'), list):
-                    self.log_test("Dashboard Stats - Urgent Tasks Array", True, f"Found {len(stats['urgent_tasks'])} urgent tasks")
-                else:
-                    self.log_test("Dashboard Stats - Urgent Tasks Array", False)
-                
-                # Verify financial fields are numbers
-                income_is_number = isinstance(stats.get('monthly_income'), (int, float))
-                pending_is_number = isinstance(stats.get('pending_payments'), (int, float))
-                
-                if income_is_number and pending_is_number:
-                    self.log_test("Dashboard Stats - Financial Fields", True, f"Income: {stats.get('monthly_income')}, Pending: {stats.get('pending_payments')}")
-                else:
-                    self.log_test("Dashboard Stats - Financial Fields", False)
-                
-                # Verify original fields still present
-                original_fields = ['videos_in_progress', 'upcoming_calendar_items', 'pending_tasks', 'total_videos', 'total_study_notes']
-                missing_original = [field for field in original_fields if field not in stats]
-                
-                if missing_original:
-                    self.log_test("Dashboard Stats - Original Fields", False, f"Missing original fields: {missing_original}")
-                else:
-                    self.log_test("Dashboard Stats - Original Fields", True)
-                    
-            else:
-                self.log_test("Dashboard Stats GET", False, f"Status: {response.status_code}")
-        except Exception as e:
-            self.log_test("Dashboard Stats GET", False, str(e))
-
-    def cleanup(self):
-        """Clean up created test data"""
-        print("\n=== Cleaning Up Test Data ===")
-        
-        # Clean up revenue records
-        for revenue_id in self.created_ids['revenue']:
-            try:
-                self.make_request("DELETE", f"/revenue/{revenue_id}")
-                print(f"Deleted revenue: {revenue_id}")
-            except:
-                pass
-        
-        # Clean up performance records  
-        for performance_id in self.created_ids['performance']:
-            try:
-                self.make_request("DELETE", f"/performance/{performance_id}")
-                print(f"Deleted performance: {performance_id}")
-            except:
-                pass
-        
-        # Clean up ideas
-        for idea_id in self.created_ids['ideas']:
-            try:
-                self.make_request("DELETE", f"/ideas/{idea_id}")
-                print(f"Deleted idea: {idea_id}")
-            except:
-                pass
-        
-        # Clean up recurring tasks
-        for task_id in self.created_ids['recurring_tasks']:
-            try:
-                self.make_request("DELETE", f"/recurring-tasks/{task_id}")
-                print(f"Deleted recurring task: {task_id}")
-            except:
-                pass
-
-    def run_all_tests(self):
-        """Run all API tests"""
-        print(f"🚀 Starting ManPharma Tutorials Backend API Tests")
-        print(f"Backend URL: {self.base_url}")
-        print("=" * 80)
-        
-        try:
-            # Test all new features
-            self.test_revenue_tracking()
-            self.test_content_performance() 
-            self.test_idea_bank()
-            self.test_recurring_tasks()
-            self.test_enhanced_dashboard()
-            
-            # Clean up test data
-            self.cleanup()
-            
-            # Print summary
-            self.print_summary()
-            
-        except Exception as e:
-            print(f"❌ CRITICAL ERROR: {str(e)}")
-            return False
-
-    def print_summary(self):
-        """Print test results summary"""
-        print("\n" + "=" * 80)
-        print("📊 TEST RESULTS SUMMARY")
-        print("=" * 80)
-        
-        passed = sum(1 for result in self.test_results if result['passed'])
-        total = len(self.test_results)
-        failure_rate = ((total - passed) / total * 100) if total > 0 else 0
-        
-        print(f"Total Tests: {total}")
-        print(f"Passed: {passed}")
-        print(f"Failed: {total - passed}")
-        print(f"Success Rate: {(passed/total*100):.1f}%")
-        
-        if failure_rate > 0:
-            print(f"\n❌ FAILED TESTS:")
-            for result in self.test_results:
-                if not result['passed']:
-                    print(f"  - {result['test']}: {result['details']}")
-        
-        print("\n🎯 NEW FEATURES TESTED:")
-        print("  ✅ Revenue Tracking with CRUD + Monthly/Category summaries")
-        print("  ✅ Content Performance Analytics with Top Content/Trends")
-        print("  ✅ Idea Bank with Search functionality")
-        print("  ✅ Recurring Tasks with Auto-generation")
-        print("  ✅ Enhanced Dashboard with Income/Urgent tasks")
-        
-        return passed == total
+                self.log_test(scenario.__name__, "CRITICAL ERROR", False, repr(e))
+            self.timings[scenario.__name__] = time.perf_counter() - start
+
+        await asyncio.gather(*(timed(scenario) for scenario in scenarios))
+        await self.cleanup()
+
+
+def print_summary(testers: List[APITester], wall_clock: float, verbose: bool) -> bool:
+    results = [result for tester in testers for result in tester.results]
+    failed = [result for result in results if not result["passed"]]
+    print("=" * 80)
+    print("📊 TEST RESULTS SUMMARY")
+    print("=" * 80)
+    if verbose:
+        for result in results:
+            status = "✅ PASS" if result["passed"] else "❌ FAIL"
+            print(f"{status}: [run {result['run']}] {result['test']} {result['details']}")
+    print(f"Runs: {len(testers)}")
+    print(f"Total Tests: {len(results)}")
+    print(f"Passed: {len(results) - len(failed)}")
+    print(f"Failed: {len(failed)}")
+    print(f"Wall clock: {wall_clock:.2f}s")
+    print("\n⏱  Scenario time (max over runs):")
+    for name in testers[0].timings:
+        slowest = max(tester.timings.get(name, 0) for tester in testers)
+        print(f"  {name}: {slowest * 1000:.0f} ms")
+    if failed:
+        print("\n❌ FAILED TESTS:")
+        for result in failed:
+            print(f"  - [run {result['run']}] {result['scenario']}: {result['test']}: {result['details']}")
+    return not failed
+
+
+async def main(args) -> bool:
+    async def run_suite(client: httpx.AsyncClient) -> bool:
+        print(f"🚀 Starting ManPharma Tutorials Backend API Tests ({args.repeat} parallel runs)")
+        testers = [APITester(client, run, args.race_width) for run in range(1, args.repeat + 1)]
+        start = time.perf_counter()
+        await asyncio.gather(*(tester.run_all_tests() for tester in testers))
+        return print_summary(testers, time.perf_counter() - start, args.verbose)
+
+    limits = httpx.Limits(max_connections=args.max_connections)
+    if args.url:
+        async with httpx.AsyncClient(base_url=args.url, timeout=30, limits=limits) as client:
+            return await run_suite(client)
+
+    os.environ["DB_NAME"] = args.db_name
+    os.environ["SCHEDULER_ENABLED"] = "false"
+    os.environ["RECURRING_GENERATOR_ENABLED"] = "false"
+    sys.path.insert(0, str(BACKEND_DIR))
+    import server
+
+    try:
+        async with server.app.router.lifespan_context(server.app):
+            # Unhandled errors come back as 500s, as from a real server
+            transport = httpx.ASGITransport(app=server.app, raise_app_exceptions=False)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test/api", timeout=30) as client:
+                return await run_suite(client)
+    finally:
+        await server.get_db().client.drop_database(args.db_name)
+
 
 if __name__ == "__main__":
-    tester = APITester(BASE_URL)
-    success = tester.run_all_tests()
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="base URL of a running server, e.g. http://localhost:8001/api")
+    parser.add_argument("--repeat", type=int, default=1, help="copies of the suite to run in parallel")
+    parser.add_argument("--race-width", type=int, default=10, help="concurrent calls per race check")
+    parser.add_argument("--db-name", default="manpharma_test", help="throwaway database for in-process runs")
+    parser.add_argument("--max-connections", type=int, default=100, help="HTTP connection limit with --url")
+    parser.add_argument("--verbose", action="store_true", help="print every test, not just failures")
+    args = parser.parse_args()
+    sys.exit(0 if asyncio.run(main(args)) else 1)
@@ -16,6 +16,7 @@ import { MaterialCommunityIcons } from '@expo/vector-icons';
 import { Card, Button, Chip } from 'react-native-paper';
 import { Calendar } from 'react-native-calendars';
 import DateTimePicker from '@react-native-community/datetimepicker';
+import { fetchAllPages } from '../../utils/api';
 
 const BACKEND_URL = process.env.EXPO_PUBLIC_BACKEND_URL;
 
@@ -56,8 +57,7 @@ export default function CalendarScreen() {
 
   const fetchItems = async () => {
     try {
-      const response = await fetch(`${BACKEND_URL}/api/calendar`);
-      const data = await response.json();
+      const data = await fetchAllPages<CalendarItem>('/api/calendar');
       setItems(data);
     } catch (error) {
       console.error('Error fetching calendar items:', error);
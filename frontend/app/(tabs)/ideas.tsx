@@ -12,6 +12,7 @@ import {
 } from 'react-native';
 import { MaterialCommunityIcons } from '@expo/vector-icons';
 import { Card, Button, Chip } from 'react-native-paper';
+import { fetchAllPages } from '../../utils/api';
 
 const BACKEND_URL = process.env.EXPO_PUBLIC_BACKEND_URL;
 
@@ -55,8 +56,7 @@ export default function IdeasScreen() {
 
   const fetchIdeas = async () => {
     try {
-      const response = await fetch(`${BACKEND_URL}/api/ideas`);
-      const data = await response.json();
+      const data = await fetchAllPages<Idea>('/api/ideas');
       setIdeas(data);
       setFilteredIdeas(data);
     } catch (error) {
@@ -13,6 +13,7 @@ import {
 import { MaterialCommunityIcons } from '@expo/vector-icons';
 import { Card, Button, ProgressBar } from 'react-native-paper';
 import Slider from '@react-native-community/slider';
+import { fetchAllPages } from '../../utils/api';
 
 const BACKEND_URL = process.env.EXPO_PUBLIC_BACKEND_URL;
 
@@ -42,8 +43,7 @@ export default function NotesScreen() {
 
   const fetchNotes = async () => {
     try {
-      const response = await fetch(`${BACKEND_URL}/api/study-notes`);
-      const data = await response.json();
+      const data = await fetchAllPages<StudyNote>('/api/study-notes');
       setNotes(data);
     } catch (error) {
       console.error('Error fetching notes:', error);
@@ -15,6 +15,7 @@ import {
 import { MaterialCommunityIcons } from '@expo/vector-icons';
 import { Card, Button, Chip } from 'react-native-paper';
 import DateTimePicker from '@react-native-community/datetimepicker';
+import { fetchAllPages } from '../../utils/api';
 
 const BACKEND_URL = process.env.EXPO_PUBLIC_BACKEND_URL;
 
@@ -51,8 +52,7 @@ export default function TasksScreen() {
 
   const fetchTasks = async () => {
     try {
-      const response = await fetch(`${BACKEND_URL}/api/tasks`);
-      const data = await response.json();
+      const data = await fetchAllPages<Task>('/api/tasks');
       // Sort: incomplete first, then completed at bottom
       const sorted = data.sort((a: Task, b: Task) => {
         if (a.status === 'completed' && b.status !== 'completed') return 1;
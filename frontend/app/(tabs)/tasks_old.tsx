@@ -1,634 +0,0 @@
-import React, { useState, useEffect } from 'react';
-import {
-  View,
-  Text,
-  StyleSheet,
-  ScrollView,
-  RefreshControl,
-  TouchableOpacity,
-  TextInput,
-  Modal,
-  Alert,
-} from 'react-native';
-import { MaterialCommunityIcons } from '@expo/vector-icons';
-import { Card, Button, Chip } from 'react-native-paper';
-import DateTimePicker from '@react-native-community/datetimepicker';
-
-const BACKEND_URL = process.env.EXPO_PUBLIC_BACKEND_URL;
-
-interface Task {
-  _id: string;
-  title: string;
-  description: string;
-  priority: string;
-  status: string;
-  due_date?: string;
-  category: string;
-  created_date: string;
-}
-
-export default function TasksScreen() {
-  const [tasks, setTasks] = useState<Task[]>([]);
-  const [refreshing, setRefreshing] = useState(false);
-  const [loading, setLoading] = useState(true);
-  const [modalVisible, setModalVisible] = useState(false);
-  const [showDueDatePicker, setShowDueDatePicker] = useState(false);
-  const [selectedTask, setSelectedTask] = useState<Task | null>(null);
-  const [filterStatus, setFilterStatus] = useState<string>('all');
-  
-  const [formData, setFormData] = useState({
-    title: '',
-    description: '',
-    priority: 'medium',
-    status: 'pending',
-    due_date: new Date(),
-    category: '',
-  });
-
-  const priorities = ['low', 'medium', 'high'];
-  const statuses = ['pending', 'in_progress', 'completed'];
-  const categories = ['Content', 'Editing', 'Research', 'Admin', 'Other'];
-
-  const fetchTasks = async () => {
-    try {
-      const response = await fetch(`${BACKEND_URL}/api/tasks`);
-      const data = await response.json();
-      setTasks(data);
-    } catch (error) {
-      console.error('Error fetching tasks:', error);
-    } finally {
-      setLoading(false);
-      setRefreshing(false);
-    }
-  };
-
-  useEffect(() => {
-    fetchTasks();
-  }, []);
-
-  const onRefresh = () => {
-    setRefreshing(true);
-    fetchTasks();
-  };
-
-  const openModal = (task?: Task) => {
-    if (task) {
-      setSelectedTask(task);
-      setFormData({
-        title: task.title,
-        description: task.description,
-        priority: task.priority,
-        status: task.status,
-        due_date: task.due_date ? new Date(task.due_date) : new Date(),
-        category: task.category,
-      });
-    } else {
-      setSelectedTask(null);
-      setFormData({
-        title: '',
-        description: '',
-        priority: 'medium',
-        status: 'pending',
-        due_date: new Date(),
-        category: '',
-      });
-    }
-    setModalVisible(true);
-  };
-
-  const saveTask = async () => {
-    if (!formData.title.trim()) {
-      Alert.alert('Error', 'Please enter a task title');
-      return;
-    }
-
-    try {
-      const url = selectedTask
-        ? `${BACKEND_URL}/api/tasks/${selectedTask._id}`
-        : `${BACKEND_URL}/api/tasks`;
-      
-      const method = selectedTask ? 'PUT' : 'POST';
-
-      const response = await fetch(url, {
-        method,
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({
-          ...formData,
-          due_date: formData.due_date.toISOString(),
-        }),
-      });
-
-      if (response.ok) {
-        setModalVisible(false);
-        fetchTasks();
-      }
-    } catch (error) {
-      console.error('Error saving task:', error);
-      Alert.alert('Error', 'Failed to save task');
-    }
-  };
-
-  const deleteTask = async (taskId: string) => {
-    Alert.alert('Delete Task', 'Are you sure you want to delete this task?', [
-      { text: 'Cancel', style: 'cancel' },
-      {
-        text: 'Delete',
-        style: 'destructive',
-        onPress: async () => {
-          try {
-            await fetch(`${BACKEND_URL}/api/tasks/${taskId}`, {
-              method: 'DELETE',
-            });
-            fetchTasks();
-          } catch (error) {
-            console.error('Error deleting task:', error);
-          }
-        },
-      },
-    ]);
-  };
-
-  const getPriorityColor = (priority: string) => {
-    switch (priority) {
-      case 'high': return '#f44336';
-      case 'medium': return '#FF9800';
-      case 'low': return '#4CAF50';
-      default: return '#999';
-    }
-  };
-
-  const getStatusIcon = (status: string) => {
-    switch (status) {
-      case 'completed': return 'check-circle';
-      case 'in_progress': return 'progress-clock';
-      default: return 'circle-outline';
-    }
-  };
-
-  const filteredTasks = filterStatus === 'all' 
-    ? tasks 
-    : tasks.filter(task => task.status === filterStatus);
-
-  if (loading) {
-    return (
-      <View style={styles.centerContainer}>
-        <MaterialCommunityIcons name="loading" size={48} color="#6200ee" />
-        <Text style={styles.loadingText}>Loading tasks...</Text>
-      </View>
-    );
-  }
-
-  return (
-    <View style={styles.container}>
-      <View style={styles.filterContainer}>
-        <ScrollView horizontal showsHorizontalScrollIndicator={false}>
-          {['all', ...statuses].map((status) => (
-            <TouchableOpacity
-              key={status}
-              onPress={() => setFilterStatus(status)}
-            >
-              <Chip
-                selected={filterStatus === status}
-                style={styles.filterChip}
-                selectedColor="#6200ee"
-              >
-                {status === 'all' ? 'All' : status.replace('_', ' ')}
-              </Chip>
-            </TouchableOpacity>
-          ))}
-        </ScrollView>
-      </View>
-
-      <ScrollView
-        style={styles.scrollView}
-        contentContainerStyle={styles.contentContainer}
-        refreshControl={
-          <RefreshControl refreshing={refreshing} onRefresh={onRefresh} />
-        }
-      >
-        {filteredTasks.length === 0 ? (
-          <View style={styles.emptyContainer}>
-            <MaterialCommunityIcons name="clipboard-check-outline" size={64} color="#ccc" />
-            <Text style={styles.emptyText}>No tasks found</Text>
-            <Text style={styles.emptySubtext}>Create your first task</Text>
-          </View>
-        ) : (
-          filteredTasks.map((task) => (
-            <Card key={task._id} style={styles.taskCard}>
-              <TouchableOpacity onPress={() => openModal(task)}>
-                <Card.Content>
-                  <View style={styles.taskHeader}>
-                    <View style={styles.taskTitleContainer}>
-                      <View style={styles.titleRow}>
-                        <MaterialCommunityIcons
-                          name={getStatusIcon(task.status)}
-                          size={24}
-                          color={task.status === 'completed' ? '#4CAF50' : '#666'}
-                        />
-                        <Text
-                          style={[
-                            styles.taskTitle,
-                            task.status === 'completed' && styles.completedTitle,
-                          ]}
-                        >
-                          {task.title}
-                        </Text>
-                      </View>
-                      <View style={styles.badgesRow}>
-                        <View
-                          style={[
-                            styles.priorityBadge,
-                            { backgroundColor: getPriorityColor(task.priority) },
-                          ]}
-                        >
-                          <Text style={styles.priorityText}>{task.priority}</Text>
-                        </View>
-                        {task.category ? (
-                          <Chip style={styles.categoryBadge} textStyle={styles.categoryText}>
-                            {task.category}
-                          </Chip>
-                        ) : null}
-                      </View>
-                    </View>
-                    <TouchableOpacity onPress={() => deleteTask(task._id)}>
-                      <MaterialCommunityIcons name="delete" size={24} color="#f44336" />
-                    </TouchableOpacity>
-                  </View>
-
-                  {task.description ? (
-                    <Text style={styles.taskDescription} numberOfLines={2}>
-                      {task.description}
-                    </Text>
-                  ) : null}
-
-                  {task.due_date && (
-                    <View style={styles.dueDateContainer}>
-                      <MaterialCommunityIcons
-                        name="calendar-clock"
-                        size={16}
-                        color={new Date(task.due_date) < new Date() ? '#f44336' : '#666'}
-                      />
-                      <Text
-                        style={[
-                          styles.dueDateText,
-                          new Date(task.due_date) < new Date() && styles.overdue,
-                        ]}
-                      >
-                        {new Date(task.due_date).toLocaleDateString()}
-                      </Text>
-                    </View>
-                  )}
-                </Card.Content>
-              </TouchableOpacity>
-            </Card>
-          ))
-        )}
-      </ScrollView>
-
-      <TouchableOpacity style={styles.fab} onPress={() => openModal()}>
-        <MaterialCommunityIcons name="plus" size={28} color="#fff" />
-      </TouchableOpacity>
-
-      <Modal
-        visible={modalVisible}
-        animationType="slide"
-        transparent={true}
-        onRequestClose={() => setModalVisible(false)}
-      >
-        <View style={styles.modalOverlay}>
-          <ScrollView style={styles.modalScrollView}>
-            <View style={styles.modalContent}>
-              <View style={styles.modalHeader}>
-                <Text style={styles.modalTitle}>
-                  {selectedTask ? 'Edit Task' : 'New Task'}
-                </Text>
-                <TouchableOpacity onPress={() => setModalVisible(false)}>
-                  <MaterialCommunityIcons name="close" size={24} color="#666" />
-                </TouchableOpacity>
-              </View>
-
-              <TextInput
-                style={styles.input}
-                placeholder="Task Title *"
-                value={formData.title}
-                onChangeText={(text) => setFormData({ ...formData, title: text })}
-              />
-
-              <TextInput
-                style={[styles.input, styles.textArea]}
-                placeholder="Description (optional)"
-                value={formData.description}
-                onChangeText={(text) => setFormData({ ...formData, description: text })}
-                multiline
-                numberOfLines={3}
-              />
-
-              <Text style={styles.label}>Priority</Text>
-              <View style={styles.chipsContainer}>
-                {priorities.map((priority) => (
-                  <TouchableOpacity
-                    key={priority}
-                    onPress={() => setFormData({ ...formData, priority })}
-                  >
-                    <Chip
-                      selected={formData.priority === priority}
-                      style={styles.chip}
-                      selectedColor={getPriorityColor(priority)}
-                    >
-                      {priority}
-                    </Chip>
-                  </TouchableOpacity>
-                ))}
-              </View>
-
-              <Text style={styles.label}>Status</Text>
-              <View style={styles.chipsContainer}>
-                {statuses.map((status) => (
-                  <TouchableOpacity
-                    key={status}
-                    onPress={() => setFormData({ ...formData, status })}
-                  >
-                    <Chip
-                      selected={formData.status === status}
-                      style={styles.chip}
-                      selectedColor="#6200ee"
-                    >
-                      {status.replace('_', ' ')}
-                    </Chip>
-                  </TouchableOpacity>
-                ))}
-              </View>
-
-              <Text style={styles.label}>Category</Text>
-              <View style={styles.chipsContainer}>
-                {categories.map((category) => (
-                  <TouchableOpacity
-                    key={category}
-                    onPress={() => setFormData({ ...formData, category })}
-                  >
-                    <Chip
-                      selected={formData.category === category}
-                      style={styles.chip}
-                      selectedColor="#6200ee"
-                    >
-                      {category}
-                    </Chip>
-                  </TouchableOpacity>
-                ))}
-              </View>
-
-              <TouchableOpacity
-                style={styles.dateButton}
-                onPress={() => setShowDueDatePicker(true)}
-              >
-                <MaterialCommunityIcons name="calendar" size={20} color="#666" />
-                <Text style={styles.dateButtonText}>
-                  Due: {formData.due_date.toLocaleDateString()}
-                </Text>
-              </TouchableOpacity>
-
-              {showDueDatePicker && (
-                <DateTimePicker
-                  value={formData.due_date}
-                  mode="date"
-                  display="default"
-                  onChange={(event, selectedDate) => {
-                    setShowDueDatePicker(false);
-                    if (selectedDate) {
-                      setFormData({ ...formData, due_date: selectedDate });
-                    }
-                  }}
-                />
-              )}
-
-              <Button
-                mode="contained"
-                onPress={saveTask}
-                style={styles.saveButton}
-                buttonColor="#6200ee"
-              >
-                {selectedTask ? 'Update Task' : 'Create Task'}
-              </Button>
-            </View>
-          </ScrollView>
-        </View>
-      </Modal>
-    </View>
-  );
-}
-
-const styles = StyleSheet.create({
-  container: {
-    flex: 1,
-    backgroundColor: '#f5f5f5',
-  },
-  scrollView: {
-    flex: 1,
-  },
-  contentContainer: {
-    padding: 16,
-    paddingBottom: 80,
-  },
-  centerContainer: {
-    flex: 1,
-    justifyContent: 'center',
-    alignItems: 'center',
-    backgroundColor: '#f5f5f5',
-  },
-  loadingText: {
-    marginTop: 16,
-    fontSize: 16,
-    color: '#666',
-  },
-  filterContainer: {
-    backgroundColor: '#fff',
-    paddingVertical: 12,
-    paddingHorizontal: 16,
-    borderBottomWidth: 1,
-    borderBottomColor: '#e0e0e0',
-  },
-  filterChip: {
-    marginRight: 8,
-  },
-  emptyContainer: {
-    flex: 1,
-    justifyContent: 'center',
-    alignItems: 'center',
-    paddingTop: 100,
-  },
-  emptyText: {
-    fontSize: 20,
-    fontWeight: '600',
-    color: '#666',
-    marginTop: 16,
-  },
-  emptySubtext: {
-    fontSize: 14,
-    color: '#999',
-    marginTop: 8,
-  },
-  taskCard: {
-    marginBottom: 12,
-    backgroundColor: '#fff',
-    borderRadius: 12,
-    elevation: 2,
-  },
-  taskHeader: {
-    flexDirection: 'row',
-    justifyContent: 'space-between',
-    alignItems: 'flex-start',
-  },
-  taskTitleContainer: {
-    flex: 1,
-    marginRight: 12,
-  },
-  titleRow: {
-    flexDirection: 'row',
-    alignItems: 'center',
-    marginBottom: 8,
-  },
-  taskTitle: {
-    fontSize: 16,
-    fontWeight: 'bold',
-    color: '#1a1a1a',
-    marginLeft: 8,
-    flex: 1,
-  },
-  completedTitle: {
-    textDecorationLine: 'line-through',
-    color: '#999',
-  },
-  badgesRow: {
-    flexDirection: 'row',
-    flexWrap: 'wrap',
-    alignItems: 'center',
-  },
-  priorityBadge: {
-    paddingHorizontal: 10,
-    paddingVertical: 4,
-    borderRadius: 12,
-    marginRight: 8,
-  },
-  priorityText: {
-    fontSize: 11,
-    color: '#fff',
-    fontWeight: 'bold',
-    textTransform: 'uppercase',
-  },
-  categoryBadge: {
-    backgroundColor: '#e3f2fd',
-  },
-  categoryText: {
-    fontSize: 11,
-    color: '#1976d2',
-    fontWeight: '600',
-  },
-  taskDescription: {
-    fontSize: 14,
-    color: '#666',
-    marginTop: 8,
-    lineHeight: 20,
-  },
-  dueDateContainer: {
-    flexDirection: 'row',
-    alignItems: 'center',
-    marginTop: 12,
-    paddingTop: 12,
-    borderTopWidth: 1,
-    borderTopColor: '#e0e0e0',
-  },
-  dueDateText: {
-    fontSize: 13,
-    color: '#666',
-    marginLeft: 6,
-  },
-  overdue: {
-    color: '#f44336',
-    fontWeight: '600',
-  },
-  fab: {
-    position: 'absolute',
-    right: 16,
-    bottom: 16,
-    width: 56,
-    height: 56,
-    borderRadius: 28,
-    backgroundColor: '#6200ee',
-    justifyContent: 'center',
-    alignItems: 'center',
-    elevation: 6,
-  },
-  modalOverlay: {
-    flex: 1,
-    backgroundColor: 'rgba(0, 0, 0, 0.5)',
-  },
-  modalScrollView: {
-    flex: 1,
-  },
-  modalContent: {
-    backgroundColor: '#fff',
-    marginTop: 60,
-    borderTopLeftRadius: 20,
-    borderTopRightRadius: 20,
-    padding: 24,
-    minHeight: '95%',
-  },
-  modalHeader: {
-    flexDirection: 'row',
-    justifyContent: 'space-between',
-    alignItems: 'center',
-    marginBottom: 24,
-  },
-  modalTitle: {
-    fontSize: 20,
-    fontWeight: 'bold',
-    color: '#1a1a1a',
-  },
-  label: {
-    fontSize: 15,
-    fontWeight: '600',
-    color: '#333',
-    marginBottom: 8,
-    marginTop: 8,
-  },
-  input: {
-    borderWidth: 1,
-    borderColor: '#e0e0e0',
-    borderRadius: 8,
-    padding: 12,
-    fontSize: 16,
-    marginBottom: 16,
-    backgroundColor: '#fafafa',
-  },
-  textArea: {
-    height: 80,
-    textAlignVertical: 'top',
-  },
-  chipsContainer: {
-    flexDirection: 'row',
-    flexWrap: 'wrap',
-    marginBottom: 16,
-  },
-  chip: {
-    marginRight: 8,
-    marginBottom: 8,
-  },
-  dateButton: {
-    flexDirection: 'row',
-    alignItems: 'center',
-    borderWidth: 1,
-    borderColor: '#e0e0e0',
-    borderRadius: 8,
-    padding: 12,
-    marginBottom: 16,
-    backgroundColor: '#fafafa',
-  },
-  dateButtonText: {
-    fontSize: 16,
-    color: '#333',
-    marginLeft: 8,
-  },
-  saveButton: {
-    marginTop: 8,
-  },
-});
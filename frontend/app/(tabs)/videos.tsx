@@ -15,6 +15,7 @@ import {
 import { MaterialCommunityIcons } from '@expo/vector-icons';
 import { Card, Button, ProgressBar } from 'react-native-paper';
 import DateTimePicker from '@react-native-community/datetimepicker';
+import { fetchAllPages } from '../../utils/api';
 
 const BACKEND_URL = process.env.EXPO_PUBLIC_BACKEND_URL;
 
@@ -49,8 +50,7 @@ export default function VideosScreen() {
 
   const fetchVideos = async () => {
     try {
-      const response = await fetch(`${BACKEND_URL}/api/videos`);
-      const data = await response.json();
+      const data = await fetchAllPages<Video>('/api/videos');
       setVideos(data);
     } catch (error) {
       console.error('Error fetching videos:', error);
@@ -13,6 +13,7 @@ import {
 import { MaterialCommunityIcons } from '@expo/vector-icons';
 import { Card, Button, Chip } from 'react-native-paper';
 import DateTimePicker from '@react-native-community/datetimepicker';
+import { fetchAllPages } from '../../utils/api';
 
 const BACKEND_URL = process.env.EXPO_PUBLIC_BACKEND_URL;
 
@@ -42,12 +43,11 @@ export default function AnalyticsScreen() {
 
   const fetchAnalytics = async () => {
     try {
-      const [perfRes, topRes] = await Promise.all([
-        fetch(`${BACKEND_URL}/api/performance`),
+      const [perfData, topRes] = await Promise.all([
+        fetchAllPages<any>('/api/performance'),
         fetch(`${BACKEND_URL}/api/performance/analytics/top-content`),
       ]);
       
-      const perfData = await perfRes.json();
       const topData = await topRes.json();
       
       setPerformances(perfData);
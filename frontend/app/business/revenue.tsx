@@ -13,6 +13,7 @@ import {
 import { MaterialCommunityIcons } from '@expo/vector-icons';
 import { Card, Button, Chip } from 'react-native-paper';
 import DateTimePicker from '@react-native-community/datetimepicker';
+import { fetchAllPages } from '../../utils/api';
 
 const BACKEND_URL = process.env.EXPO_PUBLIC_BACKEND_URL;
 
@@ -42,13 +43,12 @@ export default function RevenueScreen() {
 
   const fetchRevenues = async () => {
     try {
-      const [revenuesRes, monthlyRes, categoryRes] = await Promise.all([
-        fetch(`${BACKEND_URL}/api/revenue`),
+      const [revenuesData, monthlyRes, categoryRes] = await Promise.all([
+        fetchAllPages<any>('/api/revenue'),
         fetch(`${BACKEND_URL}/api/revenue/summary/monthly`),
         fetch(`${BACKEND_URL}/api/revenue/summary/category`),
       ]);
       
-      const revenuesData = await revenuesRes.json();
       const monthlyDataRes = await monthlyRes.json();
       const categoryDataRes = await categoryRes.json();
       
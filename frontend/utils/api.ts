@@ -0,0 +1,27 @@
+const BACKEND_URL = process.env.EXPO_PUBLIC_BACKEND_URL;
+
+// Largest page the collection list endpoints serve (MAX_PAGE_SIZE in backend/pagination.py)
+const PAGE_SIZE = 500;
+
+interface Page<T> {
+  items: T[];
+  next_cursor: string | null;
+}
+
+// Fetch every item of a paginated list endpoint, following next_cursor page by page
+export async function fetchAllPages<T>(path: string): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+  do {
+    const params = new URLSearchParams({ limit: String(PAGE_SIZE) });
+    if (cursor) params.set('after', cursor);
+    const response = await fetch(`${BACKEND_URL}${path}?${params}`);
+    if (!response.ok) {
+      throw new Error(`GET ${path} failed with ${response.status}`);
+    }
+    const page: Page<T> = await response.json();
+    items.push(...page.items);
+    cursor = page.next_cursor;
+  } while (cursor);
+  return items;
+}
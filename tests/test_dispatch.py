@@ -0,0 +1,64 @@
+import asyncio
+from datetime import datetime
+
+from dispatch import DispatchQueue, compute_due_at, with_dispatch_fields
+from scheduler import PostScheduler
+
+
+def test_due_at_is_naive_utc_for_offset_dates():
+    # 10:00 on Jan 2 in India, even though 01:00 on Jan 2 there is still Jan 1 in UTC
+    due_at = compute_due_at(datetime.fromisoformat("2024-01-02T01:00:00+05:30"), "10:00")
+    assert due_at == datetime(2024, 1, 2, 4, 30)
+    assert due_at.tzinfo is None
+
+
+def test_naive_dates_use_the_configured_timezone(monkeypatch):
+    monkeypatch.setenv("SCHEDULE_TIMEZONE", "Asia/Kolkata")
+    # Stored as 2024-01-01T20:00Z, which is already Jan 2 in India
+    assert compute_due_at(datetime(2024, 1, 1, 20, 0), "10:00") == datetime(2024, 1, 2, 4, 30)
+
+
+def test_time_change_keeps_the_offset_the_date_was_sent_with():
+    post = with_dispatch_fields({"scheduled_time": "10:00",
+                                 "scheduled_date": datetime.fromisoformat("2024-01-02T01:00:00+05:30")})
+    assert post["schedule_timezone"] == "+05:30"
+    # An update's after-image has the naive UTC date read back from MongoDB
+    after = with_dispatch_fields({**post, "scheduled_date": datetime(2024, 1, 1, 19, 30), "scheduled_time": "11:00"})
+    assert after["due_at"] == datetime(2024, 1, 2, 5, 30)
+
+
+def test_queue_orders_offset_and_naive_posts_together(db):
+    queue = DispatchQueue(db.scheduled_posts)
+    aware = with_dispatch_fields({"_id": 1, "status": "scheduled", "scheduled_time": "09:00",
+                                  "scheduled_date": datetime.fromisoformat("2024-01-01T00:00:00Z")})
+    naive = with_dispatch_fields({"_id": 2, "status": "scheduled", "scheduled_time": "08:00",
+                                  "scheduled_date": datetime(2024, 1, 1)})
+    queue.push(aware)
+    queue.push(naive)
+    assert queue.pop_due(datetime(2024, 1, 1, 12, 0), 10) == [2, 1]
+
+
+def test_post_scheduled_with_z_timestamp_is_drained(db):
+    now = datetime(2024, 1, 1, 12, 0)
+    published = []
+
+    async def publish(post):
+        published.append(post["_id"])
+        return {"platform_post_id": "p1"}
+
+    async def run():
+        scheduler = PostScheduler(db, publish=publish, clock=lambda: now)
+        await scheduler.queue.refill()
+        post = with_dispatch_fields({
+            "topic": "Z post", "caption": "", "platform": "instagram", "status": "scheduled",
+            "priority": "medium", "scheduled_time": "09:30",
+            "scheduled_date": datetime.fromisoformat("2024-01-01T00:00:00Z"),
+        })
+        await db.scheduled_posts.insert_one(post)
+        scheduler.enqueue(post)
+        counts = await scheduler.drain()
+        return post, counts
+
+    post, counts = asyncio.run(run())
+    assert counts["posted"] == 1
+    assert published == [post["_id"]]
@@ -0,0 +1,60 @@
+import asyncio
+import csv
+import io
+import json
+from typing import Optional
+
+import httpx
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from crud import Resource, crud_router
+
+
+class Connection(BaseModel):
+    account_name: str
+    access_token: str
+    refresh_token: Optional[str] = None
+
+
+class ConnectionUpdate(BaseModel):
+    account_name: Optional[str] = None
+
+
+def mask_tokens(conn: dict) -> dict:
+    conn["access_token"] = conn["access_token"][:4] + "..."
+    conn["refresh_token"] = "***"
+    return conn
+
+
+def export(db, export_format: str) -> str:
+    app = FastAPI()
+    app.include_router(crud_router(
+        Resource("connections", "connections", Connection, ConnectionUpdate, label="Connection",
+                 list_transform=mask_tokens),
+        lambda: db,
+    ))
+
+    async def run():
+        await db.connections.insert_one({"account_name": "pharma", "access_token": "secret-access-token",
+                                         "refresh_token": "secret-refresh-token"})
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/connections/export", params={"format": export_format})
+            response.raise_for_status()
+            return response.text
+
+    return asyncio.run(run())
+
+
+def test_ndjson_export_applies_list_transform(db):
+    [row] = [json.loads(line) for line in export(db, "ndjson").splitlines()]
+    assert row["access_token"] == "secr..."
+    assert row["refresh_token"] == "***"
+
+
+def test_csv_export_applies_list_transform(db):
+    body = export(db, "csv")
+    assert "secret" not in body
+    [row] = csv.DictReader(io.StringIO(body))
+    assert (row["access_token"], row["refresh_token"]) == ("secr...", "***")
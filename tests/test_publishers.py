@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from publishers import DeadLetterError, FakePublisher, PublishError, PublisherPool, RateLimit
+
+POST = {"_id": "p1", "platform": "instagram"}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class MaxJitter:
+    """Always draws the top of the backoff range, so delays are predictable"""
+
+    def uniform(self, low: float, high: float) -> float:
+        return high
+
+
+class FlakyPublisher(FakePublisher):
+    """Fails its first `failures` attempts with a retryable error"""
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+
+    async def publish(self, post: dict):
+        if self.attempts < self.failures:
+            self.attempts += 1
+            raise PublishError("platform unavailable")
+        return await super().publish(post)
+
+
+def make_pool(publisher, clock, **kwargs) -> PublisherPool:
+    # A burst big enough that the token bucket never waits, unless a test says otherwise
+    limits = kwargs.pop("limits", {"*": RateLimit(rate=1.0, burst=100, workers=2)})
+    return PublisherPool({"*": publisher}, limits=limits, clock=clock, sleep=clock.sleep,
+                         rng=MaxJitter(), **kwargs)
+
+
+def test_transient_failures_are_retried_with_exponential_backoff():
+    clock, publisher = FakeClock(), FlakyPublisher(failures=3)
+    pool = make_pool(publisher, clock, backoff_base=2.0)
+
+    result = asyncio.run(pool.publish(POST))
+
+    assert result["platform_post_id"].startswith("fake_")
+    assert publisher.attempts == 4
+    assert clock.sleeps == [2.0, 4.0, 8.0]
+
+
+def test_backoff_is_capped():
+    clock = FakeClock()
+    pool = make_pool(FlakyPublisher(failures=4), clock, backoff_base=2.0, backoff_max=5.0)
+
+    asyncio.run(pool.publish(POST))
+
+    assert clock.sleeps == [2.0, 4.0, 5.0, 5.0]
+
+
+def test_post_is_dead_lettered_once_retries_are_exhausted():
+    clock, publisher = FakeClock(), FakePublisher(failure_rate=1.0)
+    pool = make_pool(publisher, clock, max_attempts=5, backoff_base=1.0)
+
+    with pytest.raises(DeadLetterError) as raised:
+        asyncio.run(pool.publish(POST))
+
+    assert raised.value.attempts == 5
+    assert not raised.value.retryable
+    assert publisher.attempts == 5
+    # No backoff after the last attempt
+    assert clock.sleeps == [1.0, 2.0, 4.0, 8.0]
+
+
+def test_non_retryable_error_fails_without_retrying():
+    clock, publisher = FakeClock(), FakePublisher(failure_rate=1.0, retryable=False)
+    pool = make_pool(publisher, clock)
+
+    with pytest.raises(PublishError) as raised:
+        asyncio.run(pool.publish(POST))
+
+    assert not isinstance(raised.value, DeadLetterError)
+    assert publisher.attempts == 1
+    assert clock.sleeps == []
+
+
+def test_token_bucket_paces_publishes_to_the_platform_rate():
+    clock, publisher = FakeClock(), FakePublisher()
+    pool = make_pool(publisher, clock, limits={"*": RateLimit(rate=0.5, burst=2, workers=1)})
+
+    async def run():
+        for _ in range(4):
+            await pool.publish(POST)
+
+    asyncio.run(run())
+
+    # The burst goes out at once, then one publish every 1 / rate seconds
+    assert len(publisher.published) == 4
+    assert clock.sleeps == [2.0, 2.0]
+    assert clock.now == 4.0
@@ -0,0 +1,51 @@
+import asyncio
+from datetime import datetime
+
+from recurrence import anchor_update, generate_due_tasks, next_occurrence, parse_rule, with_anchor_day
+
+
+def test_monthly_series_keeps_its_anchor_day_after_clamping():
+    rule = parse_rule("monthly", "")
+    occurrence, series = datetime(2024, 1, 31, 9, 0), []
+    for _ in range(4):
+        occurrence = next_occurrence(rule, occurrence, anchor_day=31)
+        series.append(occurrence)
+    assert series == [datetime(2024, 2, 29, 9, 0), datetime(2024, 3, 31, 9, 0),
+                      datetime(2024, 4, 30, 9, 0), datetime(2024, 5, 31, 9, 0)]
+
+
+def test_month_end_template_generates_month_end_tasks(db):
+    template = with_anchor_day({"title": "Close the books", "frequency": "monthly", "frequency_detail": "",
+                                "is_active": True, "next_due_date": datetime(2024, 1, 31, 9, 0)})
+
+    async def run():
+        template_id = (await db.recurring_tasks.insert_one(template)).inserted_id
+        # One run per month, so every advance starts from the previous (clamped) occurrence
+        for now in (datetime(2024, 2, 1), datetime(2024, 3, 1), datetime(2024, 4, 1), datetime(2024, 5, 1)):
+            await generate_due_tasks(db, now)
+        tasks = await db.tasks.find({}, {"due_date": 1}).sort("due_date", 1).to_list(None)
+        assert [task["due_date"].day for task in tasks] == [31, 29, 31, 30]
+        stored = await db.recurring_tasks.find_one({"_id": template_id})
+        assert stored["next_due_date"] == datetime(2024, 5, 31, 9, 0)
+
+    asyncio.run(run())
+
+
+def test_anchor_day_is_kept_for_templates_created_without_one(db):
+    async def run():
+        await db.recurring_tasks.insert_one({"title": "Old", "frequency": "monthly", "is_active": True,
+                                             "next_due_date": datetime(2024, 1, 30)})
+        await generate_due_tasks(db, datetime(2024, 2, 1))
+        await generate_due_tasks(db, datetime(2024, 3, 1))
+        stored = await db.recurring_tasks.find_one({})
+        assert stored["anchor_day"] == 30
+        assert stored["next_due_date"] == datetime(2024, 3, 30)
+
+    asyncio.run(run())
+
+
+def test_editing_next_due_date_re_anchors_the_series():
+    update = anchor_update({"next_due_date": datetime.fromisoformat("2024-03-31T22:00:00-05:00")})
+    assert update == {"$set": {"next_due_date": datetime.fromisoformat("2024-03-31T22:00:00-05:00"),
+                               "anchor_day": 1}}
+    assert anchor_update({"title": "Renamed"}) == {"$set": {"title": "Renamed"}}
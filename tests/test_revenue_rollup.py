@@ -0,0 +1,122 @@
+import asyncio
+from datetime import datetime
+from typing import Optional
+
+from bson import ObjectId
+from pydantic import BaseModel
+from pymongo import ReturnDocument
+
+from bulk import BulkRequest, run_bulk
+from crud import Resource
+from rollups import ROLLUP_COLLECTION, apply_revenue_changes
+
+
+class Revenue(BaseModel):
+    amount: float
+    payment_status: str = "Pending"
+    payment_date: datetime
+
+
+class RevenueUpdate(BaseModel):
+    amount: Optional[float] = None
+    payment_status: Optional[str] = None
+    payment_date: Optional[datetime] = None
+
+
+async def rollup(db) -> dict:
+    return {doc["_id"]: doc async for doc in db[ROLLUP_COLLECTION].find({"count": {"$gt": 0}})}
+
+
+def revenue_resource(db) -> Resource:
+    async def sync_rollup(changes):
+        await apply_revenue_changes(db, changes)
+
+    return Resource("revenue", "revenue", Revenue, RevenueUpdate, label="Revenue record",
+                    after_write=sync_rollup)
+
+
+class RacingCollection:
+    """Runs `race` (another writer's edit) right before the first write of a bulk request"""
+
+    def __init__(self, collection, race):
+        self.collection = collection
+        self.race = race
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+    async def _race_once(self):
+        race, self.race = self.race, None
+        if race:
+            await race()
+
+    async def find_one_and_update(self, *args, **kwargs):
+        await self._race_once()
+        return await self.collection.find_one_and_update(*args, **kwargs)
+
+    async def bulk_write(self, *args, **kwargs):
+        await self._race_once()
+        return await self.collection.bulk_write(*args, **kwargs)
+
+
+def test_offset_payment_date_is_bucketed_by_utc_month(db):
+    # 01:00 on Feb 1 in India is still January in UTC, where the rebuild puts it
+    payment_date = datetime.fromisoformat("2024-02-01T01:00:00+05:30")
+
+    async def run():
+        await apply_revenue_changes(db, [(None, {"amount": 100, "payment_date": payment_date})])
+        assert list(await rollup(db)) == ["2024-01"]
+        # Deleting it later hands over the naive UTC date read back from MongoDB
+        stored = {"amount": 100, "payment_date": datetime(2024, 1, 31, 19, 30)}
+        await apply_revenue_changes(db, [(stored, None)])
+        assert await rollup(db) == {}
+
+    asyncio.run(run())
+
+
+def test_bulk_update_uses_before_image_from_the_write(db):
+    resource = revenue_resource(db)
+
+    async def run():
+        doc = {"amount": 100, "payment_status": "Pending", "payment_date": datetime(2024, 1, 15)}
+        oid = (await db.revenue.insert_one(doc)).inserted_id
+        await apply_revenue_changes(db, [(None, doc)])
+
+        async def concurrent_edit():
+            # Another request's single-item update lands after the bulk request started
+            before = await db.revenue.find_one_and_update(
+                {"_id": oid}, {"$set": {"amount": 500}}, return_document=ReturnDocument.BEFORE)
+            await apply_revenue_changes(db, [(before, {**before, "amount": 500})])
+
+        racing_db = {"revenue": RacingCollection(db.revenue, concurrent_edit)}
+        request = BulkRequest(update=[{"id": str(oid), "data": {"amount": 200}}])
+        result = await run_bulk(racing_db, resource, request)
+        assert result["counts"]["updated"] == 1
+        assert (await rollup(db))["2024-01"]["total_pending"] == 200
+
+    asyncio.run(run())
+
+
+def test_bulk_updates_and_deletes_keep_rollup_in_step(db):
+    resource = revenue_resource(db)
+
+    async def run():
+        created = await run_bulk(db, resource, BulkRequest(create=[
+            {"amount": 100, "payment_date": "2024-01-10T00:00:00"},
+            {"amount": 50, "payment_date": "2024-02-10T00:00:00", "payment_status": "Received"},
+        ]))
+        first, second = (r["_id"] for r in created["results"])
+        result = await run_bulk(db, resource, BulkRequest(
+            update=[
+                {"id": first, "data": {"amount": 120}},
+                {"id": first, "data": {"payment_status": "Received"}},
+                {"id": str(ObjectId()), "data": {"amount": 1}},
+            ],
+            delete=[second, second],
+        ))
+        assert result["counts"] == {"created": 0, "updated": 2, "deleted": 1, "failed": 2}
+        assert await rollup(db) == {
+            "2024-01": {"_id": "2024-01", "month": "2024-01", "total_received": 120, "total_pending": 0, "count": 1},
+        }
+
+    asyncio.run(run())
@@ -0,0 +1,109 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from dispatch import with_dispatch_fields
+from scheduler import PostScheduler
+
+LEASE = timedelta(seconds=300)
+
+
+class FakeClock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    async def sleep(self, seconds: float):
+        self.now += timedelta(seconds=seconds)
+        await asyncio.sleep(0)
+
+
+async def schedule_post(db) -> dict:
+    post = with_dispatch_fields({
+        "topic": "Launch", "caption": "", "platform": "instagram", "status": "scheduled",
+        "priority": "medium", "scheduled_date": datetime(2024, 1, 1), "scheduled_time": "09:00",
+    })
+    post["_id"] = (await db.scheduled_posts.insert_one(post)).inserted_id
+    return post
+
+
+async def published(post):
+    return {"platform_post_id": f"p_{post['_id']}"}
+
+
+def test_expired_lease_is_released_to_another_worker(db):
+    clock = FakeClock(datetime(2024, 1, 1, 12, 0))
+
+    async def run():
+        await schedule_post(db)
+        crashed = PostScheduler(db, publish=published, clock=clock, owner="a")
+        other = PostScheduler(db, publish=published, clock=clock, owner="b")
+        [post] = await crashed.claim_batch()
+        assert post["lease_expires_at"] == clock.now + LEASE
+
+        # Still leased: the other worker leaves it alone
+        clock.now += LEASE - timedelta(seconds=1)
+        assert await other.drain() == {"posted": 0, "failed": 0, "dead_letter": 0, "released": 0}
+
+        clock.now += timedelta(seconds=2)
+        assert await other.drain() == {"posted": 1, "failed": 0, "dead_letter": 0, "released": 1}
+        # The original owner's late completion is rejected by the lease guard
+        assert await crashed.complete(post, "failed", error="late") is False
+        stored = await db.scheduled_posts.find_one({"_id": post["_id"]})
+        assert stored["status"] == "posted"
+        assert await db.posting_logs.count_documents({}) == 1
+
+    asyncio.run(run())
+
+
+def test_lease_is_renewed_while_a_slow_publish_runs(db):
+    clock = FakeClock(datetime(2024, 1, 1, 12, 0))
+    released = []
+
+    async def run():
+        post = await schedule_post(db)
+        other = PostScheduler(db, publish=published, clock=clock, owner="b")
+
+        async def slow_publish(post):
+            # Rate-limit waits and retry backoff keep the publish going past the first lease
+            deadline = clock.now + 2 * LEASE
+            while clock.now < deadline:
+                await asyncio.sleep(0)
+            released.append(await other.release_expired())
+            return await published(post)
+
+        scheduler = PostScheduler(db, publish=slow_publish, clock=clock, owner="a", sleep=clock.sleep)
+        assert (await scheduler.drain())["posted"] == 1
+        assert released == [0]
+        stored = await db.scheduled_posts.find_one({"_id": post["_id"]})
+        assert stored["status"] == "posted"
+
+    asyncio.run(run())
+
+
+def test_post_in_backoff_does_not_hold_up_the_posts_behind_it(db):
+    clock = FakeClock(datetime(2024, 1, 1, 12, 0))
+    order = []
+
+    async def run():
+        posts = [await schedule_post(db) for _ in range(4)]
+        stalled_id = posts[0]["_id"]
+        others_done = asyncio.Event()
+
+        async def publish(post):
+            if post["_id"] == stalled_id:
+                # Retrying with backoff until every other post has gone out
+                await others_done.wait()
+            order.append(post["_id"])
+            if len(order) == 3:
+                others_done.set()
+            return await published(post)
+
+        # Two slots and the stalled post claimed first: the other three share the second slot
+        scheduler = PostScheduler(db, publish=publish, clock=clock, batch_size=2, concurrency=2)
+        counts = await asyncio.wait_for(scheduler.drain(), timeout=5)
+        assert counts["posted"] == 4
+        assert order[-1] == stalled_id
+
+    asyncio.run(run())
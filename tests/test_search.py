@@ -0,0 +1,73 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from search import IdeaSearchIndex
+from sync import record_deletes
+
+
+async def seed_ideas(db) -> list:
+    now = datetime.utcnow()
+    ideas = [
+        {"title": "Pharmacology reel", "content": "", "tags": ["reels"], "category": "", "updated_date": now},
+        {"title": "Pharmacology exam notes", "content": "", "tags": ["exam"], "category": "", "updated_date": now},
+    ]
+    await db.ideas.insert_many(ideas)
+    return [idea["_id"] for idea in ideas]
+
+
+def test_refresh_drops_ideas_deleted_by_another_worker(db):
+    index = IdeaSearchIndex(refresh_interval=0)
+
+    async def run():
+        reel, exam = await seed_ideas(db)
+        await index.rebuild(db.ideas)
+        assert index.search("pharm")[1] == 2
+
+        # Another worker's delete: the document and its tombstone, no after_write here
+        await db.ideas.delete_one({"_id": reel})
+        await record_deletes(db, "ideas", [reel])
+        await index.refresh(db.ideas)
+
+        ids, total, facets = index.search("pharm")
+        assert ids == [str(exam)]
+        assert total == 1
+        assert facets == {"exam": 1}
+
+    asyncio.run(run())
+
+
+def test_refresh_rereads_tombstones_stamped_just_before_the_last_read(db):
+    index = IdeaSearchIndex(refresh_interval=0)
+
+    async def run():
+        reel, _ = await seed_ideas(db)
+        await index.rebuild(db.ideas)
+        await index.refresh(db.ideas)
+        # Stamped before that refresh read the tombstones but committed after it
+        await db.ideas.delete_one({"_id": reel})
+        await record_deletes(db, "ideas", [reel], datetime.utcnow() - timedelta(seconds=1))
+        await index.refresh(db.ideas)
+        assert index.search("reel")[1] == 0
+        assert len(index) == 1
+
+    asyncio.run(run())
+
+
+def test_local_write_does_not_hide_an_earlier_write_from_another_worker(db):
+    worker_a, worker_b = IdeaSearchIndex(refresh_interval=0), IdeaSearchIndex(refresh_interval=0)
+
+    async def write(index, title: str, updated_date: datetime):
+        idea = {"title": title, "content": "", "tags": [], "category": "", "updated_date": updated_date}
+        await db.ideas.insert_one(idea)
+        index.add(idea)  # the writer's after_write
+
+    async def run():
+        await worker_a.rebuild(db.ideas)
+        await worker_b.rebuild(db.ideas)
+        now = datetime.utcnow()
+        await write(worker_b, "vaccine reel", now)
+        await write(worker_a, "exam notes", now + timedelta(milliseconds=5))
+        await worker_a.refresh(db.ideas)
+        assert worker_a.search("vaccine")[1] == 1
+
+    asyncio.run(run())
@@ -0,0 +1,14 @@
+import os
+import subprocess
+import sys
+
+from tests.conftest import BACKEND_DIR
+
+
+def test_server_imports_without_database_config():
+    # A fresh interpreter, like a new worker: importing the app must not need MONGO_URL / DB_NAME
+    env = {key: value for key, value in os.environ.items() if key not in ("MONGO_URL", "DB_NAME")}
+    code = "import deps, server; assert deps.get_database.cache_info().currsize == 0"
+    result = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_DIR, env=env,
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr